@@ -1,5 +1,5 @@
-from .client import StorageClient
+from .client import StorageClient, WriteHandler
 from .file_mode import FileMode
 from .layer import Layer
 
-__all__ = ["StorageClient", "FileMode", "Layer"]
+__all__ = ["StorageClient", "FileMode", "Layer", "WriteHandler"]
@@ -1,16 +1,64 @@
 import logging
+import weakref
 from abc import ABC, abstractmethod
-from functools import cached_property, singledispatchmethod
-from typing import Any
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import IO, TYPE_CHECKING, Any, ClassVar
 
-import s3fs  # type: ignore
+from .file_mode import FileMode
+
+if TYPE_CHECKING:
+    import s3fs  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+WriteHandler = Callable[[Any, Any], None]
+
+# Directories created through each file system, see `_known_dirs`
+_KNOWN_DIRS: weakref.WeakKeyDictionary[Any, set[str]] = weakref.WeakKeyDictionary()
+
+# Writers found through a base class of the data, keyed by the storage
+# client class and the data class, see `StorageClient._inherited_writer`
+_INHERITED_WRITERS: dict[tuple[type, type], WriteHandler] = {}
+
+
+@lru_cache(maxsize=16)
+def _get_s3fs(  # type: ignore[no-any-unimported]
+    endpoint_url: str | None, block_size: int, max_pool_connections: int
+) -> "s3fs.S3FileSystem":
+    """Return the process-wide S3 file system for an endpoint.
+
+    Storage clients that target the same endpoint share one file system,
+    and with it one connection pool, instead of opening their own.
+
+    Args:
+        endpoint_url (str | None): The S3 endpoint URL, or None for the
+            default AWS endpoint.
+        block_size (int): The default block size for file objects.
+        max_pool_connections (int): The size of the connection pool.
+
+    Returns:
+        s3fs.S3FileSystem: The shared S3 file system object.
+    """
+    import s3fs
+
+    return s3fs.S3FileSystem(
+        endpoint_url=endpoint_url,
+        default_block_size=block_size,
+        default_fill_cache=False,
+        config_kwargs={"max_pool_connections": max_pool_connections},
+    )
+
 
 class StorageClient(ABC):
-    chunk_size: int = 1024
+    # Size of each read and write of a streamed copy. Writes this large
+    # go past the file object's buffer, so the buffer is left at default.
+    chunk_size: int = 32 * 1024 * 1024
     encoding: str = "utf-8"
+    max_pool_connections: int = 64
+    endpoint_url: str | None = None
+    _writers: ClassVar[dict[type, WriteHandler]] = {}
 
     @property
     def base_path(self) -> str:
@@ -21,18 +69,95 @@ class StorageClient(ABC):
         """
         return "s3://"
 
-    @cached_property
-    def s3(self) -> s3fs.S3FileSystem:  # type: ignore
-        """Create an S3 file system object.
+    @property
+    def s3(self) -> "s3fs.S3FileSystem":  # type: ignore
+        """Get the S3 file system object.
+
+        The file system is shared by every storage client using the same
+        endpoint and chunk size, which is its default block size. `s3fs`
+        is imported on first use so that importing the storage clients
+        stays cheap.
 
         Returns:
             s3fs.S3FileSystem: The S3 file system object.
         """
-        return s3fs.S3FileSystem()
+        return _get_s3fs(self.endpoint_url, self.chunk_size, self.max_pool_connections)
+
+    @property
+    def _known_dirs(self) -> set[str]:
+        """Directories already known to exist in storage.
+
+        The set is shared by every storage client using the same file
+        system, so a folder is created once per process rather than
+        once per client.
+
+        Returns:
+            set[str]: The set of directory paths.
+        """
+        s3 = self.s3
+        known_dirs = _KNOWN_DIRS.get(s3)
+        if known_dirs is None:
+            known_dirs = _KNOWN_DIRS.setdefault(s3, set())
+
+        return known_dirs
 
     def _make_dirs(self, path: str) -> None:
-        if not self.s3.exists(path):
-            self.s3.mkdir(path)
+        """Create a directory in storage if it does not exist yet.
+
+        Creation is idempotent, so no existence check is issued first.
+        Paths already created through the same file system are skipped
+        without a round-trip to storage.
+
+        Args:
+            path (str): The directory path to create.
+        """
+        if path in self._known_dirs:
+            return
+        self.s3.makedirs(path, exist_ok=True)
+        self._known_dirs.add(path)
+
+    def _open(self, path: str, mode: str) -> IO[Any]:
+        """Open a file in storage.
+
+        Files opened for writing are uploaded while they are written: a
+        multipart upload is started once the first block is full, and
+        every full block is sent as a part. Memory use stays bounded by
+        the block size, and nothing is staged on local disk.
+
+        Args:
+            path (str): The path of the file in storage.
+            mode (str): The mode to open the file in.
+
+        Returns:
+            IO[Any]: The file object.
+        """
+        return self.s3.open(path, mode)  # type: ignore[no-any-return]
+
+    @contextmanager
+    def _upload(self, path: str) -> Iterator[IO[Any]]:
+        """Open a file in storage for writing, discarding it on error.
+
+        The file is committed when the block exits normally. If the block
+        raises, the upload is discarded instead of closed: a multipart
+        upload already started is aborted, and nothing, partial or not,
+        is written at `path`.
+
+        Args:
+            path (str): The path of the file in storage.
+
+        Yields:
+            IO[Any]: The file object.
+        """
+        with self._open(path, FileMode.WRITING_BINARY) as f:
+            try:
+                yield f
+            except BaseException:
+                try:
+                    f.discard()  # type: ignore[attr-defined]
+                finally:
+                    # Closing the discarded file would upload its last block
+                    f.closed = True  # type: ignore[misc]
+                raise
 
     @abstractmethod
     def get_folder(self, *args: Any, **kwargs: Any) -> str:
@@ -56,13 +181,51 @@ class StorageClient(ABC):
         """
         ...
 
-    @singledispatchmethod
+    @classmethod
+    def _inherited_writer(cls, data_type: type) -> WriteHandler | None:
+        """Find the writer registered for a base class of a data class.
+
+        The result is cached per storage client class and data class, so
+        the base classes are searched once, and no class's `_writers` is
+        changed.
+
+        Args:
+            data_type (type): The class of the data to write.
+
+        Returns:
+            WriteHandler | None: The writer of the closest base class
+                with one, or None if there is none.
+        """
+        key = (cls, data_type)
+        writer = _INHERITED_WRITERS.get(key)
+        if writer is None:
+            writer = next(
+                (
+                    cls._writers[base]
+                    for base in data_type.__mro__[1:]
+                    if base in cls._writers
+                ),
+                None,
+            )
+            if writer is not None:
+                _INHERITED_WRITERS[key] = writer
+
+        return writer
+
     def write(self, data: Any) -> None:
         """Write data to storage.
 
+        The writer is looked up in `_writers` by the class of the data,
+        falling back to the writers registered for its base classes.
+
         Args:
             data (Any): The data to write.
         Raises:
             NotImplementedError: If the data type is not supported.
         """
-        raise NotImplementedError(f"Write not implemented for type {type(data)}")
+        data_type = data.__class__
+        writer = self._writers.get(data_type) or self._inherited_writer(data_type)
+        if writer is None:
+            raise NotImplementedError(f"Write not implemented for type {type(data)}")
+
+        writer(self, data)
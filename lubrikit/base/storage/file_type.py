@@ -1,7 +1,7 @@
 from enum import Enum
 
 
-class FileType(str, Enum):
+class FileType(Enum):
     """File types supported by the project for reading and writing."""
 
     ACCESS = "mdb"
@@ -4,7 +4,7 @@ import os
 from enum import Enum
 
 
-class Layer(str, Enum):
+class Layer(Enum):
     """Data Lake layers enumerated.
 
     Attributes:
@@ -28,38 +28,44 @@ class Layer(str, Enum):
 
     @property
     def bucket(self) -> str:
-        """Returns the bucket name for the layer."""
-        env_var = f"AWS_{self.name.upper()}_BUCKET"
-        return os.getenv(env_var, self.value)
+        """Returns the bucket name for the layer.
+
+        The environment variable is read on first access and cached for
+        the lifetime of the process.
+        """
+        try:
+            return _BUCKET_CACHE[self]
+        except KeyError:
+            env_var = f"AWS_{self.name.upper()}_BUCKET"
+            bucket = _BUCKET_CACHE[self] = os.getenv(env_var, self.value)
+            return bucket
 
     @property
     def next(self) -> Layer:
         """Returns the next layer in the data pipeline."""
-        if self == Layer.LANDING:
-            return Layer.STAGING
-        elif self == Layer.STAGING:
-            return Layer.BRONZE
-        elif self == Layer.BRONZE:
-            return Layer.SILVER
-        elif self == Layer.SILVER:
-            return Layer.GOLD
-        elif self == Layer.GOLD:
-            return Layer.PRESENTATION
-        else:
-            raise ValueError(f"Invalid layer: {self}")
+        try:
+            return _NEXT_LAYER[self]
+        except KeyError:
+            raise ValueError(f"Invalid layer: {self}") from None
 
     @property
     def previous(self) -> Layer:
         """Returns the previous layer in the data pipeline."""
-        if self == Layer.STAGING:
-            return Layer.LANDING
-        elif self == Layer.BRONZE:
-            return Layer.STAGING
-        elif self == Layer.SILVER:
-            return Layer.BRONZE
-        elif self == Layer.GOLD:
-            return Layer.SILVER
-        elif self == Layer.PRESENTATION:
-            return Layer.GOLD
-        else:
-            raise ValueError(f"Invalid layer: {self}")
+        try:
+            return _PREVIOUS_LAYER[self]
+        except KeyError:
+            raise ValueError(f"Invalid layer: {self}") from None
+
+
+# Bucket names resolved from the environment, filled on first access
+_BUCKET_CACHE: dict[Layer, str] = {}
+
+# Static layer ordering, resolved with a single dict lookup per access
+_NEXT_LAYER: dict[Layer, Layer] = {
+    Layer.LANDING: Layer.STAGING,
+    Layer.STAGING: Layer.BRONZE,
+    Layer.BRONZE: Layer.SILVER,
+    Layer.SILVER: Layer.GOLD,
+    Layer.GOLD: Layer.PRESENTATION,
+}
+_PREVIOUS_LAYER: dict[Layer, Layer] = {v: k for k, v in _NEXT_LAYER.items()}
@@ -1,3 +1,23 @@
-from .connectors import GoogleDriveAPIConnector, HTTPConnector
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["HTTPConnector", "GoogleDriveAPIConnector"]
+from .connectors import HTTPConnector
+
+if TYPE_CHECKING:
+    from .connectors import AsyncHTTPConnector, GoogleDriveAPIConnector
+
+__all__ = ["AsyncHTTPConnector", "HTTPConnector", "GoogleDriveAPIConnector"]
+
+
+def __getattr__(name: str) -> Any:
+    # Defer to the lazy export of the connectors package
+    if name == "GoogleDriveAPIConnector":
+        from .connectors import GoogleDriveAPIConnector
+
+        return GoogleDriveAPIConnector
+
+    if name == "AsyncHTTPConnector":
+        from .connectors import AsyncHTTPConnector
+
+        return AsyncHTTPConnector
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
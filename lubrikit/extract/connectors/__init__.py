@@ -1,5 +1,31 @@
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseConnector
-from .google_drive_api import GoogleDriveAPIConnector
 from .http_connector import HTTPConnector
 
-__all__ = ["BaseConnector", "HTTPConnector", "GoogleDriveAPIConnector"]
+if TYPE_CHECKING:
+    from .async_http_connector import AsyncHTTPConnector
+    from .google_drive_api import GoogleDriveAPIConnector
+
+__all__ = [
+    "AsyncHTTPConnector",
+    "BaseConnector",
+    "HTTPConnector",
+    "GoogleDriveAPIConnector",
+]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the Google client libraries only when the connector is used
+    if name == "GoogleDriveAPIConnector":
+        from .google_drive_api import GoogleDriveAPIConnector
+
+        return GoogleDriveAPIConnector
+
+    # Import the optional httpx dependency only when the connector is used
+    if name == "AsyncHTTPConnector":
+        from .async_http_connector import AsyncHTTPConnector
+
+        return AsyncHTTPConnector
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
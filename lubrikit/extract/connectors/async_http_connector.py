@@ -0,0 +1,202 @@
+import asyncio
+import logging
+import weakref
+from collections.abc import Callable, Coroutine
+from functools import cached_property
+from typing import Any
+
+import httpx
+from requests.structures import CaseInsensitiveDict
+
+from lubrikit.extract.connectors.base import COMPRESSION_HEADERS
+from lubrikit.extract.connectors.http_connector import HTTPConnector, orjson
+
+logger = logging.getLogger(__name__)
+
+# One client per event loop: an `httpx.AsyncClient` is bound to the loop
+# its connections were opened in and cannot be reused after it closes.
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _default_client() -> httpx.AsyncClient:
+    """Get the HTTP/2 client shared by async connectors on this loop.
+
+    HTTP/2 multiplexes concurrent requests to the same host over a
+    single connection, so awaiting many downloads at once does not open
+    a connection per request. Retries are left to the connector's retry
+    logic. The client stays open until
+    `AsyncHTTPConnector.aclose_client` is awaited on the loop.
+
+    Returns:
+        httpx.AsyncClient: The client of the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            http2=True,
+            headers=COMPRESSION_HEADERS,
+            limits=httpx.Limits(max_connections=128, max_keepalive_connections=64),
+        )
+        _clients[loop] = client
+
+    return client
+
+
+class AsyncHTTPConnector(HTTPConnector):
+    """HTTP connector with native async checks and downloads.
+
+    `acheck` and `adownload` send requests with a shared HTTP/2
+    `httpx.AsyncClient` instead of running the blocking `requests` calls
+    in worker threads, so many connectors can be awaited concurrently
+    on one event loop. `check` and `download` behave like
+    `HTTPConnector`'s.
+
+    The client is shared by every async connector on the event loop, so
+    it is not closed by any one connector. Await `aclose_client` once
+    all of them are done, e.g. at the end of the coroutine passed to
+    `asyncio.run`.
+
+    Requires the `httpx` extra: `pip install lubrikit[httpx]`.
+
+    Attributes:
+        retriable_exceptions (tuple[type[Exception], ...]): (class
+            attribute) The `HTTPConnector` exceptions, plus `httpx`
+            transport errors and HTTP status errors.
+    """
+
+    # Tuple of exception types that should trigger retry logic
+    retriable_exceptions: tuple[type[Exception], ...] = (
+        *HTTPConnector.retriable_exceptions,
+        httpx.TransportError,  # Connection, timeout, and protocol errors
+        httpx.HTTPStatusError,  # HTTP 4xx/5xx status code errors
+    )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled HTTP/2 client used to send async requests.
+
+        Returns:
+            httpx.AsyncClient: The client shared by async connectors on
+                the running event loop.
+        """
+        return _default_client()
+
+    @classmethod
+    async def aclose_client(cls) -> None:
+        """Close the HTTP client shared on the running event loop.
+
+        Releases the pooled connections of the client. A later request
+        on the same loop opens a new client.
+        """
+        client = _clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    @cached_property
+    def _acheck_with_retry(self) -> Callable[[], Coroutine[Any, Any, Any]]:
+        """The `_acheck` method wrapped with the retry decorator."""
+        return self._retry(self._acheck)  # type: ignore[no-any-return]
+
+    @cached_property
+    def _adownload_with_retry(self) -> Callable[[], Coroutine[Any, Any, Any]]:
+        """The `_adownload` method wrapped with the retry decorator."""
+        return self._retry(self._adownload)  # type: ignore[no-any-return]
+
+    async def acheck(self) -> Any:
+        """Check the HTTP resource on the running event loop.
+
+        Returns:
+            Any: A dictionary containing the updated headers cache
+                if the check is successful, otherwise None.
+        """
+        return await self._acheck_with_retry()
+
+    async def adownload(self) -> Any:
+        """Download the HTTP resource on the running event loop.
+
+        Returns:
+            Any: A tuple containing the updated headers cache and the
+                `httpx.Response` if there is new content.
+        """
+        return await self._adownload_with_retry()
+
+    async def _arequest(self) -> httpx.Response:
+        """Send the configured HTTP request with the async client.
+
+        Only one request body is sent, chosen as `requests` does: form
+        `data` if it is set, otherwise `json_data`, serialized with
+        `orjson` when installed. A JSON body gets a JSON content type
+        unless the extra headers set one.
+
+        Returns:
+            httpx.Response: The HTTP response object, with its body read.
+        """
+        body: dict[str, Any] = {}
+        json_data = self.config.json_data
+        headers = CaseInsensitiveDict(self._request_headers())
+
+        if self.config.data:
+            body["data"] = self.config.data
+        elif json_data is not None and orjson is not None:
+            body["content"] = orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS)
+            headers.setdefault("Content-Type", "application/json")
+        elif json_data is not None:
+            body["json"] = json_data
+
+        return await self.client.request(
+            method=self.config.method,
+            url=self.config.url,
+            params=self.config.params,
+            headers=headers,
+            timeout=self.retry_config.timeout,
+            **body,
+        )
+
+    async def _acheck(self) -> dict[str, Any] | None:
+        """Check the HTTP resource without keeping its content.
+
+        Returns:
+            dict[str, Any]: A dictionary containing the updated headers cache.
+        """
+        logger.info(f"Checking {self.config.method} {self.config.url}...")
+
+        r = await self._arequest()
+
+        if not r.is_error:
+            return self._prepare_cache(r)  # type: ignore[arg-type]
+        else:
+            logger.error(f"Check failed: {r.status_code} {r.reason_phrase}")
+            return None
+
+    async def _adownload(self) -> tuple[dict[str, Any] | None, httpx.Response | None]:
+        """Download the HTTP resource with the async client.
+
+        Returns:
+            tuple[dict[str, Any], httpx.Response | None]: A tuple
+                containing the updated headers cache and the response
+                object if the request was successful, otherwise None.
+        """
+        logger.info(f"Downloading {self.config.method} {self.config.url}...")
+
+        r = await self._arequest()
+        new_headers = self._prepare_cache(r)  # type: ignore[arg-type]
+
+        # Check for failure first
+        if r.is_error:
+            logger.error(f"Request failed: {r.status_code} {r.reason_phrase}")
+            return None, None
+
+        # If resource unchanged (only for successful responses)
+        if r.status_code == 304 or self._is_unchanged(new_headers):
+            logger.info(
+                f"Response: {r.status_code} {r.reason_phrase}. "
+                "No new version. Skipping download."
+            )
+            return new_headers, None
+
+        # Successful response with new content
+        logger.info(f"Response: {r.status_code} {r.reason_phrase}")
+        return new_headers, r
@@ -1,34 +1,50 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from functools import cached_property
+from typing import Any
 
-from lubrikit.utils.retry import RetryConfig, retry_with_backoff
+import requests
+from pydantic import BaseModel
+
+from lubrikit.utils.retry import RetryConfig, get_retry_config, retry_with_backoff
+
+# Default headers advertising compressed responses. Google APIs only
+# compress responses for user agents that contain "gzip".
+COMPRESSION_HEADERS: dict[str, str] = {
+    "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING,
+    "User-Agent": "lubrikit (gzip)",
+}
 
 
 class BaseConnector(ABC):
+    # Model validating the connector configuration, if the connector has one
+    config_model: type[BaseModel] | None = None
+
+    # Exception types that trigger retry logic, shared by all instances
+    retriable_exceptions: tuple[type[Exception], ...] = ()
+
     def __init__(
         self,
         headers_cache: dict[str, str] | None = None,
-        retry_config: dict[str, Any] | None = None,
+        retry_config: dict[str, Any] | RetryConfig | None = None,
         *args: Any,
         **kwargs: Any,
     ) -> None:
         self.headers_cache: dict[str, str] = headers_cache or {}
-        self.retry_config = (
-            RetryConfig(**retry_config) if retry_config else RetryConfig()
-        )
+        self.retry_config: RetryConfig = get_retry_config(retry_config)
 
-        if TYPE_CHECKING:
-            self.retriable_exceptions: tuple[type[Exception], ...] = ()
+    @cached_property
+    def _retry(self) -> Callable:
+        """Retry decorator built once from the instance configuration.
 
-    def check(self) -> Any:
-        """Check the HTTP resource without downloading it.
+        Built lazily so that `retriable_exceptions` may also be set on
+        the instance after calling `super().__init__()`.
 
         Returns:
-            Any: A dictionary containing the updated headers cache
-                if the check is successful, otherwise None.
+            Callable: A decorator adding retry logic with backoff.
         """
-        # Create a retry decorator with instance configuration
-        retry_decorator = retry_with_backoff(
+        return retry_with_backoff(
             max_retries=self.retry_config.max_retries,
             base_delay=self.retry_config.base_delay,
             max_delay=self.retry_config.max_delay,
@@ -36,7 +52,24 @@ class BaseConnector(ABC):
             retriable_exceptions=self.retriable_exceptions,
         )
 
-        return retry_decorator(self._check)()
+    @cached_property
+    def _check_with_retry(self) -> Callable[[], dict[str, Any] | None]:
+        """The `_check` method wrapped with the retry decorator."""
+        return self._retry(self._check)  # type: ignore[no-any-return]
+
+    @cached_property
+    def _download_with_retry(self) -> Callable[[], tuple[dict[str, Any] | None, Any]]:
+        """The `_download` method wrapped with the retry decorator."""
+        return self._retry(self._download)  # type: ignore[no-any-return]
+
+    def check(self) -> Any:
+        """Check the HTTP resource without downloading it.
+
+        Returns:
+            Any: A dictionary containing the updated headers cache
+                if the check is successful, otherwise None.
+        """
+        return self._check_with_retry()
 
     def download(self) -> Any:
         """Perform an HTTP request with caching and retries.
@@ -45,16 +78,47 @@ class BaseConnector(ABC):
             Any: The response data if the request is successful,
                 otherwise None.
         """
-        # Create a retry decorator with instance configuration
-        retry_decorator = retry_with_backoff(
-            max_retries=self.retry_config.max_retries,
-            base_delay=self.retry_config.base_delay,
-            max_delay=self.retry_config.max_delay,
-            backoff_factor=self.retry_config.backoff_factor,
-            retriable_exceptions=self.retriable_exceptions,
-        )
+        return self._download_with_retry()
+
+    async def acheck(self) -> Any:
+        """Check the resource without blocking the event loop.
+
+        The retried check runs in a worker thread, so checks for many
+        connectors can be awaited concurrently (e.g. `asyncio.gather`).
+
+        Returns:
+            Any: A dictionary containing the updated headers cache
+                if the check is successful, otherwise None.
+        """
+        return await asyncio.to_thread(self.check)
+
+    async def adownload(self) -> Any:
+        """Download the resource without blocking the event loop.
+
+        The retried download runs in a worker thread, so downloads for
+        many connectors can be awaited concurrently (e.g.
+        `asyncio.gather`).
 
-        return retry_decorator(self._download)()
+        Returns:
+            Any: The response data if the request is successful,
+                otherwise None.
+        """
+        return await asyncio.to_thread(self.download)
+
+    def _is_unchanged(self, new_headers: dict[str, str]) -> bool:
+        """Check whether the fresh cache headers match the cached ones.
+
+        Only the keys present in `new_headers` are compared. The subset
+        test on the items views runs in C, without building a generator.
+
+        Args:
+            new_headers (dict[str, str]): The cache headers derived from
+                the latest response.
+
+        Returns:
+            bool: True if every new header equals its cached value.
+        """
+        return new_headers.items() <= self.headers_cache.items()
 
     @abstractmethod
     def _check(self) -> dict[str, Any] | None:
@@ -1,4 +1,16 @@
-from .google_drive_api import GoogleDriveAPIConfig, GoogleDriveAPIServiceAccountInfo
-from .http_config import HTTPConfig
+from .google_drive_api import (
+    GOOGLE_DRIVE_API_CONFIG_LIST,
+    GoogleDriveAPIConfig,
+    GoogleDriveAPIFileMetadata,
+    GoogleDriveAPIServiceAccountInfo,
+)
+from .http_config import HTTP_CONFIG_LIST, HTTPConfig
 
-__all__ = ["GoogleDriveAPIConfig", "GoogleDriveAPIServiceAccountInfo", "HTTPConfig"]
+__all__ = [
+    "GOOGLE_DRIVE_API_CONFIG_LIST",
+    "GoogleDriveAPIConfig",
+    "GoogleDriveAPIFileMetadata",
+    "GoogleDriveAPIServiceAccountInfo",
+    "HTTP_CONFIG_LIST",
+    "HTTPConfig",
+]
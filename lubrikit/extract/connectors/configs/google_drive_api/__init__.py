@@ -1,4 +1,10 @@
-from .google_drive_api import GoogleDriveAPIConfig
+from .file_metadata import GoogleDriveAPIFileMetadata
+from .google_drive_api import GOOGLE_DRIVE_API_CONFIG_LIST, GoogleDriveAPIConfig
 from .service_account import GoogleDriveAPIServiceAccountInfo
 
-__all__ = ["GoogleDriveAPIConfig", "GoogleDriveAPIServiceAccountInfo"]
+__all__ = [
+    "GOOGLE_DRIVE_API_CONFIG_LIST",
+    "GoogleDriveAPIConfig",
+    "GoogleDriveAPIFileMetadata",
+    "GoogleDriveAPIServiceAccountInfo",
+]
@@ -0,0 +1,37 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class GoogleDriveAPIFileMetadata(BaseModel):
+    """Metadata of a Google Drive file, as returned by `files.get`.
+
+    The response is parsed once, so the connector's properties and its
+    cache headers read typed fields instead of converting strings on
+    every access.
+
+    Attributes:
+        name (str): The name of the file.
+            Default: ""
+        size (int | None): The size of the file in bytes. None for
+            Google Workspace documents, which have no stored size.
+            Default: None
+        modified_time (str): When the file was last modified, as an
+            RFC 3339 datetime string. Read from the `modifiedTime` field.
+            Default: ""
+
+    Example:
+        >>> metadata = GoogleDriveAPIFileMetadata.model_validate(
+        ...     {"name": "data.csv", "size": "1024", "modifiedTime": "2023-08-12"}
+        ... )
+        >>> metadata.size
+        1024
+    """
+
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+    name: str = Field(default="", description="The name of the file.")
+    size: int | None = Field(default=None, description="The size of the file in bytes.")
+    modified_time: str = Field(
+        default="",
+        alias="modifiedTime",
+        description="When the file was last modified.",
+    )
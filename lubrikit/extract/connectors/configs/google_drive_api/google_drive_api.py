@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class GoogleDriveAPIConfig(BaseModel):
@@ -19,6 +21,15 @@ class GoogleDriveAPIConfig(BaseModel):
             file when downloading or exporting it. If not specified, the
             default MIME type will be used.
             Examples: "text/csv", "application/pdf"
+        stream (bool): Whether to download the file with a single
+            streamed HTTP request instead of a chunked
+            `MediaIoBaseDownload`. Streaming avoids buffering the whole
+            file in memory before it is written to storage.
+            Default: False
+        chunk_size (int): The number of bytes fetched by each request
+            of a chunked `MediaIoBaseDownload`. Larger chunks need fewer
+            round trips per file.
+            Default: 100 MiB
 
     Example:
         >>> config = GoogleDriveAPIConfig(
@@ -28,9 +39,45 @@ class GoogleDriveAPIConfig(BaseModel):
         1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms
     """
 
+    # Configurations are shared between pipelines and connectors, so they
+    # are immutable and never revalidated after construction
+    model_config = ConfigDict(frozen=True)
+
     fileId: str = Field(
         min_length=1,
         description="The unique identifier of the Google Drive file to access. "
         "Found in the Google Drive URL when viewing a file.",
     )
     mimeType: str | None = Field(default=None, description="The MIME type of the file.")
+    stream: bool = Field(
+        default=False,
+        description="Download the file with a single streamed HTTP request.",
+    )
+    chunk_size: int = Field(
+        default=100 * 1024 * 1024,
+        gt=0,
+        description="Bytes fetched per request of a chunked download.",
+    )
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "GoogleDriveAPIConfig":
+        """Build a configuration from already validated data.
+
+        Skips Pydantic validation, so it must only be used with data
+        that was previously produced by `model_dump` or otherwise
+        validated, such as a stored pipeline manifest.
+
+        Args:
+            data (dict[str, Any]): The trusted configuration values.
+
+        Returns:
+            GoogleDriveAPIConfig: The configuration, with defaults applied to
+                missing fields.
+        """
+        return cls.model_construct(**data)
+
+
+# Validates a whole manifest of Google Drive configurations in a single call
+GOOGLE_DRIVE_API_CONFIG_LIST: TypeAdapter[list[GoogleDriveAPIConfig]] = TypeAdapter(
+    list[GoogleDriveAPIConfig]
+)
@@ -78,7 +78,8 @@ class GoogleDriveAPIServiceAccountInfo(BaseSettings):
         my-project-123456
     """
 
-    model_config = SettingsConfigDict(env_prefix="GOOGLE_")
+    # Frozen, so the credentials built from an account can be cached by it
+    model_config = SettingsConfigDict(env_prefix="GOOGLE_", frozen=True)
 
     type: str
     project_id: str
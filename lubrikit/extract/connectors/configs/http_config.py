@@ -1,6 +1,6 @@
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class HTTPConfig(BaseModel):
@@ -56,6 +56,10 @@ class HTTPConfig(BaseModel):
         ... )
     """
 
+    # Configurations are shared between pipelines and connectors, so they
+    # are immutable and never revalidated after construction
+    model_config = ConfigDict(frozen=True)
+
     method: Literal["GET", "POST"] = Field(
         description="HTTP method to use for the request. Must be 'GET' or 'POST'."
     )
@@ -87,3 +91,25 @@ class HTTPConfig(BaseModel):
         description="Optional additional headers to include in the HTTP request. "
         "These are merged with default headers.",
     )
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "HTTPConfig":
+        """Build a configuration from already validated data.
+
+        Skips Pydantic validation, so it must only be used with data
+        that was previously produced by `model_dump` or otherwise
+        validated, such as a stored pipeline manifest.
+
+        Args:
+            data (dict[str, Any]): The trusted configuration values.
+
+        Returns:
+            HTTPConfig: The configuration, with defaults applied to
+                missing fields.
+        """
+        return cls.model_construct(**data)
+
+
+# Validates a whole manifest of HTTP configurations in a single call:
+# HTTP_CONFIG_LIST.validate_python([{"method": "GET", "url": ...}, ...])
+HTTP_CONFIG_LIST: TypeAdapter[list[HTTPConfig]] = TypeAdapter(list[HTTPConfig])
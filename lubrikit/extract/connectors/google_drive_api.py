@@ -1,24 +1,109 @@
 import io
 import logging
-from functools import cached_property
+from functools import cache, cached_property, lru_cache
 from typing import Any
 
 from google.auth.exceptions import RefreshError, TransportError
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import Resource, build
 from googleapiclient.errors import Error as GoogleAPIError
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.http import HttpRequest, MediaIoBaseDownload, build_http
+from requests import RequestException, Response
 
-from lubrikit.extract.connectors.base import BaseConnector
+from lubrikit.extract.connectors.base import COMPRESSION_HEADERS, BaseConnector
 from lubrikit.extract.connectors.configs import (
     GoogleDriveAPIConfig,
+    GoogleDriveAPIFileMetadata,
     GoogleDriveAPIServiceAccountInfo,
 )
+from lubrikit.utils.retry import RetryConfig
 
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _default_service_account_info() -> GoogleDriveAPIServiceAccountInfo:
+    """Load the service account info from environment variables once.
+
+    Returns:
+        GoogleDriveAPIServiceAccountInfo: The service account info shared
+            by every connector created without explicit credentials.
+    """
+    logger.info("Loading Google Drive service account info from environment variables")
+    return GoogleDriveAPIServiceAccountInfo()
+
+
+@lru_cache(maxsize=16)
+def _scoped_credentials(
+    info: GoogleDriveAPIServiceAccountInfo, scopes: tuple[str, ...]
+) -> service_account.Credentials:
+    """Build scoped service account credentials once per account.
+
+    Parsing the private key and building the signer is the expensive
+    part of credential creation, so connectors sharing an account also
+    share its credentials (and their access token).
+
+    Args:
+        info (GoogleDriveAPIServiceAccountInfo): The service account
+            info. It is frozen, so it can key the cache directly.
+        scopes (tuple[str, ...]): The OAuth2 scopes to request.
+
+    Returns:
+        service_account.Credentials: The scoped credentials.
+    """
+    credentials = service_account.Credentials.from_service_account_info(
+        info=info.model_dump()
+    )
+    return credentials.with_scopes(list(scopes))  # type: ignore[no-any-return]
+
+
+def _build_request(http: AuthorizedHttp, *args: Any, **kwargs: Any) -> HttpRequest:
+    """Build a Drive API request with its own HTTP transport.
+
+    `httplib2.Http` is not thread-safe, so each request gets a fresh
+    transport authorized with the client's credentials. The transport
+    is built by `build_http`, so it keeps the default socket timeout of
+    the Google API client. This makes a
+    shared `Resource` safe to use from several threads, including
+    downloads that are created in one thread and consumed in another.
+
+    Args:
+        http (AuthorizedHttp): The authorized transport of the client.
+        *args (Any): Positional arguments for `HttpRequest`.
+        **kwargs (Any): Keyword arguments for `HttpRequest`.
+
+    Returns:
+        HttpRequest: The request bound to its own transport.
+    """
+    request_http = AuthorizedHttp(http.credentials, http=build_http())
+    return HttpRequest(request_http, *args, **kwargs)  # type: ignore[no-any-return]
+
+
+@lru_cache(maxsize=16)
+def _drive_client(credentials: service_account.Credentials) -> Resource:
+    """Build the Drive API client shared by connectors with the same credentials.
+
+    Args:
+        credentials (service_account.Credentials): The scoped credentials.
+
+    Returns:
+        Resource: A Google API client resource.
+    """
+    client = build(
+        GoogleDriveAPIConnector.api_name,
+        GoogleDriveAPIConnector.api_version,
+        credentials=credentials,
+        requestBuilder=_build_request,
+        static_discovery=True,
+    )
+    logger.info("Google Drive API client connected")
+
+    return client  # type: ignore[no-any-return]
+
+
 class GoogleDriveAPIConnector(BaseConnector):
     """Connector for Google Drive API.
 
@@ -35,20 +120,25 @@ class GoogleDriveAPIConnector(BaseConnector):
         client (Resource | None): Google API client resource for making
             Drive API calls. Initialized to None and set during
             connection establishment.
-        config (dict[str, Any]): Configuration object containing the
-            Google Drive file ID and other connection parameters. If
+        config (GoogleDriveAPIConfig): Configuration object containing
+            the Google Drive file ID and other connection parameters. If
             downloading a Google Workspace document (Google Docs,
             Google Sheets, etc.), the `mimeType` field can be set to
-            specify the desired export format.
+            specify the desired export format. Either a validated
+            `GoogleDriveAPIConfig` or a dictionary to validate.
+        config_model (type[GoogleDriveAPIConfig]): (class attribute) The
+            model used to validate the configuration.
         headers_cache (dict[str, str]): Cache for file metadata headers
             like file name, last modified time, and content length. Used
             to determine if the file has changed since the last download.
-        retriable_exceptions (tuple[type[Exception], ...]): Tuple of
-            exception types that should trigger retry logic. Includes
-            HTTP errors, authentication failures, and network issues.
-        retry_config (RetryConfig | None): Configuration for retry
-            behavior when encountering retriable exceptions. If None,
-            default retry behavior is used.
+        retriable_exceptions (tuple[type[Exception], ...]): (class
+            attribute) Tuple of exception types that should trigger
+            retry logic. Includes HTTP errors, authentication failures,
+            and network issues.
+        retry_config (dict[str, Any] | RetryConfig | None): Configuration
+            for retry behavior when encountering retriable exceptions,
+            as values or a validated `RetryConfig`. If None, default
+            retry behavior is used.
         scopes (list[str]): (class attribute) The OAuth2 scopes required
             for Google Drive access. Contains
             ["https://www.googleapis.com/auth/drive"] for full Drive
@@ -265,12 +355,24 @@ class GoogleDriveAPIConnector(BaseConnector):
     api_name: str = "drive"  # Google API service name for Drive API
     api_version: str = "v3"  # Google Drive API version
     scopes = ["https://www.googleapis.com/auth/drive"]  # OAuth2 scopes for Drive access
+    config_model = GoogleDriveAPIConfig  # Model validating the connector configuration
+
+    # Tuple of exception types that should trigger retry logic
+    retriable_exceptions = (
+        HttpError,  # HTTP errors from Google API (rate limits, server errors)
+        RefreshError,  # Authentication token refresh failures
+        TransportError,  # Network/transport layer errors
+        GoogleAPIError,  # Base Google API errors
+        ConnectionError,  # Network connection issues
+        TimeoutError,  # Request timeout errors
+        RequestException,  # HTTP, connection and timeout errors of streamed downloads
+    )
 
     def __init__(
         self,
         headers_cache: dict[str, str] | None = None,
-        retry_config: dict[str, Any] | None = None,
-        config: dict[str, Any] | None = None,
+        retry_config: dict[str, Any] | RetryConfig | None = None,
+        config: dict[str, Any] | GoogleDriveAPIConfig | None = None,
         service_account_info: GoogleDriveAPIServiceAccountInfo | None = None,
     ):
         if not config:
@@ -279,90 +381,112 @@ class GoogleDriveAPIConnector(BaseConnector):
         super().__init__(headers_cache, retry_config)
 
         # Configuration object containing file ID and connection parameters
-        self.config = GoogleDriveAPIConfig(**config)
+        self.config = GoogleDriveAPIConfig.model_validate(config)
 
         # Service account credentials for Google Cloud authentication
-        self.service_account_info: GoogleDriveAPIServiceAccountInfo
-        if service_account_info:
-            self.service_account_info = service_account_info
-        else:
-            logger.info(
-                "Loading Google Drive service account info from environment variables"
-            )
-            self.service_account_info = GoogleDriveAPIServiceAccountInfo()
-
-        # Tuple of exception types that should trigger retry logic
-        self.retriable_exceptions = (
-            HttpError,  # HTTP errors from Google API (rate limits, server errors)
-            RefreshError,  # Authentication token refresh failures
-            TransportError,  # Network/transport layer errors
-            GoogleAPIError,  # Base Google API errors
-            ConnectionError,  # Network connection issues
-            TimeoutError,  # Request timeout errors
+        self.service_account_info: GoogleDriveAPIServiceAccountInfo = (
+            service_account_info or _default_service_account_info()
+        )
+
+    @cached_property
+    def credentials(self) -> service_account.Credentials:
+        """Scoped service account credentials for the Google Drive API.
+
+        Returns:
+            service_account.Credentials: The scoped credentials.
+        """
+        return _scoped_credentials(
+            self.service_account_info, tuple(GoogleDriveAPIConnector.scopes)
         )
 
     @cached_property
     def client(self) -> Resource:
         """A client that communicates to the Google Drive API.
 
+        The client is built from the bundled discovery document and is
+        shared by every connector with the same credentials. Each request
+        it creates uses its own HTTP transport, so it is thread-safe.
+
         Returns:
             Resource: A Google API client resource.
         """
-        credentials = service_account.Credentials.from_service_account_info(
-            info=self.service_account_info.model_dump()
-        )
-        scoped_credentials = credentials.with_scopes(GoogleDriveAPIConnector.scopes)
+        return _drive_client(self.credentials)
 
-        client = build(
-            GoogleDriveAPIConnector.api_name,
-            GoogleDriveAPIConnector.api_version,
-            credentials=scoped_credentials,
-        )
-        logger.info("Google Drive API client connected")
+    @cached_property
+    def session(self) -> AuthorizedSession:
+        """An authorized HTTP session for streaming file content.
 
-        return client  # type: ignore[no-any-return]
+        The session refreshes the access token of the service account
+        credentials on demand and asks for compressed responses. It is
+        released by `close`.
+
+        Returns:
+            AuthorizedSession: A `requests.Session` authorized with the
+                connector's credentials.
+        """
+        session = AuthorizedSession(self.credentials)
+        session.headers.update(COMPRESSION_HEADERS)
+
+        return session
+
+    def close(self) -> None:
+        """Close the streaming session of this connector, if it was opened.
+
+        Call it once the streamed responses of the connector have been
+        written. A later streamed download opens a new session.
+        """
+        session = self.__dict__.pop("session", None)
+        if session is not None:
+            session.close()
 
     @cached_property
-    def content_length(self) -> int:
-        """Get the content length of the file in Google Drive.
+    def _metadata(self) -> GoogleDriveAPIFileMetadata:
+        """Fetch the file metadata from Google Drive in a single request.
+
+        The metadata is fetched lazily, once per connector. Pipelines
+        build a new connector for every run, so each run compares the
+        cached headers with fresh metadata. Delete the attribute
+        (`del connector._metadata`) to fetch it again on a long-lived
+        connector.
 
         Returns:
-            int: Content length of the file.
+            GoogleDriveAPIFileMetadata: The file's name, size, and
+                modified time.
         """
-        return int(
+        response = (
             self.client.files()  # type: ignore[attr-defined]
-            .get(fileId=self.config.fileId, fields="size")
+            .get(fileId=self.config.fileId, fields="name,size,modifiedTime")
             .execute()
-            .get("size")
         )
+        return GoogleDriveAPIFileMetadata.model_validate(response)
 
-    @cached_property
+    @property
+    def content_length(self) -> int | None:
+        """Get the content length of the file in Google Drive.
+
+        Returns:
+            int | None: Content length of the file, or None for Google
+                Workspace documents, which have no stored size.
+        """
+        return self._metadata.size
+
+    @property
     def file_name(self) -> str:
         """Get the name of the file in Google Drive.
 
         Returns:
             str: Name of the file.
         """
-        return str(
-            self.client.files()  # type: ignore[attr-defined]
-            .get(fileId=self.config.fileId, fields="name")
-            .execute()
-            .get("name")
-        )
+        return self._metadata.name
 
-    @cached_property
+    @property
     def last_modified_at(self) -> str:
         """When the file was updated in Google Drive.
 
         Returns:
             str: Datetime string for when the data source file was updated.
         """
-        return str(
-            self.client.files()  # type: ignore[attr-defined]
-            .get(fileId=self.config.fileId, fields="modifiedTime")
-            .execute()
-            .get("modifiedTime", "")
-        )
+        return self._metadata.modified_time
 
     @cached_property
     def supported_mime_types(self) -> list[str]:
@@ -404,25 +528,30 @@ class GoogleDriveAPIConnector(BaseConnector):
         self._validate_mime_type()
         return self._prepare_cache()
 
-    def _download(self) -> tuple[dict[str, Any] | None, MediaIoBaseDownload | None]:
+    def _download(
+        self,
+    ) -> tuple[dict[str, Any] | None, MediaIoBaseDownload | Response | None]:
         """Download the Google Drive file.
 
         Returns:
-            tuple[dict[str, Any] | None, MediaIoBaseDownload]: A tuple
-                containing the file metadata and the download stream.
+            tuple[dict[str, Any] | None, MediaIoBaseDownload | Response]:
+                A tuple containing the file metadata and the download
+                stream. The stream is a streamed `Response` when
+                `config.stream` is set.
         """
         logger.info(f"Downloading {self.file_name} from Google Drive...")
         self._validate_mime_type()
         new_headers = self._prepare_cache()
 
         # If resource unchanged
-        if all(
-            self.headers_cache.get(k) == new_headers.get(k) for k in new_headers.keys()
-        ):
+        if self._is_unchanged(new_headers):
             logger.info("No new version. Skipping download.")
             return new_headers, None
 
         # If resource changed, prepare to download
+        if self.config.stream:
+            return new_headers, self._stream_media()
+
         if self.config.mimeType is None:
             request_func = self.client.files().get_media  # type: ignore[attr-defined]
             request = request_func(fileId=self.config.fileId)
@@ -433,20 +562,52 @@ class GoogleDriveAPIConnector(BaseConnector):
             )
 
         fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request)
+        downloader = MediaIoBaseDownload(fh, request, chunksize=self.config.chunk_size)
 
         return new_headers, downloader
 
+    def _stream_media(self) -> Response:
+        """Request the file content as a single streamed HTTP response.
+
+        Uses the `alt=media` endpoint for binary files and the `export`
+        endpoint when a MIME type is configured. The API host is in the
+        universe domain of the credentials, as for the API client.
+
+        Returns:
+            Response: The streamed response. The body is not read until
+                the response is consumed.
+        """
+        url = (
+            f"https://www.{self.credentials.universe_domain}/"
+            f"{GoogleDriveAPIConnector.api_name}/"
+            f"{GoogleDriveAPIConnector.api_version}/files/{self.config.fileId}"
+        )
+        if self.config.mimeType is None:
+            params = {"alt": "media"}
+        else:
+            url = f"{url}/export"
+            params = {"mimeType": self.config.mimeType}
+
+        response = self.session.get(
+            url, params=params, stream=True, timeout=self.retry_config.timeout
+        )
+        response.raise_for_status()
+
+        return response
+
     def _prepare_cache(self) -> dict[str, str]:
         """Prepare cache metadata from the Google Drive file.
 
         Returns:
             dict[str, str]: A dictionary containing cache metadata.
         """
+        metadata = self._metadata
+
         cache: dict[str, str] = {
-            "file_name": self.file_name,
-            "last_modified": self.last_modified_at or "",
-            "content_length": str(self.content_length) if self.content_length else "",
+            "file_name": metadata.name,
+            "last_modified": metadata.modified_time,
+            # Empty files are cached without a length, like files without a size
+            "content_length": str(metadata.size) if metadata.size else "",
         }
 
         return cache
@@ -1,15 +1,140 @@
 import logging
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.response import BaseHTTPResponse
+from urllib3.util import Retry
 
-from lubrikit.extract.connectors.base import BaseConnector
+from lubrikit.extract.connectors.base import COMPRESSION_HEADERS, BaseConnector
 from lubrikit.extract.connectors.configs import HTTPConfig
+from lubrikit.utils.retry import RetryConfig
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
 
+# Transient statuses retried by the session, honoring Retry-After
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Maximum number of shared sessions, one per distinct retry setting
+MAX_SESSIONS = 16
+
+_sessions: OrderedDict[tuple[int, float, float], requests.Session] = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+class _CappedRetry(Retry):
+    """Retry policy that waits at most `backoff_max` for `Retry-After`.
+
+    urllib3 sleeps for as long as a server's `Retry-After` header asks,
+    regardless of `backoff_max`, which could block a worker thread for an
+    unbounded time.
+    """
+
+    def get_retry_after(self, response: BaseHTTPResponse) -> float | None:
+        """Get the value of Retry-After in seconds, capped at `backoff_max`.
+
+        Args:
+            response (BaseHTTPResponse): The response to retry.
+
+        Returns:
+            float | None: The time to wait, or None without the header.
+        """
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+
+        return min(retry_after, self.backoff_max)
+
+
+def _build_session(
+    max_retries: int, base_delay: float, max_delay: float
+) -> requests.Session:
+    """Build an HTTP session for the given retry settings.
+
+    The session keeps connections alive between requests, so checks and
+    downloads against the same host reuse TCP and TLS connections, and
+    asks for compressed responses.
+
+    Responses with a transient status (see `RETRY_STATUSES`) are retried
+    by urllib3 on the pooled connection, waiting for the `Retry-After`
+    header (at most `max_delay`) or an exponential backoff. Connection
+    and read errors are left to the connector's retry logic.
+
+    Args:
+        max_retries (int): Maximum number of retries per request.
+        base_delay (float): Backoff factor between retries in seconds.
+        max_delay (float): Maximum delay between retries in seconds.
+
+    Returns:
+        requests.Session: The new session.
+    """
+    retry = _CappedRetry(
+        total=max_retries,
+        connect=0,
+        read=0,
+        other=0,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+        backoff_factor=base_delay,
+        backoff_max=max_delay,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=128, pool_maxsize=128, pool_block=True, max_retries=retry
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    session.headers.update(COMPRESSION_HEADERS)
+
+    return session
+
+
+def _default_session(
+    max_retries: int = 0, base_delay: float = 0.0, max_delay: float = 0.0
+) -> requests.Session:
+    """Get the HTTP session shared by HTTP connectors.
+
+    One session is shared by every connector with the same retry
+    settings. At most `MAX_SESSIONS` sessions are kept; the least
+    recently used one is dropped when another is needed. It is not
+    closed, since a connector may still be using it, and its
+    connections are released once it is garbage collected.
+
+    Args:
+        max_retries (int): Maximum number of retries per request.
+        base_delay (float): Backoff factor between retries in seconds.
+        max_delay (float): Maximum delay between retries in seconds.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    key = (max_retries, base_delay, max_delay)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is not None:
+            _sessions.move_to_end(key)
+            return session
+
+        session = _sessions[key] = _build_session(*key)
+        if len(_sessions) > MAX_SESSIONS:
+            _sessions.popitem(last=False)
+
+    return session
+
+
 class HTTPConnector(BaseConnector):
     """Connector for making HTTP requests with retry logic and caching.
 
@@ -18,26 +143,46 @@ class HTTPConnector(BaseConnector):
     error handling. It supports various data formats including form
     data, JSON, and query parameters.
 
+    Requests are sent with a pooled, keep-alive `requests.Session` over
+    HTTP/1.1, and bodies are streamed to storage. To keep many downloads
+    in flight over multiplexed HTTP/2 connections, use
+    `AsyncHTTPConnector` and await its `adownload` concurrently.
+
     Attributes:
-        config (dict[str, Any]): Configuration object containing HTTP
+        config (HTTPConfig): Configuration object containing HTTP
             request parameters including method, URL, headers, and data.
+            Either a validated `HTTPConfig` or a dictionary to validate.
+        config_model (type[HTTPConfig]): (class attribute) The model
+            used to validate the configuration.
         headers_cache (dict[str, str]): Cache for HTTP headers to be
             included in requests. This can include authentication tokens,
             content types, and other custom headers.
-        retriable_exceptions (tuple[type[Exception], ...]): Tuple of
-            exception types that should trigger retry logic. Includes
-            connection errors, timeouts, HTTP errors, and general
-            request exceptions.
-        retry_config (dict[str, Any] | None): Configuration for retry
-            behavior when encountering retriable exceptions. If None,
-            default retry behavior is used.
+        retriable_exceptions (tuple[type[Exception], ...]): (class
+            attribute) Tuple of exception types that should trigger
+            retry logic. Includes connection errors, timeouts, HTTP
+            errors, and general request exceptions.
+        retry_config (dict[str, Any] | RetryConfig | None): Configuration
+            for retry behavior when encountering retriable exceptions,
+            as values or a validated `RetryConfig`. If None, default
+            retry behavior is used.
     """
 
+    # Model validating the connector configuration
+    config_model = HTTPConfig
+
+    # Tuple of exception types that should trigger retry logic
+    retriable_exceptions: tuple[type[Exception], ...] = (
+        requests.exceptions.ConnectionError,  # Network connection failures
+        requests.exceptions.Timeout,  # Request timeout errors
+        requests.exceptions.HTTPError,  # HTTP 4xx/5xx status code errors
+        requests.exceptions.RequestException,  # Base requests library exceptions
+    )
+
     def __init__(
         self,
         headers_cache: dict[str, str],
-        retry_config: dict[str, Any] | None = None,
-        config: dict[str, Any] | None = None,
+        retry_config: dict[str, Any] | RetryConfig | None = None,
+        config: dict[str, Any] | HTTPConfig | None = None,
     ) -> None:
         if not config:
             raise ValueError("HTTPConnector requires a configuration.")
@@ -45,15 +190,7 @@ class HTTPConnector(BaseConnector):
         super().__init__(headers_cache, retry_config)
 
         # Configuration object containing HTTP request parameters
-        self.config = HTTPConfig(**config)
-
-        # Tuple of exception types that should trigger retry logic
-        self.retriable_exceptions = (
-            requests.exceptions.ConnectionError,  # Network connection failures
-            requests.exceptions.Timeout,  # Request timeout errors
-            requests.exceptions.HTTPError,  # HTTP 4xx/5xx status code errors
-            requests.exceptions.RequestException,  # Base requests library exceptions
-        )
+        self.config = HTTPConfig.model_validate(config)
 
     def _prepare_cache(self, response: Response) -> dict[str, str]:
         """Prepare cache metadata from the response.
@@ -75,25 +212,103 @@ class HTTPConnector(BaseConnector):
 
         return cache
 
-    def _check(self) -> dict[str, Any] | None:
-        """Check the HTTP resource without downloading it.
+    @property
+    def session(self) -> requests.Session:
+        """The pooled HTTP session used to send requests.
+
+        The session is shared, so it is not closed by any one connector.
+        Use `close_sessions` once no HTTP connector is in use anymore.
 
         Returns:
-            dict[str, Any]: A dictionary containing the updated headers cache.
+            requests.Session: The session shared by all HTTP connectors
+                with the same retry configuration.
         """
-        logger.info(f"Checking {self.config.method} {self.config.url}...")
+        return _default_session(
+            self.retry_config.max_retries,
+            self.retry_config.base_delay,
+            self.retry_config.max_delay,
+        )
 
-        # Send request
-        r = requests.request(
+    @classmethod
+    def close_sessions(cls) -> None:
+        """Close every HTTP session shared by HTTP connectors.
+
+        Releases their pooled connections. Later requests open new
+        sessions.
+        """
+        with _sessions_lock:
+            sessions = list(_sessions.values())
+            _sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+    def _request_headers(self) -> dict[str, Any]:
+        """Build the headers for the configured request.
+
+        The cached ETag and Last-Modified values are sent back as
+        conditional headers, so an unchanged resource is answered with
+        an empty `304 Not Modified` response.
+
+        Returns:
+            dict[str, Any]: The extra headers merged with the
+                conditional headers.
+        """
+        headers: dict[str, Any] = dict(self.config.extra_headers or {})
+
+        if "etag" in self.headers_cache:
+            headers["If-None-Match"] = self.headers_cache["etag"]
+        if "last_modified" in self.headers_cache:
+            headers["If-Modified-Since"] = self.headers_cache["last_modified"]
+
+        return headers
+
+    def _request(self, stream: bool = False) -> Response:
+        """Send the configured HTTP request.
+
+        When `orjson` is installed, `json_data` is serialized with it
+        and sent as the request body, with a JSON content type unless
+        the extra headers set one. As with `requests`, `json_data` is
+        ignored when form `data` is set.
+
+        Args:
+            stream (bool): Whether to defer reading the response body
+                until it is consumed. Defaults to False.
+
+        Returns:
+            Response: The HTTP response object.
+        """
+        data: dict[str, Any] | bytes | None = self.config.data
+        json_data = self.config.json_data
+        headers = CaseInsensitiveDict(self._request_headers())
+
+        if orjson is not None and json_data is not None and not data:
+            data = orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS)
+            json_data = None
+            headers.setdefault("Content-Type", "application/json")
+
+        return self.session.request(
             method=self.config.method,
             url=self.config.url,
             params=self.config.params,
-            data=self.config.data,
-            json=self.config.json_data,
-            headers=self.headers_cache.update(self.config.extra_headers or {}),
+            data=data,
+            json=json_data,
+            headers=headers,
             timeout=self.retry_config.timeout,
+            stream=stream,
         )
 
+    def _check(self) -> dict[str, Any] | None:
+        """Check the HTTP resource without downloading it.
+
+        Returns:
+            dict[str, Any]: A dictionary containing the updated headers cache.
+        """
+        logger.info(f"Checking {self.config.method} {self.config.url}...")
+
+        # Send request
+        r = self._request()
+
         if r.ok:
             return self._prepare_cache(r)
         else:
@@ -110,31 +325,23 @@ class HTTPConnector(BaseConnector):
         """
         logger.info(f"Downloading {self.config.method} {self.config.url}...")
 
-        # Send request
-        r = requests.request(
-            method=self.config.method,
-            url=self.config.url,
-            params=self.config.params,
-            data=self.config.data,
-            json=self.config.json_data,
-            headers=self.headers_cache.update(self.config.extra_headers or {}),
-            timeout=self.retry_config.timeout,
-        )
+        # Send request, leaving the body to be streamed to storage
+        r = self._request(stream=True)
         new_headers = self._prepare_cache(r)
 
         # Check for failure first
         if not r.ok:
             logger.error(f"Request failed: {r.status_code} {r.reason}")
+            r.close()
             return None, None
 
         # If resource unchanged (only for successful responses)
-        if r.status_code == 304 or all(
-            self.headers_cache.get(k) == new_headers.get(k) for k in new_headers.keys()
-        ):
+        if r.status_code == 304 or self._is_unchanged(new_headers):
             logger.info(
                 f"Response: {r.status_code} {r.reason}. "
                 "No new version. Skipping download."
             )
+            r.close()
             return new_headers, None
 
         # Successful response with new content
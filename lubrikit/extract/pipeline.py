@@ -1,6 +1,10 @@
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from typing import Any, cast
 
+from pydantic import BaseModel
+
 from lubrikit.base import Pipeline
 from lubrikit.extract import connectors
 from lubrikit.extract.storage import ExtractStorageClient, FileMetadata
@@ -15,9 +19,14 @@ class ExtractPipeline(Pipeline):
         """Return the ExtractStorageClient instance."""
         return ExtractStorageClient(self.metadata)
 
-    @property
+    @cached_property
     def connector(self) -> type[connectors.BaseConnector]:
-        """Return the connector class based on the metadata."""
+        """Return the connector class based on the metadata.
+
+        The class is resolved once per pipeline from the exports of
+        `lubrikit.extract.connectors`, which also imports lazily
+        exported connectors on first use.
+        """
         Connector: type[connectors.BaseConnector] | None = getattr(
             connectors, self.metadata["connector"], None
         )
@@ -26,19 +35,81 @@ class ExtractPipeline(Pipeline):
 
         return Connector
 
+    @cached_property
+    def connector_config(self) -> BaseModel | dict[str, Any] | None:
+        """The connector configuration, validated once per pipeline.
+
+        Returns:
+            BaseModel | dict[str, Any] | None: The configuration as an
+                instance of the connector's `config_model`, or as given
+                in the metadata if the connector has no model.
+        """
+        config: dict[str, Any] | None = self.metadata.get("connector_config")
+        config_model = self.connector.config_model
+        if config is None or config_model is None:
+            return config
+
+        return config_model.model_validate(config)
+
+    def _init_connector(self) -> connectors.BaseConnector:
+        """Instantiate the connector configured in the metadata."""
+        return self.connector(
+            config=self.connector_config,
+            headers_cache=self.metadata.get("headers_cache"),
+            retry_config=self.metadata.get("retry_config"),
+        )
+
     def run(self) -> None:
         """Runs the extract pipeline.
 
         Executes the pipeline process by initializing the connector,
         downloading data, and writing the downloaded data using the
-        storage client.
+        storage client. Once the data is written, the headers of the
+        new version are stored in the metadata's `headers_cache`, so the
+        next run sends them as conditional request headers.
         """
-        connector = self.connector(
-            config=self.metadata.get("connector_config"),
-            headers_cache=self.metadata.get("headers_cache"),
-            retry_config=self.metadata.get("retry_config"),
-        )
+        connector = self._init_connector()
 
-        _, downloader = connector.download()
+        headers, downloader = connector.download()
         if downloader:
             self.client.write(downloader)
+            self.metadata["headers_cache"] = headers
+
+    async def arun(self) -> None:
+        """Runs the extract pipeline without blocking the event loop.
+
+        Same steps as `run`, but the download and the write are executed
+        in worker threads so that several pipelines can be awaited
+        concurrently, e.g. with `asyncio.gather`.
+        """
+        connector = self._init_connector()
+
+        headers, downloader = await connector.adownload()
+        if downloader:
+            await self.client.awrite(downloader)
+            self.metadata["headers_cache"] = headers
+
+    @classmethod
+    def run_many(
+        cls, metadata_list: Iterable[dict[str, Any]], max_concurrency: int = 8
+    ) -> None:
+        """Runs one extract pipeline per metadata entry concurrently.
+
+        Pipelines are network-bound, so they run in a thread pool where
+        downloads and writes overlap.
+
+        Args:
+            metadata_list (Iterable[dict[str, Any]]): The metadata of
+                each pipeline to run.
+            max_concurrency (int): The maximum number of pipelines
+                running at the same time. Defaults to 8.
+
+        Raises:
+            Exception: The first error raised by a pipeline, once all
+                pipelines have finished.
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [executor.submit(cls(metadata).run) for metadata in metadata_list]
+
+        for future in futures:
+            future.result()
@@ -1,7 +1,13 @@
+import asyncio
+import io
 import logging
 import os
-from functools import singledispatchmethod
-from typing import Any
+import shutil
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from types import TracebackType
+from typing import IO, Any, ClassVar
 
 from googleapiclient.http import MediaIoBaseDownload
 from requests import Response
@@ -10,25 +16,96 @@ from lubrikit.base.storage import (
     FileMode,
     Layer,
     StorageClient,
+    WriteHandler,
 )
 from lubrikit.extract.storage.file_metadata import FileMetadata
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+class _BackgroundWriter:
+    """File-like sink writing each chunk to a file in a worker thread.
+
+    Each chunk written to the sink is handed to a worker thread, so the
+    next chunk of a download is fetched while the previous one is
+    written. At most one chunk waits to be written, so memory use stays
+    bounded by the chunk size.
+
+    Args:
+        file (IO[bytes]): The destination file.
+    """
+
+    def __init__(self, file: IO[bytes]) -> None:
+        self.file = file
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending: Future[int] | None = None
+
+    def write(self, data: bytes) -> int:
+        """Schedule a chunk to be written once the previous one is.
+
+        Args:
+            data (bytes): The chunk to write.
+
+        Returns:
+            int: The number of bytes scheduled.
+        """
+        self.flush()
+        self._pending = self._executor.submit(self.file.write, data)
+
+        return len(data)
+
+    def flush(self) -> None:
+        """Wait for the pending write and raise its error, if any."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def close(self) -> None:
+        """Wait for the pending write and stop the worker thread."""
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
+
+    def __enter__(self) -> "_BackgroundWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
 class ExtractStorageClient(StorageClient):
     def __init__(self, file_metadata: FileMetadata) -> None:
         self.metadata = file_metadata
 
-    def get_folder(self) -> str:
-        """Get the folder path for the given metadata.
+    @cached_property
+    def _folder(self) -> str:
+        """The landing folder path, resolved once per client.
 
         Returns:
             str: The folder path in storage.
         """
         folder = os.environ.get("AWS_LANDING_BUCKET", Layer.LANDING.bucket)
 
-        return os.path.join(self.base_path, folder)
+        return f"{self.base_path}{folder}"
+
+    def get_folder(self) -> str:
+        """Get the folder path for the given metadata.
+
+        Returns:
+            str: The folder path in storage.
+        """
+        return self._folder
 
     def get_path(self, metadata: FileMetadata) -> str:
         """Get the path to the table.
@@ -38,74 +115,210 @@ class ExtractStorageClient(StorageClient):
         Returns:
                 str: The path to the table.
         """
-        folder: str = self.get_folder()
         source_name: str | None = metadata.get("source_name")
         prefix: str | None = metadata.get("prefix")
 
-        path_components: list[str] = [folder]
-        if source_name:
-            path_components.append(source_name)
-        if prefix:
-            path_components.append(prefix)
+        return "/".join(part for part in (self._folder, source_name, prefix) if part)
 
-        return "/".join(path_components)
+    @classmethod
+    def write_many(
+        cls,
+        writes: Iterable[tuple["ExtractStorageClient", Any]],
+        max_concurrency: int = 8,
+    ) -> None:
+        """Write several downloads to storage concurrently.
 
-    @singledispatchmethod
-    def write(self, downloader: Any) -> None:
-        """Write data to storage.
+        Writes are network-bound, so they run in a thread pool where the
+        remaining downloads and uploads overlap. HTTP connectors and
+        storage clients share their connection pools, so concurrent
+        writes reuse open connections instead of opening new ones.
 
         Args:
-            downloader (Any): The downloader to retrieve data to write.
+            writes (Iterable[tuple[ExtractStorageClient, Any]]): Pairs
+                of a storage client and the download it should write.
+            max_concurrency (int): The maximum number of writes running
+                at the same time. Defaults to 8.
+
+        Raises:
+            Exception: The first error raised by a write, once all
+                writes have finished.
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [
+                executor.submit(client.write, downloader)
+                for client, downloader in writes
+            ]
+
+        for future in futures:
+            future.result()
+
+    async def awrite(self, data: Any) -> None:
+        """Write data to storage without blocking the event loop.
+
+        The write runs in a worker thread, so writes of several clients
+        can be awaited concurrently on one event loop.
+
+        Args:
+            data (Any): The data to write.
+        """
+        await asyncio.to_thread(self.write, data)
+
+    @classmethod
+    async def awrite_many(
+        cls,
+        writes: Iterable[tuple["ExtractStorageClient", Any]],
+        max_concurrency: int = 8,
+    ) -> None:
+        """Write several downloads to storage concurrently on the event loop.
+
+        Args:
+            writes (Iterable[tuple[ExtractStorageClient, Any]]): Pairs
+                of a storage client and the download it should write.
+            max_concurrency (int): The maximum number of writes running
+                at the same time. Defaults to 8.
+
         Raises:
-            NotImplementedError: If the data type is not supported.
+            Exception: The first error raised by a write, once all
+                writes have finished.
         """
-        raise NotImplementedError(f"Write not implemented for type {type(downloader)}")
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-    @write.register
-    def _(self, downloader: MediaIoBaseDownload) -> None:
+        async def bounded_write(client: "ExtractStorageClient", data: Any) -> None:
+            async with semaphore:
+                await client.awrite(data)
+
+        results = await asyncio.gather(
+            *(bounded_write(client, data) for client, data in writes),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    @cached_property
+    def _output_path(self) -> str:
+        """The destination path of the file, resolved on first write.
+
+        The landing folder is created at the same time, so repeated
+        writes through this client skip both steps.
+
+        Returns:
+            str: The path to write the file to.
+        """
+        self._make_dirs(path=self.get_folder())
+
+        return self.get_path(self.metadata)
+
+    def _write_media_download(self, downloader: MediaIoBaseDownload) -> None:
         """Writes a MediaIoBaseDownload's downloaded content to storage.
 
         The method ensures the output directory exists before writing
-        the file. The downloaded data is accessed from the internal file
-        descriptor of the downloader.
+        the file. When the downloader targets an in-memory buffer, the
+        buffer is drained into the destination file after every chunk,
+        so each chunk is written to storage while the next one is
+        fetched instead of being held in memory. Other file descriptors
+        belong to the caller and keep every chunk: the file is
+        downloaded first and then copied to storage. If the download
+        fails, nothing is written at the destination.
 
         Args:
             downloader (MediaIoBaseDownload): The downloader object used
                 to fetch the file chunks.
         """
-        output_path: str = self.get_path(self.metadata)
-        self._make_dirs(path=self.get_folder())
+        output_path: str = self._output_path
 
-        # Download the file
-        done = False
-        while not done:
-            _, done = downloader.next_chunk()
+        file_handle = downloader._fd
+
+        if isinstance(file_handle, io.BytesIO):
+            with self._upload(output_path) as f, _BackgroundWriter(f) as sink:
+                # Bytes already buffered by the caller come first
+                self._drain(file_handle, sink)
+                done = False
+                while not done:
+                    _, done = downloader.next_chunk()
+                    self._drain(file_handle, sink)
+            return
 
-        # Access the downloaded data
-        file_handle = downloader._fd  # The BytesIO object
-        file_handle.seek(0)  # Reset to beginning
+        self._download_all_chunks(downloader)
 
         # Stream to final destination
-        with open(output_path, FileMode.WRITING_BINARY) as f:
-            f.write(file_handle.read())
+        with self._upload(output_path) as f:
+            file_handle.seek(0)  # Reset to beginning
+            shutil.copyfileobj(file_handle, f, length=self.chunk_size)
+
+    @staticmethod
+    def _drain(buffer: io.BytesIO, sink: _BackgroundWriter) -> None:
+        """Move the bytes of a buffer to a sink, leaving the buffer empty.
+
+        Args:
+            buffer (io.BytesIO): The buffer the downloader writes to.
+            sink (_BackgroundWriter): The sink over the destination file.
+        """
+        data = buffer.getvalue()
+        if data:
+            sink.write(data)
+            buffer.seek(0)
+            buffer.truncate()
 
-    @write.register
-    def _(self, downloader: Response) -> None:
+    @staticmethod
+    def _download_all_chunks(downloader: MediaIoBaseDownload) -> None:
+        """Fetch chunks until the download is complete.
+
+        Args:
+            downloader (MediaIoBaseDownload): The downloader to drive.
+        """
+        done = False
+        while not done:
+            _, done = downloader.next_chunk()
+
+    def _write_response(self, downloader: Response) -> None:
         """Write a requests.Response object to storage.
 
+        The body is copied in chunks of `chunk_size` bytes, decoded as
+        it is read, whether it is still streaming or was already read
+        into memory. The response is closed afterwards, which returns
+        its connection to the pool. If reading the body fails, nothing
+        is written at the destination.
+
         Args:
             downloader (Response): The Response object to write.
         """
         downloader.raise_for_status()
 
-        output_path: str = self.get_path(self.metadata)
-        self._make_dirs(path=self.get_folder())
+        output_path: str = self._output_path
 
-        logger.info(
-            f"Writing {downloader.headers['Content-Length']} bytes to {output_path}"
-        )
-        with open(output_path, FileMode.WRITING_BINARY) as f:
-            for chunk in downloader.iter_content(
-                chunk_size=ExtractStorageClient.chunk_size
-            ):
-                f.write(chunk)
+        if logger.isEnabledFor(logging.INFO):
+            # Chunked responses have no Content-Length header
+            size = downloader.headers.get("Content-Length", "an unknown number of")
+            logger.info(f"Writing {size} bytes to {output_path}")
+        try:
+            with self._upload(output_path) as f:
+                for chunk in downloader.iter_content(chunk_size=self.chunk_size):
+                    f.write(chunk)
+        finally:
+            downloader.close()
+
+    def _write_httpx_response(self, downloader: "httpx.Response") -> None:
+        """Write an httpx.Response object to storage.
+
+        The body was read by the async download, so it is written with a
+        single call instead of being sliced into chunk-sized copies.
+
+        Args:
+            downloader (httpx.Response): The Response object to write.
+        """
+        downloader.raise_for_status()
+
+        output_path: str = self._output_path
+
+        content = downloader.content
+        logger.info(f"Writing {len(content)} bytes to {output_path}")
+        with self._open(output_path, FileMode.WRITING_BINARY) as f:
+            f.write(content)
+
+    _writers: ClassVar[dict[type, WriteHandler]] = {
+        MediaIoBaseDownload: _write_media_download,
+        Response: _write_response,
+    }
+    if httpx is not None:
+        _writers[httpx.Response] = _write_httpx_response
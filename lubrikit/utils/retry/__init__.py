@@ -1,4 +1,4 @@
-from .retry_config import RetryConfig
+from .retry_config import RetryConfig, get_retry_config
 from .retry_with_backoff import retry_with_backoff
 
-__all__ = ["retry_with_backoff", "RetryConfig"]
+__all__ = ["retry_with_backoff", "RetryConfig", "get_retry_config"]
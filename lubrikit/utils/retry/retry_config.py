@@ -1,10 +1,13 @@
+from functools import lru_cache
+from typing import Any
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
 class RetryConfig(BaseModel):
     """Configuration for retry behavior in HTTP requests."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     timeout: float = Field(
         default=10.0, gt=0.0, description="Request timeout in seconds"
@@ -21,3 +24,40 @@ class RetryConfig(BaseModel):
     backoff_factor: float = Field(
         default=2.0, ge=0.0, description="Multiplier for exponential backoff"
     )
+
+
+@lru_cache(maxsize=64)
+def _cached_retry_config(items: tuple[tuple[str, Any], ...]) -> RetryConfig:
+    """Validate a retry configuration given as sorted key-value pairs.
+
+    Args:
+        items (tuple[tuple[str, Any], ...]): The configuration values.
+
+    Returns:
+        RetryConfig: The validated configuration.
+    """
+    return RetryConfig(**dict(items))
+
+
+def get_retry_config(
+    retry_config: dict[str, Any] | RetryConfig | None = None,
+) -> RetryConfig:
+    """Get the shared, validated instance of a retry configuration.
+
+    Connectors built from the same configuration values share one
+    immutable `RetryConfig`, so the values are validated once per
+    process instead of once per connector. An already validated
+    `RetryConfig` is returned as is.
+
+    Args:
+        retry_config (dict[str, Any] | RetryConfig | None): The
+            configuration values or a validated configuration, or None
+            for the defaults.
+
+    Returns:
+        RetryConfig: The validated configuration.
+    """
+    if isinstance(retry_config, RetryConfig):
+        return retry_config
+
+    return _cached_retry_config(tuple(sorted((retry_config or {}).items())))
@@ -1,3 +1,5 @@
+import asyncio
+import inspect
 import logging
 import random
 import time
@@ -23,41 +25,88 @@ def retry_with_backoff(
         base_delay: Initial delay between retries in seconds
         max_delay: Maximum delay between retries in seconds
         backoff_factor: Multiplier for exponential backoff
-        jitter: Whether to add random jitter to delays
+        jitter: Whether to randomize delays with "full jitter", i.e.
+            wait a random time between zero and the backoff delay, so
+            that concurrent callers do not retry in lockstep
         retriable_exceptions: Tuple of exception types that should
             trigger retries
+
+    Coroutine functions are wrapped with an async wrapper that waits
+    with `asyncio.sleep` between attempts.
     """
 
+    # Define default exceptions if none provided
+    exceptions_to_retry = retriable_exceptions or (Exception,)
+
+    # Backoff delay of each retry, the upper bound of the jittered delay
+    delays = tuple(
+        min(base_delay * (backoff_factor**attempt), max_delay)
+        for attempt in range(max_retries)
+    )
+
+    def next_delay(attempt: int, error: BaseException) -> float | None:
+        """Log a failed attempt and compute the delay before the next one.
+
+        Args:
+            attempt: The zero-based index of the failed attempt
+            error: The retriable error raised by the attempt
+
+        Returns:
+            float | None: The number of seconds to wait before retrying,
+                or None if no attempts are left.
+        """
+        if attempt == max_retries:
+            logger.error(f"All {max_retries + 1} attempts failed. Last error: {error}")
+            return None
+
+        delay = delays[attempt]
+        if jitter:
+            # Full jitter: anywhere between no wait and the backoff delay
+            delay *= random.random()
+
+        logger.warning(
+            f"Attempt {attempt + 1}/{max_retries + 1} failed: {error}. "
+            f"Retrying in {delay:.2f}s"
+        )
+        return delay
+
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions_to_retry as e:
+                        delay = next_delay(attempt, e)
+                        if delay is None:
+                            raise
+                        # Wait without blocking the event loop
+                        await asyncio.sleep(delay)
+
+                    except Exception as e:
+                        # Not retriable, e.g. outside custom retriable_exceptions
+                        logger.error(f"Unexpected error: {e}")
+                        raise
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Define default exceptions if none provided
-            exceptions_to_retry = retriable_exceptions or (Exception,)
-
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions_to_retry as e:
-                    if attempt == max_retries:
-                        logger.error(
-                            f"All {max_retries + 1} attempts failed. Last error: {e}"
-                        )
-                        raise e
-
-                    delay = min(base_delay * (backoff_factor**attempt), max_delay)
-                    if jitter:
-                        # Add up to 10% jitter
-                        delay += random.uniform(0, delay * 0.1)
-
-                    logger.warning(
-                        f"Attempt {attempt + 1}/{max_retries + 1} failed: {e}. "
-                        f"Retrying in {delay:.2f}s"
-                    )
+                    delay = next_delay(attempt, e)
+                    if delay is None:
+                        raise
                     time.sleep(delay)
 
                 except Exception as e:
+                    # Not retriable, e.g. outside custom retriable_exceptions
                     logger.error(f"Unexpected error: {e}")
-                    raise e
+                    raise
 
         return wrapper
 
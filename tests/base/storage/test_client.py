@@ -1,6 +1,6 @@
 from functools import cached_property
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -30,14 +30,166 @@ def test_base_path(MockStorageClient: type) -> None:
     assert client.base_path == "s3://"
 
 
+class S3StorageClient(StorageClient):
+    def get_folder(self) -> str:
+        return "test_folder"
+
+    def get_path(self, *args: Any, **kwargs: Any) -> str:
+        return "test_folder/test_path"
+
+
+def test_s3_filesystem_configuration() -> None:
+    with patch("s3fs.S3FileSystem") as mock_s3fs:
+        client = S3StorageClient()
+        assert client.s3 is mock_s3fs.return_value
+
+    mock_s3fs.assert_called_once_with(
+        endpoint_url=None,
+        default_block_size=StorageClient.chunk_size,
+        default_fill_cache=False,
+        config_kwargs={"max_pool_connections": StorageClient.max_pool_connections},
+    )
+
+
+def test_s3_filesystem_shared_per_endpoint() -> None:
+    class OtherEndpointStorageClient(S3StorageClient):
+        endpoint_url = "http://localhost:9000"
+
+    with patch("s3fs.S3FileSystem", side_effect=lambda **kwargs: MagicMock()):
+        first = S3StorageClient()
+        second = S3StorageClient()
+        other = OtherEndpointStorageClient()
+
+        assert first.s3 is second.s3
+        assert first.s3 is not other.s3
+
+
+def test_s3_filesystem_uses_subclass_chunk_size() -> None:
+    class LargeChunkStorageClient(S3StorageClient):
+        chunk_size = 64 * 1024 * 1024
+
+    with patch("s3fs.S3FileSystem") as mock_s3fs:
+        assert LargeChunkStorageClient().s3 is mock_s3fs.return_value
+
+    assert mock_s3fs.call_args.kwargs["default_block_size"] == 64 * 1024 * 1024
+
+
 def test_make_dirs(MockStorageClient: type) -> None:
     client = MockStorageClient()
     client._make_dirs("test_folder/test_path")
 
-    client.s3.mkdir.assert_called_once_with("test_folder/test_path")
+    client.s3.makedirs.assert_called_once_with("test_folder/test_path", exist_ok=True)
+    client.s3.exists.assert_not_called()
+
+
+def test_make_dirs_caches_known_dirs(MockStorageClient: type) -> None:
+    client = MockStorageClient()
+    client._make_dirs("test_folder/test_path")
+    client._make_dirs("test_folder/test_path")
+
+    client.s3.makedirs.assert_called_once_with("test_folder/test_path", exist_ok=True)
+
+
+def test_make_dirs_shares_known_dirs_per_file_system(MockStorageClient: type) -> None:
+    first = MockStorageClient()
+    second = MockStorageClient()
+    second.s3 = first.s3
+    other = MockStorageClient()
+
+    first._make_dirs("test_folder/test_path")
+    second._make_dirs("test_folder/test_path")
+    other._make_dirs("test_folder/test_path")
+
+    first.s3.makedirs.assert_called_once_with("test_folder/test_path", exist_ok=True)
+    other.s3.makedirs.assert_called_once_with("test_folder/test_path", exist_ok=True)
+
+
+def test_open(MockStorageClient: type) -> None:
+    client = MockStorageClient()
+
+    f = client._open("test_folder/test_path", "wb")
+
+    client.s3.open.assert_called_once_with("test_folder/test_path", "wb")
+    assert f is client.s3.open.return_value
+
+
+def test_upload_commits_on_success(MockStorageClient: type) -> None:
+    client = MockStorageClient()
+    f = client.s3.open.return_value.__enter__.return_value
+
+    with client._upload("test_folder/test_path") as upload:
+        upload.write(b"test data")
+
+    client.s3.open.assert_called_once_with("test_folder/test_path", "wb")
+    f.write.assert_called_once_with(b"test data")
+    f.discard.assert_not_called()
+
+
+def test_upload_discards_on_error(MockStorageClient: type) -> None:
+    client = MockStorageClient()
+    f = client.s3.open.return_value.__enter__.return_value
+
+    with pytest.raises(ValueError), client._upload("test_folder/test_path"):
+        raise ValueError("download failed")
+
+    f.discard.assert_called_once_with()
+    assert f.closed is True
 
 
 def test_write_not_implemented(MockStorageClient: type) -> None:
     client = MockStorageClient()
     with pytest.raises(NotImplementedError):
         client.write("test data")
+
+
+def test_write_dispatches_to_registered_writer(MockStorageClient: type) -> None:
+    writer = MagicMock()
+
+    class DispatchStorageClient(MockStorageClient):
+        _writers = {bytes: writer}
+
+    client = DispatchStorageClient()
+    client.write(b"test data")
+
+    writer.assert_called_once_with(client, b"test data")
+
+
+def test_write_falls_back_to_base_class_writer(MockStorageClient: type) -> None:
+    writer = MagicMock()
+
+    class Payload(bytes):
+        pass
+
+    class DispatchStorageClient(MockStorageClient):
+        _writers = {bytes: writer}
+
+    client = DispatchStorageClient()
+    payload = Payload(b"test data")
+    client.write(payload)
+
+    writer.assert_called_once_with(client, payload)
+    assert Payload not in DispatchStorageClient._writers
+    assert Payload not in StorageClient._writers
+
+
+def test_inherited_writer_cached_per_class(MockStorageClient: type) -> None:
+    bytes_writer = MagicMock()
+    object_writer = MagicMock()
+
+    class Payload(bytes):
+        pass
+
+    class BytesStorageClient(MockStorageClient):
+        _writers = {bytes: bytes_writer}
+
+    class ObjectStorageClient(MockStorageClient):
+        _writers = {object: object_writer}
+
+    payload = Payload(b"test data")
+    BytesStorageClient().write(payload)
+    ObjectStorageClient().write(payload)
+
+    bytes_writer.assert_called_once()
+    object_writer.assert_called_once()
+    assert BytesStorageClient._inherited_writer(Payload) is bytes_writer
+    assert ObjectStorageClient._inherited_writer(Payload) is object_writer
@@ -19,7 +19,8 @@ from lubrikit.base.storage.file_type import FileType
 def test_file_type_members(member: FileType, value: str) -> None:
     """Test that each FileType member has the correct value."""
     assert member.value == value, f"Expected {value}, got {member.value}"
-    assert member == value
+    assert member != value
+    assert FileType(value) is member
 
 
 @pytest.mark.parametrize(
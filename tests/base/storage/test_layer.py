@@ -16,7 +16,8 @@ from lubrikit.base.storage.layer import Layer
 )
 def test_enum_members(member: Layer, value: str) -> None:
     assert member.value == value
-    assert member == value
+    assert member != value
+    assert Layer(value) is member
 
 
 @pytest.mark.parametrize(
@@ -117,3 +118,11 @@ def test_previous_layer(layer: Layer, previous_layer: Layer) -> None:
 def test_previous_layer_raises() -> None:
     with pytest.raises(ValueError):
         _ = Layer.LANDING.previous
+
+
+def test_bucket_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AWS_LANDING_BUCKET", "landing-bucket")
+    assert Layer.LANDING.bucket == "landing-bucket"
+
+    monkeypatch.setenv("AWS_LANDING_BUCKET", "other-bucket")
+    assert Layer.LANDING.bucket == "landing-bucket"
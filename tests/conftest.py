@@ -0,0 +1,22 @@
+from collections.abc import Iterator
+
+import pytest
+
+from lubrikit.base.storage.client import _get_s3fs
+from lubrikit.base.storage.layer import _BUCKET_CACHE
+
+
+@pytest.fixture(autouse=True)
+def clear_bucket_cache() -> Iterator[None]:
+    """Re-read layer bucket environment variables in every test."""
+    _BUCKET_CACHE.clear()
+    yield
+    _BUCKET_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_s3fs_cache() -> Iterator[None]:
+    """Build a fresh S3 file system in every test."""
+    _get_s3fs.cache_clear()
+    yield
+    _get_s3fs.cache_clear()
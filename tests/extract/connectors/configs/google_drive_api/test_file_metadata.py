@@ -0,0 +1,34 @@
+from lubrikit.extract.connectors.configs.google_drive_api import (
+    GoogleDriveAPIFileMetadata,
+)
+
+
+def test_parse_api_response() -> None:
+    """Test that a files.get response is parsed into typed fields."""
+    metadata = GoogleDriveAPIFileMetadata.model_validate(
+        {
+            "name": "test_file.csv",
+            "size": "1024",
+            "modifiedTime": "2023-08-12T21:52:29.054Z",
+        }
+    )
+
+    assert metadata.name == "test_file.csv"
+    assert metadata.size == 1024
+    assert metadata.modified_time == "2023-08-12T21:52:29.054Z"
+
+
+def test_defaults_for_missing_fields() -> None:
+    """Test the defaults of Google Workspace documents without a size."""
+    metadata = GoogleDriveAPIFileMetadata.model_validate({})
+
+    assert metadata.name == ""
+    assert metadata.size is None
+    assert metadata.modified_time == ""
+
+
+def test_populate_by_field_name() -> None:
+    """Test that fields can also be set by their Python names."""
+    metadata = GoogleDriveAPIFileMetadata(modified_time="2023-08-12")
+
+    assert metadata.modified_time == "2023-08-12"
@@ -1,31 +1,44 @@
 import pytest
 from pydantic import ValidationError
 
-from lubrikit.extract.connectors.configs.google_drive_api import GoogleDriveAPIConfig
+from lubrikit.extract.connectors.configs.google_drive_api import (
+    GOOGLE_DRIVE_API_CONFIG_LIST,
+    GoogleDriveAPIConfig,
+)
 
+pytestmark = pytest.mark.fast
+
+# File IDs and the validation error type they raise, or None if valid
+FILE_ID_CASES: tuple[tuple[object, str | None], ...] = (
+    ("1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms", None),  # Standard file ID
+    ("1n6RHOzzrpAXSRdVwpLNGIwVxcI4Pqzy_", None),  # Short file ID
+    ("1BDcdA4czft0wdvYeyvdgpaK-pSz4SmRG5WhHvwBRmyg", None),  # Another valid format
+    ("a" * 100, None),  # Very long file ID
+    ("123-abc_DEF", None),  # File ID with special characters
+    # Pydantic's min_length counts whitespace characters, so these are valid
+    ("   ", None),  # Whitespace only
+    ("\t", None),  # Tab character
+    ("\n", None),  # Newline character
+    ("", "string_too_short"),  # Empty string
+    (123, "string_type"),  # Not a string
+)
 
-def test_valid_fileId() -> None:
-    """Test GoogleDriveAPIConfig with valid fileId."""
-    fileId = "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
-    config = GoogleDriveAPIConfig(fileId=fileId)
 
-    assert config.fileId == fileId
+def test_fileId() -> None:
+    """Test which file IDs GoogleDriveAPIConfig accepts and rejects."""
+    for fileId, error_type in FILE_ID_CASES:
+        if error_type is None:
+            config = GoogleDriveAPIConfig(fileId=fileId)
+            assert config.fileId == fileId
+            continue
 
+        with pytest.raises(ValidationError) as exc_info:
+            GoogleDriveAPIConfig(fileId=fileId)
 
-@pytest.mark.parametrize(
-    "fileId",
-    [
-        "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms",  # Standard file ID
-        "1n6RHOzzrpAXSRdVwpLNGIwVxcI4Pqzy_",  # Short file ID
-        "1BDcdA4czft0wdvYeyvdgpaK-pSz4SmRG5WhHvwBRmyg",  # Another valid format
-        "a" * 100,  # Very long file ID
-        "123-abc_DEF",  # File ID with special characters
-    ],
-)
-def test_valid_fileId_formats(fileId: str) -> None:
-    """Test GoogleDriveAPIConfig accepts various valid file ID formats."""
-    config = GoogleDriveAPIConfig(fileId=fileId)
-    assert config.fileId == fileId
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert errors[0]["loc"] == ("fileId",)
+        assert errors[0]["type"] == error_type
 
 
 def test_fileId_required() -> None:
@@ -39,44 +52,41 @@ def test_fileId_required() -> None:
     assert "missing" in errors[0]["type"]
 
 
-def test_invalid_fileId_empty_string() -> None:
-    """Test that fileId field rejects empty string."""
-    with pytest.raises(ValidationError) as exc_info:
-        GoogleDriveAPIConfig(fileId="")
+def test_stream_default() -> None:
+    """Test that streaming downloads are disabled by default."""
+    config = GoogleDriveAPIConfig(fileId="abc")
 
-    errors = exc_info.value.errors()
-    assert len(errors) == 1
-    assert errors[0]["loc"] == ("fileId",)
-    assert (
-        "string_too_short" in errors[0]["type"]
-        or "at least 1 character" in errors[0]["msg"]
-    )
+    assert config.stream is False
 
 
-@pytest.mark.parametrize(
-    "whitespace_fileId",
-    [
-        "   ",  # Whitespace only
-        "\t",  # Tab character
-        "\n",  # Newline character
-    ],
-)
-def test_whitespace_fileId_allowed(whitespace_fileId: str) -> None:
-    """Test fileId field allows whitespace-only strings (Pydantic behavior)."""
-    # Note: Pydantic's min_length counts whitespace characters, so these are valid
-    config = GoogleDriveAPIConfig(fileId=whitespace_fileId)
-    assert config.fileId == whitespace_fileId
+def test_chunk_size_default() -> None:
+    """Test that chunked downloads fetch 100 MiB per request by default."""
+    config = GoogleDriveAPIConfig(fileId="abc")
 
+    assert config.chunk_size == 100 * 1024 * 1024
 
-def test_fileId_type_validation() -> None:
-    """Test that fileId field rejects non-string types."""
-    with pytest.raises(ValidationError) as exc_info:
-        GoogleDriveAPIConfig(fileId=123)
 
-    errors = exc_info.value.errors()
-    assert len(errors) == 1
-    assert errors[0]["loc"] == ("fileId",)
-    assert (
-        "string_type" in errors[0]["type"]
-        or "Input should be a valid string" in errors[0]["msg"]
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_invalid_chunk_size(chunk_size: int) -> None:
+    """Test that GoogleDriveAPIConfig rejects non-positive chunk sizes."""
+    with pytest.raises(ValidationError):
+        GoogleDriveAPIConfig(fileId="abc", chunk_size=chunk_size)
+
+
+def test_from_trusted() -> None:
+    """Test that from_trusted builds a config with defaults applied."""
+    config = GoogleDriveAPIConfig.from_trusted({"fileId": "abc"})
+
+    assert config == GoogleDriveAPIConfig(fileId="abc")
+
+
+def test_config_list_validation() -> None:
+    """Test that a list of configs is validated in one call."""
+    configs = GOOGLE_DRIVE_API_CONFIG_LIST.validate_python(
+        [{"fileId": "abc"}, {"fileId": "def", "mimeType": "text/csv"}]
     )
+
+    assert configs == [
+        GoogleDriveAPIConfig(fileId="abc"),
+        GoogleDriveAPIConfig(fileId="def", mimeType="text/csv"),
+    ]
@@ -1,7 +1,33 @@
+from typing import Any
+
 import pytest
 from pydantic import ValidationError
 
-from lubrikit.extract.connectors.configs.http_config import HTTPConfig
+from lubrikit.extract.connectors.configs.http_config import HTTP_CONFIG_LIST, HTTPConfig
+
+pytestmark = pytest.mark.fast
+
+
+@pytest.fixture(scope="module")
+def required_config() -> HTTPConfig:
+    """HTTPConfig created with only the required fields."""
+    return HTTPConfig(method="GET", url="https://api.example.com/data")
+
+
+@pytest.fixture(scope="module")
+def full_config() -> HTTPConfig:
+    """HTTPConfig created with every field populated."""
+    return HTTPConfig(
+        method="POST",
+        url="https://api.example.com/submit",
+        params={"key": "value", "limit": 10},
+        data={"form_field": "form_value"},
+        json_data={"json_field": "json_value"},
+        extra_headers={
+            "Authorization": "Bearer token",
+            "Content-Type": "application/json",
+        },
+    )
 
 
 @pytest.mark.parametrize(
@@ -15,11 +41,11 @@ from lubrikit.extract.connectors.configs.http_config import HTTPConfig
         ("extra_headers", None),
     ],
 )
-def test_required_fields_only(field_name: str, expected_value: str | None) -> None:
+def test_required_fields_only(
+    required_config: HTTPConfig, field_name: str, expected_value: str | None
+) -> None:
     """Test that HTTPConfig can be created with only required fields."""
-    config = HTTPConfig(method="GET", url="https://api.example.com/data")
-
-    assert getattr(config, field_name) == expected_value
+    assert getattr(required_config, field_name) == expected_value
 
 
 @pytest.mark.parametrize(
@@ -40,51 +66,43 @@ def test_required_fields_only(field_name: str, expected_value: str | None) -> No
     ],
 )
 def test_all_fields_populated(
-    field_name: str, expected_value: str | dict | None
+    full_config: HTTPConfig, field_name: str, expected_value: str | dict | None
 ) -> None:
     """Test that HTTPConfig accepts all fields with values."""
-    config = HTTPConfig(
-        method="POST",
-        url="https://api.example.com/submit",
-        params={"key": "value", "limit": 10},
-        data={"form_field": "form_value"},
-        json_data={"json_field": "json_value"},
-        extra_headers={
-            "Authorization": "Bearer token",
-            "Content-Type": "application/json",
-        },
-    )
+    assert getattr(full_config, field_name) == expected_value
 
-    assert getattr(config, field_name) == expected_value
 
+def test_method_validation() -> None:
+    """Test that the GET and POST methods are valid."""
+    for method in ("GET", "POST"):
+        config = HTTPConfig(method=method, url="https://example.com")
+        assert config.method == method
 
-@pytest.mark.parametrize("method", ["GET", "POST"])
-def test_method_validation(method: str) -> None:
-    """Test that GET method is valid."""
-    config = HTTPConfig(method=method, url="https://example.com")
-    assert config.method == method
-
-
-@pytest.mark.parametrize(
-    "method",
-    ["PUT", "DELETE", "PATCH", "HEAD", "OPTIONS", "CONNECT", "TRACE"],
-)
-def test_method_validation_invalid(method: str) -> None:
-    """Test that invalid HTTP methods are rejected."""
-    with pytest.raises(ValidationError) as exc_info:
-        HTTPConfig(method=method, url="https://example.com")
 
+def _assert_method_error(exc_info: pytest.ExceptionInfo[ValidationError]) -> None:
+    """Assert that a validation error is a single error on the method."""
     errors = exc_info.value.errors()
     assert len(errors) == 1
     assert errors[0]["loc"] == ("method",)
     assert "literal_error" in errors[0]["type"] or "Input should be" in errors[0]["msg"]
 
 
-@pytest.mark.parametrize("method", ["get", "post"])
-def test_method_validation_case_sensitive(method: str) -> None:
+def test_method_validation_invalid() -> None:
+    """Test that invalid HTTP methods are rejected."""
+    for method in ("PUT", "DELETE", "PATCH", "HEAD", "OPTIONS", "CONNECT", "TRACE"):
+        with pytest.raises(ValidationError) as exc_info:
+            HTTPConfig(method=method, url="https://example.com")
+
+        _assert_method_error(exc_info)
+
+
+def test_method_validation_case_sensitive() -> None:
     """Test that method validation is case-sensitive."""
-    with pytest.raises(ValidationError):
-        HTTPConfig(method=method, url="https://example.com")
+    for method in ("get", "post"):
+        with pytest.raises(ValidationError) as exc_info:
+            HTTPConfig(method=method, url="https://example.com")
+
+        _assert_method_error(exc_info)
 
 
 def test_url_required() -> None:
@@ -311,3 +329,55 @@ def test_multiple_validation_errors() -> None:
     assert "method" in error_fields
     assert "url" in error_fields
     assert "params" in error_fields or "data" in error_fields
+
+
+def test_from_trusted() -> None:
+    """Test that from_trusted builds a config equal to a validated one."""
+    validated = HTTPConfig(
+        method="GET", url="https://api.example.com/data", params={"page": 1}
+    )
+
+    config = HTTPConfig.from_trusted(validated.model_dump())
+
+    assert config == validated
+
+
+def test_config_is_frozen() -> None:
+    """Test that configurations cannot be modified after validation."""
+    config = HTTPConfig(method="GET", url="https://api.example.com/data")
+
+    with pytest.raises(ValidationError):
+        config.url = "https://api.example.com/other"  # type: ignore[misc]
+
+
+def test_from_trusted_skips_validation() -> None:
+    """Test that from_trusted does not validate its input."""
+    config = HTTPConfig.from_trusted({"method": "PUT", "url": "not-validated"})
+
+    assert config.method == "PUT"
+    assert config.params is None
+
+
+def test_config_list_validation() -> None:
+    """Test that a list of configs is validated in one call."""
+    manifest: list[dict[str, Any]] = [
+        {"method": "GET", "url": "https://api.example.com/a"},
+        {"method": "POST", "url": "https://api.example.com/b", "json_data": {}},
+    ]
+
+    configs = HTTP_CONFIG_LIST.validate_python(manifest)
+
+    assert configs == [HTTPConfig(**d) for d in manifest]
+
+
+def test_config_list_validation_error() -> None:
+    """Test that invalid entries are reported with their list index."""
+    manifest = [
+        {"method": "GET", "url": "https://api.example.com/a"},
+        {"method": "PUT", "url": "https://api.example.com/b"},
+    ]
+
+    with pytest.raises(ValidationError) as exc_info:
+        HTTP_CONFIG_LIST.validate_python(manifest)
+
+    assert exc_info.value.errors()[0]["loc"][:2] == (1, "method")
@@ -1,7 +1,9 @@
 import pytest
 
+from lubrikit.utils.retry import RetryConfig
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def retry_config() -> dict[str, int | float]:
     """Sample retry configuration."""
     return {
@@ -11,3 +13,9 @@ def retry_config() -> dict[str, int | float]:
         "max_delay": 30.0,
         "backoff_factor": 2.0,
     }
+
+
+@pytest.fixture(scope="session")
+def custom_retry_config(retry_config: dict[str, int | float]) -> RetryConfig:
+    """Sample retry configuration, validated once per session."""
+    return RetryConfig(**retry_config)
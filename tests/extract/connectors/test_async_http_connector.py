@@ -0,0 +1,267 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from lubrikit.extract import AsyncHTTPConnector  # noqa: E402
+from lubrikit.extract.connectors.async_http_connector import (  # noqa: E402
+    _default_client,
+)
+
+URL = "https://api.example.com/data"
+
+
+def run[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine, then close the HTTP client shared on its loop."""
+
+    async def main() -> T:
+        try:
+            return await coro
+        finally:
+            await AsyncHTTPConnector.aclose_client()
+
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def headers_cache() -> dict[str, str]:
+    """Sample headers cache."""
+    return {"etag": "test-etag", "content_length": "1024"}
+
+
+@pytest.fixture
+def connector(headers_cache: dict[str, str]) -> AsyncHTTPConnector:
+    """AsyncHTTPConnector instance with default configuration."""
+    return AsyncHTTPConnector(
+        headers_cache=headers_cache,
+        config={"method": "GET", "url": URL, "params": {"limit": 10}},
+        retry_config={"max_retries": 1, "base_delay": 0.0},
+    )
+
+
+def make_response(status_code: int, headers: dict[str, str] | None = None) -> Any:
+    """Build an httpx response for the sample request."""
+    return httpx.Response(
+        status_code,
+        headers=headers,
+        content=b"payload",
+        request=httpx.Request("GET", URL),
+    )
+
+
+@patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock)
+def test_adownload_new_content(
+    mock_request: AsyncMock, connector: AsyncHTTPConnector
+) -> None:
+    """Test adownload returns the response when the content changed."""
+    response = make_response(200, {"ETag": "new-etag", "Content-Length": "7"})
+    mock_request.return_value = response
+
+    headers, downloader = run(connector.adownload())
+
+    assert headers == {"etag": "new-etag", "content_length": "7"}
+    assert downloader is response
+    mock_request.assert_awaited_once_with(
+        method="GET",
+        url=URL,
+        params={"limit": 10},
+        headers={"If-None-Match": "test-etag"},
+        timeout=10.0,
+    )
+
+
+@patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock)
+def test_adownload_not_modified(
+    mock_request: AsyncMock, connector: AsyncHTTPConnector
+) -> None:
+    """Test that a 304 answer skips the download."""
+    mock_request.return_value = make_response(304, {"ETag": "test-etag"})
+
+    headers, downloader = run(connector.adownload())
+
+    assert headers == {"etag": "test-etag", "content_length": "7"}
+    assert downloader is None
+
+
+@patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock)
+def test_adownload_failure(
+    mock_request: AsyncMock, connector: AsyncHTTPConnector
+) -> None:
+    """Test that an error status returns no headers and no response."""
+    mock_request.return_value = make_response(500)
+
+    assert run(connector.adownload()) == (None, None)
+
+
+@pytest.mark.parametrize(
+    "status_code, expected",
+    [(200, {"etag": "check-etag", "content_length": "7"}), (404, None)],
+)
+@patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock)
+def test_acheck(
+    mock_request: AsyncMock,
+    connector: AsyncHTTPConnector,
+    status_code: int,
+    expected: dict[str, str] | None,
+) -> None:
+    """Test acheck returns the new headers cache of successful responses."""
+    mock_request.return_value = make_response(status_code, {"ETag": "check-etag"})
+
+    assert run(connector.acheck()) == expected
+
+
+@patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock)
+def test_adownload_retries_transport_errors(
+    mock_request: AsyncMock, connector: AsyncHTTPConnector
+) -> None:
+    """Test that transport errors are retried with the retry configuration."""
+    mock_request.side_effect = [
+        httpx.ConnectError("connection refused"),
+        make_response(200, {"ETag": "new-etag"}),
+    ]
+
+    headers, _ = run(connector.adownload())
+
+    assert headers == {"etag": "new-etag", "content_length": "7"}
+    assert mock_request.await_count == 2
+
+
+@patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock)
+def test_arequest_json_data_orjson(mock_request: AsyncMock) -> None:
+    """Test that JSON data is serialized with orjson when installed."""
+    orjson = pytest.importorskip("orjson")
+    json_data = {"name": "John Doe"}
+    connector = AsyncHTTPConnector(
+        headers_cache={},
+        config={"method": "POST", "url": URL, "json_data": json_data},
+    )
+    mock_request.return_value = make_response(201)
+
+    run(connector._arequest())
+
+    kwargs = mock_request.call_args.kwargs
+    assert kwargs["content"] == orjson.dumps(json_data)
+    assert "json" not in kwargs
+    assert "data" not in kwargs
+    assert kwargs["headers"] == {"Content-Type": "application/json"}
+
+
+@patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock)
+def test_arequest_form_data(mock_request: AsyncMock) -> None:
+    """Test that form data is sent on its own."""
+    connector = AsyncHTTPConnector(
+        headers_cache={},
+        config={"method": "POST", "url": URL, "data": {"name": "John Doe"}},
+    )
+    mock_request.return_value = make_response(201)
+
+    run(connector._arequest())
+
+    kwargs = mock_request.call_args.kwargs
+    assert kwargs["data"] == {"name": "John Doe"}
+    assert "content" not in kwargs
+    assert "json" not in kwargs
+
+
+@patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock)
+def test_arequest_json_data_keeps_content_type(mock_request: AsyncMock) -> None:
+    """Test that a Content-Type set by the caller is kept for JSON data."""
+    pytest.importorskip("orjson")
+    connector = AsyncHTTPConnector(
+        headers_cache={},
+        config={
+            "method": "POST",
+            "url": URL,
+            "json_data": {"name": "John Doe"},
+            "extra_headers": {"Content-Type": "application/vnd.api+json"},
+        },
+    )
+    mock_request.return_value = make_response(201)
+
+    run(connector._arequest())
+
+    headers = mock_request.call_args.kwargs["headers"]
+    assert headers == {"Content-Type": "application/vnd.api+json"}
+
+
+@patch.object(httpx.AsyncClient, "request", new_callable=AsyncMock)
+def test_arequest_data_and_json_data(mock_request: AsyncMock) -> None:
+    """Test that form data wins over JSON data, as in requests."""
+    connector = AsyncHTTPConnector(
+        headers_cache={},
+        config={
+            "method": "POST",
+            "url": URL,
+            "data": {"name": "John Doe"},
+            "json_data": {"name": "Jane Doe"},
+        },
+    )
+    mock_request.return_value = make_response(201)
+
+    run(connector._arequest())
+
+    kwargs = mock_request.call_args.kwargs
+    assert kwargs["data"] == {"name": "John Doe"}
+    assert "content" not in kwargs
+    assert "json" not in kwargs
+
+
+def test_default_client_shared_per_loop() -> None:
+    """Test that the HTTP/2 client is shared within an event loop only."""
+
+    async def get_clients() -> tuple[Any, Any]:
+        return _default_client(), _default_client()
+
+    first, second = run(get_clients())
+    other, _ = run(get_clients())
+
+    assert first is second
+    assert first is not other
+    assert first.headers["User-Agent"] == "lubrikit (gzip)"
+
+
+def test_aclose_client() -> None:
+    """Test that closing the loop's client releases it for a new one."""
+
+    async def close_and_reopen() -> tuple[Any, Any]:
+        client = _default_client()
+        await AsyncHTTPConnector.aclose_client()
+        return client, _default_client()
+
+    closed, reopened = run(close_and_reopen())
+
+    assert closed.is_closed
+    assert reopened is not closed
+    assert reopened.is_closed
+
+
+def test_check_uses_sync_session(connector: AsyncHTTPConnector) -> None:
+    """Test that the blocking check still goes through requests."""
+    with patch.object(type(connector), "_check", return_value=None) as mock_check:
+        connector.check()
+
+    mock_check.assert_called_once_with()
+
+
+def test_pipeline_arun_writes_httpx_response(connector: AsyncHTTPConnector) -> None:
+    """Test that ExtractPipeline.arun awaits the native async download."""
+    from lubrikit.extract.pipeline import ExtractPipeline
+
+    response = make_response(200)
+    pipeline = ExtractPipeline({"connector": "AsyncHTTPConnector"})
+    mock_client = AsyncMock()
+    pipeline.__dict__["client"] = mock_client
+
+    with (
+        patch.object(pipeline, "_init_connector", return_value=connector),
+        patch.object(
+            connector, "_adownload", new=AsyncMock(return_value=({}, response))
+        ),
+    ):
+        run(pipeline.arun())
+
+    mock_client.awrite.assert_awaited_once_with(response)
@@ -1,3 +1,5 @@
+import asyncio
+from collections.abc import Iterator
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -6,6 +8,14 @@ import pytest
 from lubrikit.extract.connectors.base import BaseConnector
 from lubrikit.utils.retry import RetryConfig
 
+RETRY_DEFAULTS: list[tuple[str, int | float]] = [
+    ("timeout", 10.0),
+    ("max_retries", 3),
+    ("base_delay", 1.0),
+    ("max_delay", 60.0),
+    ("backoff_factor", 2.0),
+]
+
 
 class ConcreteConnector(BaseConnector):
     """Concrete implementation of BaseConnector for testing purposes."""
@@ -13,7 +23,7 @@ class ConcreteConnector(BaseConnector):
     def __init__(
         self,
         headers_cache: dict[str, str] | None = None,
-        retry_config: dict[str, int | float] | None = None,
+        retry_config: dict[str, int | float] | RetryConfig | None = None,
         retriable_exceptions: tuple[type[Exception], ...] = (),
     ) -> None:
         super().__init__(headers_cache, retry_config)
@@ -48,32 +58,54 @@ def connector(headers_cache: dict[str, str]) -> ConcreteConnector:
     return ConcreteConnector(headers_cache)
 
 
+@pytest.fixture
+def default_connector() -> ConcreteConnector:
+    """BaseConnector concrete implementation with no cache or retry config."""
+    return ConcreteConnector()
+
+
+@pytest.fixture
+def connector_with_exceptions() -> ConcreteConnector:
+    """BaseConnector with custom retriable exceptions."""
+    return ConcreteConnector(
+        headers_cache={},
+        retriable_exceptions=(ConnectionError, TimeoutError, ValueError),
+    )
+
+
 @pytest.fixture
 def connector_with_retry(
-    headers_cache: dict[str, str], retry_config: dict[str, int | float]
+    headers_cache: dict[str, str], custom_retry_config: RetryConfig
 ) -> ConcreteConnector:
     """BaseConnector with custom retry configuration."""
-    return ConcreteConnector(headers_cache, retry_config)
+    return ConcreteConnector(headers_cache, custom_retry_config)
 
 
-@pytest.mark.parametrize(
-    "feature, expected",
-    [
-        ("timeout", 10.0),
-        ("max_retries", 3),
-        ("base_delay", 1.0),
-        ("max_delay", 60.0),
-        ("backoff_factor", 2.0),
-    ],
-)
-def test_initialization_default(
-    headers_cache: dict[str, str], feature: str, expected: int | float
-) -> None:
+@pytest.fixture
+def patched_retry() -> Iterator[tuple[Mock, Mock, Mock]]:
+    """Patched `retry_with_backoff` with its decorator and decorated mocks.
+
+    Yields:
+        tuple[Mock, Mock, Mock]: The patched `retry_with_backoff`, the
+            decorator it returns, and the function the decorator returns.
+    """
+    mock_decorated_function = Mock()
+    mock_decorator = Mock(return_value=mock_decorated_function)
+
+    with patch(
+        "lubrikit.extract.connectors.base.retry_with_backoff",
+        return_value=mock_decorator,
+    ) as mock_retry:
+        yield mock_retry, mock_decorator, mock_decorated_function
+
+
+def test_initialization_default(headers_cache: dict[str, str]) -> None:
     """Test BaseConnector initialization with default retry config."""
     connector = ConcreteConnector(headers_cache)
 
     assert connector.headers_cache == headers_cache
-    assert getattr(connector.retry_config, feature) == expected
+    for feature, expected in RETRY_DEFAULTS:
+        assert getattr(connector.retry_config, feature) == expected, feature
 
 
 def test_initialization_with_retry_config(
@@ -86,12 +118,21 @@ def test_initialization_with_retry_config(
     assert connector.retry_config == RetryConfig(**retry_config)
 
 
-def test_initialization_empty_headers_cache() -> None:
-    """Test BaseConnector initialization with empty headers cache."""
-    connector = ConcreteConnector()
+def test_initialization_with_validated_retry_config(
+    headers_cache: dict[str, str], custom_retry_config: RetryConfig
+) -> None:
+    """Test that a validated retry config is used as is."""
+    connector = ConcreteConnector(headers_cache, custom_retry_config)
 
-    assert connector.headers_cache == {}
-    assert isinstance(connector.retry_config, RetryConfig)
+    assert connector.retry_config is custom_retry_config
+
+
+def test_initialization_empty_headers_cache(
+    default_connector: ConcreteConnector,
+) -> None:
+    """Test BaseConnector initialization with empty headers cache."""
+    assert default_connector.headers_cache == {}
+    assert isinstance(default_connector.retry_config, RetryConfig)
 
 
 def test_initialization_none_headers_cache() -> None:
@@ -101,18 +142,25 @@ def test_initialization_none_headers_cache() -> None:
     assert connector.headers_cache == {}
 
 
-@patch("lubrikit.extract.connectors.base.retry_with_backoff")
-def test_check_method_calls_retry_decorator(
-    mock_retry_with_backoff: Mock, connector: ConcreteConnector
+@pytest.mark.parametrize(
+    "method_name, inner_name, expected",
+    [
+        ("check", "_check", {"test": "result"}),
+        ("download", "_download", ({"test": "headers"}, "response_data")),
+    ],
+)
+def test_methods_call_retry_decorator(
+    patched_retry: tuple[Mock, Mock, Mock],
+    connector: ConcreteConnector,
+    method_name: str,
+    inner_name: str,
+    expected: Any,
 ) -> None:
-    """Test that check method creates and uses retry decorator correctly."""
-    mock_decorator = Mock()
-    mock_retry_with_backoff.return_value = mock_decorator
-    mock_decorated_function = Mock()
-    mock_decorator.return_value = mock_decorated_function
-    mock_decorated_function.return_value = {"test": "result"}
+    """Test that check and download create and use the retry decorator."""
+    mock_retry_with_backoff, mock_decorator, mock_decorated_function = patched_retry
+    mock_decorated_function.return_value = expected
 
-    result = connector.check()
+    result = getattr(connector, method_name)()
 
     # Verify retry decorator was created with correct parameters
     mock_retry_with_backoff.assert_called_once_with(
@@ -123,71 +171,53 @@ def test_check_method_calls_retry_decorator(
         retriable_exceptions=connector.retriable_exceptions,
     )
 
-    # Verify decorator was applied to _check method
-    mock_decorator.assert_called_once_with(connector._check)
+    # Verify decorator was applied to the inner method
+    mock_decorator.assert_called_once_with(getattr(connector, inner_name))
 
     # Verify decorated function was called
     mock_decorated_function.assert_called_once_with()
 
-    assert result == {"test": "result"}
+    assert result == expected
 
 
-@patch("lubrikit.extract.connectors.base.retry_with_backoff")
-def test_download_method_calls_retry_decorator(
-    mock_retry_with_backoff: Mock, connector: ConcreteConnector
+def test_retry_decorator_built_once(
+    patched_retry: tuple[Mock, Mock, Mock], connector: ConcreteConnector
 ) -> None:
-    """Test that download method creates and uses retry decorator correctly."""
-    mock_decorator = Mock()
-    mock_retry_with_backoff.return_value = mock_decorator
-    mock_decorated_function = Mock()
-    mock_decorator.return_value = mock_decorated_function
-    mock_decorated_function.return_value = ({"test": "headers"}, "response_data")
+    """Test that repeated calls reuse the same retry-wrapped callables."""
+    mock_retry_with_backoff, mock_decorator, _ = patched_retry
 
-    result = connector.download()
+    connector.check()
+    connector.check()
+    connector.download()
+    connector.download()
 
-    # Verify retry decorator was created with correct parameters
-    mock_retry_with_backoff.assert_called_once_with(
-        max_retries=connector.retry_config.max_retries,
-        base_delay=connector.retry_config.base_delay,
-        max_delay=connector.retry_config.max_delay,
-        backoff_factor=connector.retry_config.backoff_factor,
-        retriable_exceptions=connector.retriable_exceptions,
-    )
-
-    # Verify decorator was applied to _download method
-    mock_decorator.assert_called_once_with(connector._download)
+    mock_retry_with_backoff.assert_called_once()
+    assert mock_decorator.call_count == 2
+    assert mock_decorator.return_value.call_count == 4
 
-    # Verify decorated function was called
-    mock_decorated_function.assert_called_once_with()
 
-    assert result == ({"test": "headers"}, "response_data")
-
-
-def test_check_method_direct_call(connector: ConcreteConnector) -> None:
-    """Test check method without mocking retry decorator."""
-    result = connector.check()
-
-    # Should return the result from _check method
-    assert result == {"status": "checked", "timestamp": "2023-01-01T00:00:00Z"}
-
-
-def test_download_method_direct_call(connector: ConcreteConnector) -> None:
-    """Test download method without mocking retry decorator."""
-    result = connector.download()
+@pytest.mark.parametrize(
+    "method_name, expected",
+    [
+        ("check", {"status": "checked", "timestamp": "2023-01-01T00:00:00Z"}),
+        ("download", ({"status": "downloaded", "size": 1024}, "mock_response_data")),
+    ],
+)
+def test_methods_direct_call(
+    default_connector: ConcreteConnector, method_name: str, expected: Any
+) -> None:
+    """Test check and download without mocking the retry decorator."""
+    result = getattr(default_connector, method_name)()
 
-    # Should return the result from _download method
-    assert result == ({"status": "downloaded", "size": 1024}, "mock_response_data")
+    # Should return the result from the inner _check or _download method
+    assert result == expected
 
 
-@patch("lubrikit.extract.connectors.base.retry_with_backoff")
 def test_check_uses_custom_retry_config(
-    mock_retry_with_backoff: Mock, connector_with_retry: ConcreteConnector
+    patched_retry: tuple[Mock, Mock, Mock], connector_with_retry: ConcreteConnector
 ) -> None:
     """Test that check method uses custom retry configuration."""
-    mock_decorator = Mock()
-    mock_retry_with_backoff.return_value = mock_decorator
-    mock_decorated_function = Mock()
-    mock_decorator.return_value = mock_decorated_function
+    mock_retry_with_backoff, _, _ = patched_retry
 
     connector_with_retry.check()
 
@@ -201,15 +231,11 @@ def test_check_uses_custom_retry_config(
     )
 
 
-@patch("lubrikit.extract.connectors.base.retry_with_backoff")
 def test_download_uses_custom_retry_config(
-    mock_retry_with_backoff: Mock, connector_with_retry: ConcreteConnector
+    patched_retry: tuple[Mock, Mock, Mock], connector_with_retry: ConcreteConnector
 ) -> None:
     """Test that download method uses custom retry configuration."""
-    mock_decorator = Mock()
-    mock_retry_with_backoff.return_value = mock_decorator
-    mock_decorated_function = Mock()
-    mock_decorator.return_value = mock_decorated_function
+    mock_retry_with_backoff, _, _ = patched_retry
 
     connector_with_retry.download()
 
@@ -223,85 +249,97 @@ def test_download_uses_custom_retry_config(
     )
 
 
-def test_check_with_retriable_exceptions() -> None:
+def test_check_with_retriable_exceptions(
+    connector_with_exceptions: ConcreteConnector,
+) -> None:
     """Test check method with custom retriable exceptions."""
-    custom_exceptions = (ConnectionError, TimeoutError, ValueError)
-    connector = ConcreteConnector(
-        headers_cache={}, retriable_exceptions=custom_exceptions
-    )
-
     # This should work without raising an exception
-    result = connector.check()
+    result = connector_with_exceptions.check()
     assert result == {"status": "checked", "timestamp": "2023-01-01T00:00:00Z"}
 
 
-def test_download_with_retriable_exceptions() -> None:
+def test_download_with_retriable_exceptions(
+    connector_with_exceptions: ConcreteConnector,
+) -> None:
     """Test download method with custom retriable exceptions."""
-    custom_exceptions = (ConnectionError, TimeoutError, ValueError)
-    connector = ConcreteConnector(
-        headers_cache={}, retriable_exceptions=custom_exceptions
-    )
-
     # This should work without raising an exception
-    result = connector.download()
+    result = connector_with_exceptions.download()
     assert result == ({"status": "downloaded", "size": 1024}, "mock_response_data")
 
 
-@pytest.mark.parametrize(
-    "method_name, feature",
-    [
-        ("check", "max_retries"),
-        ("check", "base_delay"),
-        ("check", "max_delay"),
-        ("check", "backoff_factor"),
-        ("download", "max_retries"),
-        ("download", "base_delay"),
-        ("download", "max_delay"),
-        ("download", "backoff_factor"),
-    ],
-)
-@patch("lubrikit.extract.connectors.base.retry_with_backoff")
+@pytest.mark.parametrize("method_name", ["check", "download"])
 def test_methods_use_same_retry_configuration(
-    mock_retry_with_backoff: Mock,
+    patched_retry: tuple[Mock, Mock, Mock],
     connector: ConcreteConnector,
     method_name: str,
-    feature: str,
 ) -> None:
     """Test that both methods use the same retry configuration."""
-    mock_decorator = Mock()
-    mock_retry_with_backoff.return_value = mock_decorator
-    mock_decorated_function = Mock()
-    mock_decorator.return_value = mock_decorated_function
+    mock_retry_with_backoff, _, _ = patched_retry
 
     method = getattr(connector, method_name)
     method()
 
     # Both methods should use the same retry configuration
-    expected_call = mock_retry_with_backoff.call_args
-    assert expected_call[1][feature] == getattr(connector.retry_config, feature)
+    call_kwargs = mock_retry_with_backoff.call_args.kwargs
+    for feature in ("max_retries", "base_delay", "max_delay", "backoff_factor"):
+        assert call_kwargs[feature] == getattr(connector.retry_config, feature)
 
 
 def test_headers_cache_is_mutable(connector: ConcreteConnector) -> None:
     """Test that headers_cache can be modified after initialization."""
-    original_cache = connector.headers_cache.copy()
+    original_size = len(connector.headers_cache)
     connector.headers_cache["new_key"] = "new_value"
 
-    assert connector.headers_cache != original_cache
+    assert len(connector.headers_cache) == original_size + 1
     assert connector.headers_cache["new_key"] == "new_value"
 
 
+def test_retry_config_defaults(default_connector: ConcreteConnector) -> None:
+    """Test that default retry configuration is properly set."""
+    for feature, expected in RETRY_DEFAULTS:
+        assert getattr(default_connector.retry_config, feature) == expected, feature
+
+
+def test_acheck_method(connector: ConcreteConnector) -> None:
+    """Test acheck returns the result of the retried check."""
+    result = asyncio.run(connector.acheck())
+
+    assert result == {"status": "checked", "timestamp": "2023-01-01T00:00:00Z"}
+
+
+def test_adownload_method(connector: ConcreteConnector) -> None:
+    """Test adownload returns the result of the retried download."""
+    result = asyncio.run(connector.adownload())
+
+    assert result == ({"status": "downloaded", "size": 1024}, "mock_response_data")
+
+
+def test_adownload_concurrent_connectors(headers_cache: dict[str, str]) -> None:
+    """Test that multiple connectors can be downloaded concurrently."""
+    connectors = [ConcreteConnector(headers_cache) for _ in range(3)]
+
+    async def download_all() -> list[Any]:
+        return await asyncio.gather(*(c.adownload() for c in connectors))
+
+    results = asyncio.run(download_all())
+
+    assert (
+        results == [({"status": "downloaded", "size": 1024}, "mock_response_data")] * 3
+    )
+
+
 @pytest.mark.parametrize(
-    "feature, expected",
+    "new_headers, expected",
     [
-        ("timeout", 10.0),
-        ("max_retries", 3),
-        ("base_delay", 1.0),
-        ("max_delay", 60.0),
-        ("backoff_factor", 2.0),
+        ({}, True),
+        ({"etag": "test-etag"}, True),
+        ({"etag": "test-etag", "content_length": "1024"}, True),
+        ({"etag": "new-etag", "content_length": "1024"}, False),
+        ({"file_name": "data.csv"}, False),
     ],
 )
-def test_retry_config_defaults(feature: str, expected: int | float) -> None:
-    """Test that default retry configuration is properly set."""
-    connector = ConcreteConnector()
-
-    assert getattr(connector.retry_config, feature) == expected
+def test_is_unchanged(
+    connector: ConcreteConnector, new_headers: dict[str, str], expected: bool
+) -> None:
+    """Test that only the new header keys are compared with the cache."""
+    assert connector._is_unchanged(new_headers) is expected
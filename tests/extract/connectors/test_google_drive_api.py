@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -5,15 +7,32 @@ import pytest
 from google.auth.exceptions import RefreshError, TransportError
 from googleapiclient.errors import Error as GoogleAPIError
 from googleapiclient.errors import HttpError
+from googleapiclient.http import DEFAULT_HTTP_TIMEOUT_SEC
+from requests import RequestException
 
 from lubrikit.extract import GoogleDriveAPIConnector
 from lubrikit.extract.connectors.configs import (
     GoogleDriveAPIConfig,
+    GoogleDriveAPIFileMetadata,
     GoogleDriveAPIServiceAccountInfo,
 )
+from lubrikit.extract.connectors.google_drive_api import (
+    _build_request,
+    _default_service_account_info,
+    _drive_client,
+    _scoped_credentials,
+)
 from lubrikit.utils.retry import RetryConfig
 
 
+@pytest.fixture(autouse=True)
+def clear_credential_caches() -> None:
+    """Reset the module-level service account caches between tests."""
+    _default_service_account_info.cache_clear()
+    _scoped_credentials.cache_clear()
+    _drive_client.cache_clear()
+
+
 @pytest.fixture
 def headers_cache() -> dict[str, str]:
     """Sample headers cache."""
@@ -92,6 +111,39 @@ def connector_with_retry(
     )
 
 
+@pytest.fixture
+def google_api() -> Iterator[SimpleNamespace]:
+    """Patched Google API entry points of the connector module.
+
+    The patched `service_account` hands out scoped credentials and the
+    patched `build` returns a fresh client mock.
+
+    Yields:
+        SimpleNamespace: The `build`, `service_account` and
+            `media_download` (`MediaIoBaseDownload`) mocks, and the
+            `client` returned by `build`.
+    """
+    module = "lubrikit.extract.connectors.google_drive_api"
+    client = Mock()
+
+    with (
+        patch(f"{module}.build", return_value=client) as mock_build,
+        patch(f"{module}.service_account") as mock_service_account,
+        patch(f"{module}.MediaIoBaseDownload") as mock_media_download,
+    ):
+        credentials = Mock()
+        credentials.with_scopes.return_value = credentials
+        mock_service_account.Credentials.from_service_account_info.return_value = (
+            credentials
+        )
+        yield SimpleNamespace(
+            build=mock_build,
+            service_account=mock_service_account,
+            media_download=mock_media_download,
+            client=client,
+        )
+
+
 @pytest.fixture
 def mock_google_api_client() -> Mock:
     """Mock Google API client resource."""
@@ -115,6 +167,24 @@ def mock_google_api_client() -> Mock:
     return mock_client
 
 
+def _route_files_get(client: Mock, responses: dict[str, dict[str, Any]]) -> None:
+    """Answer `client.files().get(...)` according to the requested fields.
+
+    Args:
+        client (Mock): The Google API client mock.
+        responses (dict[str, dict[str, Any]]): The `execute()` result for
+            each `fields` value. Other fields get a plain mock.
+    """
+
+    def get(**kwargs: Any) -> Mock:
+        fields = kwargs.get("fields", "")
+        if fields not in responses:
+            return Mock()
+        return Mock(**{"execute.return_value": responses[fields]})
+
+    client.files.return_value.get.side_effect = get
+
+
 @patch("lubrikit.extract.connectors.google_drive_api.GoogleDriveAPIServiceAccountInfo")
 def test_initialization_default(
     mock_service_account_info: Mock,
@@ -213,9 +283,14 @@ def test_retriable_exceptions_configuration(connector: GoogleDriveAPIConnector)
         GoogleAPIError,
         ConnectionError,
         TimeoutError,
+        RequestException,
     )
 
     assert connector.retriable_exceptions == expected_exceptions
+    assert "retriable_exceptions" not in vars(connector)
+    assert (
+        connector.retriable_exceptions is GoogleDriveAPIConnector.retriable_exceptions
+    )
 
 
 def test_content_length_property(
@@ -228,26 +303,16 @@ def test_content_length_property(
 
     assert content_length == 1024
     mock_google_api_client.files().get.assert_called_once_with(
-        fileId=connector.config.fileId, fields="size"
+        fileId=connector.config.fileId, fields="name,size,modifiedTime"
     )
 
 
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
 def test_content_length_with_mocked_client(
-    mock_service_account: Mock, mock_build: Mock, connector: GoogleDriveAPIConnector
+    google_api: SimpleNamespace,
+    connector: GoogleDriveAPIConnector,
 ) -> None:
     """Test content_length property with mocked Google API client."""
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
-    )
-    mock_credentials.with_scopes.return_value = mock_credentials
-
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
+    mock_client = google_api.client
     mock_client.files().get().execute.return_value = {"size": "2048"}
 
     content_length = connector.content_length
@@ -265,26 +330,16 @@ def test_file_name_property(
 
     assert file_name == "test_file.csv"
     mock_google_api_client.files().get.assert_called_once_with(
-        fileId=connector.config.fileId, fields="name"
+        fileId=connector.config.fileId, fields="name,size,modifiedTime"
     )
 
 
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
 def test_file_name_with_mocked_client(
-    mock_service_account: Mock, mock_build: Mock, connector: GoogleDriveAPIConnector
+    google_api: SimpleNamespace,
+    connector: GoogleDriveAPIConnector,
 ) -> None:
     """Test file_name property with mocked Google API client."""
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
-    )
-    mock_credentials.with_scopes.return_value = mock_credentials
-
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
+    mock_client = google_api.client
     mock_client.files().get().execute.return_value = {"name": "mocked_file.csv"}
 
     file_name = connector.file_name
@@ -302,26 +357,16 @@ def test_last_modified_at_property(
 
     assert last_modified == "2023-08-12T21:52:29.054Z"
     mock_google_api_client.files().get.assert_called_once_with(
-        fileId=connector.config.fileId, fields="modifiedTime"
+        fileId=connector.config.fileId, fields="name,size,modifiedTime"
     )
 
 
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
 def test_last_modified_at_with_mocked_client(
-    mock_service_account: Mock, mock_build: Mock, connector: GoogleDriveAPIConnector
+    google_api: SimpleNamespace,
+    connector: GoogleDriveAPIConnector,
 ) -> None:
     """Test last_modified_at property with mocked Google API client."""
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
-    )
-    mock_credentials.with_scopes.return_value = mock_credentials
-
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
+    mock_client = google_api.client
     mock_client.files().get().execute.return_value = {
         "modifiedTime": "2023-12-01T10:00:00.000Z"
     }
@@ -332,63 +377,26 @@ def test_last_modified_at_with_mocked_client(
 
 
 @patch("lubrikit.extract.connectors.google_drive_api.logger")
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
 def test_check_success(
-    mock_service_account: Mock,
-    mock_build: Mock,
     mock_logger: Mock,
+    google_api: SimpleNamespace,
     connector: GoogleDriveAPIConnector,
 ) -> None:
     """Test _check method with successful connection."""
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
+    _route_files_get(
+        google_api.client,
+        {
+            # The single metadata call backing file_name, last_modified_at
+            # and content_length
+            "name,size,modifiedTime": {
+                "name": "test_file.csv",
+                "modifiedTime": "2023-08-12T21:52:29.054Z",
+                "size": "1605",
+            },
+            # The supported_mime_types call (for _validate_mime_type)
+            "exportLinks": {"exportLinks": {}},
+        },
     )
-    mock_credentials.with_scopes.return_value = mock_credentials
-
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
-
-    # Set up separate mock objects for different API calls
-    mock_files = Mock()
-    mock_client.files.return_value = mock_files
-
-    # Mock file_name property call
-    mock_name_get = Mock()
-    mock_name_get.execute.return_value = {"name": "test_file.csv"}
-
-    # Mock last_modified_at property call
-    mock_modified_get = Mock()
-    mock_modified_get.execute.return_value = {
-        "modifiedTime": "2023-08-12T21:52:29.054Z"
-    }
-
-    # Mock content_length property call
-    mock_size_get = Mock()
-    mock_size_get.execute.return_value = {"size": "1605"}
-
-    # Mock supported_mime_types property call (for _validate_mime_type)
-    mock_export_get = Mock()
-    mock_export_get.execute.return_value = {"exportLinks": {}}
-
-    # Configure the mock to return different responses based on the fields parameter
-    def mock_get(**kwargs: Any) -> Any:
-        fields = kwargs.get("fields", "")
-        if fields == "name":
-            return mock_name_get
-        elif fields == "modifiedTime":
-            return mock_modified_get
-        elif fields == "size":
-            return mock_size_get
-        elif fields == "exportLinks":
-            return mock_export_get
-        else:
-            return Mock()
-
-    mock_files.get.side_effect = mock_get
 
     result = connector._check()
 
@@ -399,18 +407,15 @@ def test_check_success(
 
 
 @patch("lubrikit.extract.connectors.google_drive_api.logger")
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
 def test_check_failure(
-    mock_service_account: Mock,
-    mock_build: Mock,
     mock_logger: Mock,
+    google_api: SimpleNamespace,
     connector: GoogleDriveAPIConnector,
 ) -> None:
     """Test _check method with connection failure."""
     # Mock service account to raise an exception
-    mock_service_account.Credentials.from_service_account_info.side_effect = Exception(
-        "Connection failed"
+    google_api.service_account.Credentials.from_service_account_info.side_effect = (
+        Exception("Connection failed")
     )
 
     # This should raise an exception since the client property will fail
@@ -424,11 +429,16 @@ def test_prepare_cache(
     """Test _prepare_cache method."""
     connector.client = mock_google_api_client
 
-    # Mock the cached properties
-    with patch.object(connector, "file_name", "test_file.csv"):
-        with patch.object(connector, "last_modified_at", "2023-08-12T21:52:29.054Z"):
-            with patch.object(connector, "content_length", 1024):
-                cache = connector._prepare_cache()
+    # Mock the cached metadata
+    metadata = {
+        "name": "test_file.csv",
+        "modifiedTime": "2023-08-12T21:52:29.054Z",
+        "size": "1024",
+    }
+    with patch.object(
+        connector, "_metadata", GoogleDriveAPIFileMetadata.model_validate(metadata)
+    ):
+        cache = connector._prepare_cache()
 
     expected_cache = {
         "file_name": "test_file.csv",
@@ -444,11 +454,11 @@ def test_prepare_cache_with_none_values(
     """Test _prepare_cache method with None values."""
     connector.client = mock_google_api_client
 
-    # Mock the cached properties with None values
-    with patch.object(connector, "file_name", "test.csv"):
-        with patch.object(connector, "last_modified_at", None):
-            with patch.object(connector, "content_length", None):
-                cache = connector._prepare_cache()
+    # Mock the cached metadata with missing values
+    with patch.object(
+        connector, "_metadata", GoogleDriveAPIFileMetadata(name="test.csv")
+    ):
+        cache = connector._prepare_cache()
 
     expected_cache = {
         "file_name": "test.csv",
@@ -458,43 +468,32 @@ def test_prepare_cache_with_none_values(
     assert cache == expected_cache
 
 
-@patch("lubrikit.extract.connectors.google_drive_api.MediaIoBaseDownload")
-@patch("lubrikit.extract.connectors.google_drive_api.io.FileIO")
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
+def test_prepare_cache_empty_file(connector: GoogleDriveAPIConnector) -> None:
+    """Test that an empty file is cached without a content length."""
+    connector.__dict__["_metadata"] = GoogleDriveAPIFileMetadata(
+        name="empty.csv", size=0
+    )
+
+    assert connector._prepare_cache()["content_length"] == ""
+
+
 def test_download_success_new_content(
-    mock_service_account: Mock,
-    mock_build: Mock,
-    mock_file_io: Mock,
-    mock_media_download: Mock,
+    google_api: SimpleNamespace,
     connector: GoogleDriveAPIConnector,
 ) -> None:
     """Test _download method with successful download of new content."""
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
-    )
-    mock_credentials.with_scopes.return_value = mock_credentials
+    mock_client = google_api.client
 
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
-
-    # Setup file and download mocks
-    mock_file_handle = Mock()
-    mock_file_io.return_value = mock_file_handle
+    # Setup download mock
     mock_downloader = Mock()
-    mock_media_download.return_value = mock_downloader
+    google_api.media_download.return_value = mock_downloader
 
     # Mock different cache values to trigger download
     connector.headers_cache = {"last_modified": "old-date", "content_length": "500"}
 
     # Mock the properties that _prepare_cache calls
     mock_client.files().get().execute.side_effect = [
-        {"name": "test_file.csv"},
-        {"modifiedTime": "new-date"},
-        {"size": "1024"},
+        {"name": "test_file.csv", "modifiedTime": "new-date", "size": "1024"},
     ]
 
     # Mock validation to pass
@@ -506,26 +505,93 @@ def test_download_success_new_content(
     assert (headers or {}).get("last_modified") == "new-date"
     assert (headers or {}).get("content_length") == "1024"
     assert downloader == mock_downloader
+    assert (
+        google_api.media_download.call_args.kwargs["chunksize"]
+        == connector.config.chunk_size
+    )
 
 
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
-def test_download_no_new_version(
-    mock_service_account: Mock,
-    mock_build: Mock,
+@pytest.mark.parametrize(
+    "mime_type, expected_url, expected_params",
+    [
+        (
+            None,
+            "https://www.googleapis.com/drive/v3/files/{fileId}",
+            {"alt": "media"},
+        ),
+        (
+            "text/csv",
+            "https://www.googleapis.com/drive/v3/files/{fileId}/export",
+            {"mimeType": "text/csv"},
+        ),
+    ],
+)
+def test_download_stream(
+    google_drive_config: dict[str, Any],
+    service_account_info: GoogleDriveAPIServiceAccountInfo,
+    mime_type: str | None,
+    expected_url: str,
+    expected_params: dict[str, str],
+) -> None:
+    """Test _download returns a streamed response when streaming is enabled."""
+    connector = GoogleDriveAPIConnector(
+        config={**google_drive_config, "mimeType": mime_type, "stream": True},
+        service_account_info=service_account_info,
+    )
+    mock_session = Mock()
+    connector.__dict__["credentials"] = Mock(universe_domain="googleapis.com")
+    connector.__dict__["session"] = mock_session
+    connector.__dict__["_metadata"] = GoogleDriveAPIFileMetadata(
+        name="test_file.csv", modified_time="new-date", size=1024
+    )
+
+    with patch.object(connector, "_validate_mime_type"):
+        headers, response = connector._download()
+
+    mock_session.get.assert_called_once_with(
+        expected_url.format(fileId=google_drive_config["fileId"]),
+        params=expected_params,
+        stream=True,
+        timeout=connector.retry_config.timeout,
+    )
+    mock_session.get.return_value.raise_for_status.assert_called_once_with()
+    assert response == mock_session.get.return_value
+    assert (headers or {}).get("content_length") == "1024"
+
+
+def test_stream_media_uses_universe_domain(
     connector: GoogleDriveAPIConnector,
 ) -> None:
-    """Test _download method when no new version is available."""
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
+    """Test that the streaming URL is in the universe domain of the credentials."""
+    connector.__dict__["credentials"] = Mock(universe_domain="example-universe.com")
+    mock_session = Mock()
+    connector.__dict__["session"] = mock_session
+
+    connector._stream_media()
+
+    assert mock_session.get.call_args.args[0] == (
+        f"https://www.example-universe.com/drive/v3/files/{connector.config.fileId}"
     )
-    mock_credentials.with_scopes.return_value = mock_credentials
 
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
+
+def test_close_closes_session(connector: GoogleDriveAPIConnector) -> None:
+    """Test that close releases the streaming session once."""
+    mock_session = Mock()
+    connector.__dict__["session"] = mock_session
+
+    connector.close()
+    connector.close()
+
+    mock_session.close.assert_called_once_with()
+    assert "session" not in vars(connector)
+
+
+def test_download_no_new_version(
+    google_api: SimpleNamespace,
+    connector: GoogleDriveAPIConnector,
+) -> None:
+    """Test _download method when no new version is available."""
+    mock_client = google_api.client
 
     # Setup cache with same values as will be returned
     connector.headers_cache = {
@@ -536,9 +602,7 @@ def test_download_no_new_version(
 
     # Mock the properties that _prepare_cache calls to return same values
     mock_client.files().get().execute.side_effect = [
-        {"name": "test_file.csv"},
-        {"modifiedTime": "same-date"},
-        {"size": "1024"},
+        {"name": "test_file.csv", "modifiedTime": "same-date", "size": "1024"},
     ]
 
     with patch("lubrikit.extract.connectors.google_drive_api.logger") as mock_logger:
@@ -567,6 +631,7 @@ def test_download_no_new_version(
         GoogleAPIError,
         ConnectionError,
         TimeoutError,
+        RequestException,
     ],
 )
 def test_retriable_exceptions_are_configured(
@@ -602,6 +667,110 @@ def test_service_account_info_loading_from_env(
     )
 
 
+@patch("lubrikit.extract.connectors.google_drive_api.GoogleDriveAPIServiceAccountInfo")
+def test_default_service_account_info_is_shared(
+    mock_service_account_class: Mock, google_drive_config: dict[str, Any]
+) -> None:
+    """Test that the environment is read once for all default connectors."""
+    first = GoogleDriveAPIConnector(config=google_drive_config)
+    second = GoogleDriveAPIConnector(config=google_drive_config)
+
+    mock_service_account_class.assert_called_once_with()
+    assert first.service_account_info is second.service_account_info
+
+
+def test_credentials_are_shared_per_account(
+    google_api: SimpleNamespace,
+    google_drive_config: dict[str, Any],
+    service_account_info: GoogleDriveAPIServiceAccountInfo,
+) -> None:
+    """Test that connectors for the same account share their credentials."""
+    first = GoogleDriveAPIConnector(
+        config=google_drive_config, service_account_info=service_account_info
+    )
+    second = GoogleDriveAPIConnector(
+        config=google_drive_config,
+        service_account_info=service_account_info.model_copy(),
+    )
+
+    assert first.credentials is second.credentials
+    google_api.service_account.Credentials.from_service_account_info.assert_called_once_with(
+        info=service_account_info.model_dump()
+    )
+
+
+def test_client_is_shared_per_credentials(
+    google_api: SimpleNamespace,
+    google_drive_config: dict[str, Any],
+    service_account_info: GoogleDriveAPIServiceAccountInfo,
+) -> None:
+    """Test that connectors with the same credentials reuse one client."""
+    first = GoogleDriveAPIConnector(
+        config=google_drive_config, service_account_info=service_account_info
+    )
+    second = GoogleDriveAPIConnector(
+        config=google_drive_config, service_account_info=service_account_info
+    )
+
+    assert first.client is second.client
+    google_api.build.assert_called_once_with(
+        "drive",
+        "v3",
+        credentials=first.credentials,
+        requestBuilder=_build_request,
+        static_discovery=True,
+    )
+
+
+def test_check_then_download_connects_once(
+    google_api: SimpleNamespace,
+    connector: GoogleDriveAPIConnector,
+    mock_google_api_client: Mock,
+) -> None:
+    """Test that a check followed by a download reuses the client."""
+    google_api.build.return_value = mock_google_api_client
+    connector.headers_cache = {}
+
+    connector._check()
+    connector._download()
+
+    google_api.service_account.Credentials.from_service_account_info.assert_called_once()
+    google_api.build.assert_called_once()
+    mock_google_api_client.files().get.assert_called_once()
+
+
+@patch("lubrikit.extract.connectors.google_drive_api.HttpRequest")
+@patch("lubrikit.extract.connectors.google_drive_api.AuthorizedHttp")
+def test_build_request_uses_own_transport(
+    mock_authorized_http: Mock, mock_http_request: Mock
+) -> None:
+    """Test that every request is bound to a new authorized transport."""
+    client_http = Mock()
+
+    first = _build_request(client_http, "https://example.com/a", method="GET")
+    second = _build_request(client_http, "https://example.com/b", method="GET")
+
+    assert mock_authorized_http.call_count == 2
+    first_http, second_http = (
+        call.kwargs["http"] for call in mock_authorized_http.call_args_list
+    )
+    assert first_http is not second_http
+    # Each transport keeps the Google API client's default socket timeout
+    assert first_http.timeout == second_http.timeout == DEFAULT_HTTP_TIMEOUT_SEC
+    mock_authorized_http.assert_called_with(client_http.credentials, http=second_http)
+    mock_http_request.assert_called_with(
+        mock_authorized_http.return_value, "https://example.com/b", method="GET"
+    )
+    assert first is second is mock_http_request.return_value
+
+
+def test_content_length_missing_size(connector: GoogleDriveAPIConnector) -> None:
+    """Test content_length for files without a stored size."""
+    connector.__dict__["_metadata"] = GoogleDriveAPIFileMetadata(name="Google Doc")
+
+    assert connector.content_length is None
+
+
 def test_cached_properties_are_cached(
     connector: GoogleDriveAPIConnector, mock_google_api_client: Mock
 ) -> None:
@@ -617,6 +786,24 @@ def test_cached_properties_are_cached(
     assert mock_google_api_client.files().get.call_count == 1
 
 
+def test_metadata_fetched_in_single_request(
+    connector: GoogleDriveAPIConnector, mock_google_api_client: Mock
+) -> None:
+    """Test that file metadata properties share a single API request."""
+    connector.client = mock_google_api_client
+
+    cache = connector._prepare_cache()
+
+    assert cache == {
+        "file_name": "test_file.csv",
+        "last_modified": "2023-08-12T21:52:29.054Z",
+        "content_length": "1024",
+    }
+    mock_google_api_client.files().get.assert_called_once_with(
+        fileId=connector.config.fileId, fields="name,size,modifiedTime"
+    )
+
+
 def test_fileId_from_config(connector: GoogleDriveAPIConnector) -> None:
     """Test that fileId is correctly taken from config."""
     assert connector.config.fileId == "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms"
@@ -647,32 +834,14 @@ def test_headers_cache_initialization(
     assert connector.headers_cache == expected_cache
 
 
-@patch("lubrikit.extract.connectors.google_drive_api.MediaIoBaseDownload")
-@patch("lubrikit.extract.connectors.google_drive_api.io.FileIO")
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
 def test_download_cache_comparison_logic(
-    mock_service_account: Mock,
-    mock_build: Mock,
-    mock_file_io: Mock,
-    mock_media_download: Mock,
+    google_api: SimpleNamespace,
     connector: GoogleDriveAPIConnector,
 ) -> None:
     """Test the specific cache comparison logic in _download method."""
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
-    )
-    mock_credentials.with_scopes.return_value = mock_credentials
-
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
+    mock_client = google_api.client
     mock_downloader = Mock()
-    mock_media_download.return_value = mock_downloader
-    mock_file_handle = Mock()
-    mock_file_io.return_value = mock_file_handle
+    google_api.media_download.return_value = mock_downloader
 
     # Test case 1: Different last_modified should trigger download
     connector.headers_cache = {
@@ -683,9 +852,7 @@ def test_download_cache_comparison_logic(
 
     # Mock the properties that _prepare_cache calls - different last_modified
     mock_client.files().get().execute.side_effect = [
-        {"name": "test.csv"},
-        {"modifiedTime": "new-date"},
-        {"size": "1024"},
+        {"name": "test.csv", "modifiedTime": "new-date", "size": "1024"},
     ]
 
     with patch.object(connector, "_validate_mime_type"):
@@ -706,9 +873,7 @@ def test_download_cache_comparison_logic(
 
     # Mock the properties that _prepare_cache calls - different content_length
     mock_client.files().get().execute.side_effect = [
-        {"name": "test.csv"},
-        {"modifiedTime": "same-date"},
-        {"size": "1024"},
+        {"name": "test.csv", "modifiedTime": "same-date", "size": "1024"},
     ]
 
     with patch.object(connector, "_validate_mime_type"):
@@ -718,24 +883,12 @@ def test_download_cache_comparison_logic(
     assert downloader is not None
 
 
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
 def test_supported_mime_types_property(
-    mock_service_account: Mock,
-    mock_build: Mock,
+    google_api: SimpleNamespace,
     connector: GoogleDriveAPIConnector,
 ) -> None:
     """Test supported_mime_types property returns sorted list of MIME types."""
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
-    )
-    mock_credentials.with_scopes.return_value = mock_credentials
-
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
+    mock_client = google_api.client
 
     # Mock the API response with export links
     mock_client.files().get().execute.return_value = {
@@ -763,24 +916,12 @@ def test_supported_mime_types_property(
     )
 
 
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
 def test_supported_mime_types_empty_export_links(
-    mock_service_account: Mock,
-    mock_build: Mock,
+    google_api: SimpleNamespace,
     connector: GoogleDriveAPIConnector,
 ) -> None:
     """Test supported_mime_types property with empty export links."""
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
-    )
-    mock_credentials.with_scopes.return_value = mock_credentials
-
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
+    mock_client = google_api.client
 
     # Mock the API response with no export links
     mock_client.files().get().execute.return_value = {"exportLinks": {}}
@@ -792,24 +933,12 @@ def test_supported_mime_types_empty_export_links(
     assert supported_types == []
 
 
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
 def test_supported_mime_types_missing_export_links(
-    mock_service_account: Mock,
-    mock_build: Mock,
+    google_api: SimpleNamespace,
     connector: GoogleDriveAPIConnector,
 ) -> None:
     """Test supported_mime_types property when exportLinks key is missing."""
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
-    )
-    mock_credentials.with_scopes.return_value = mock_credentials
-
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
+    mock_client = google_api.client
 
     # Mock the API response without exportLinks key
     mock_client.files().get().execute.return_value = {}
@@ -821,11 +950,8 @@ def test_supported_mime_types_missing_export_links(
     assert supported_types == []
 
 
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
 def test_validate_mime_type_success(
-    mock_service_account: Mock,
-    mock_build: Mock,
+    google_api: SimpleNamespace,
     google_drive_config: dict[str, Any],
     service_account_info: GoogleDriveAPIServiceAccountInfo,
     headers_cache: dict[str, str],
@@ -840,16 +966,7 @@ def test_validate_mime_type_success(
         headers_cache=headers_cache,
     )
 
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
-    )
-    mock_credentials.with_scopes.return_value = mock_credentials
-
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
+    mock_client = google_api.client
 
     # Mock the API response to include the configured MIME type
     mock_client.files().get().execute.return_value = {
@@ -863,11 +980,8 @@ def test_validate_mime_type_success(
     connector._validate_mime_type()
 
 
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
 def test_validate_mime_type_invalid(
-    mock_service_account: Mock,
-    mock_build: Mock,
+    google_api: SimpleNamespace,
     google_drive_config: dict[str, Any],
     service_account_info: GoogleDriveAPIServiceAccountInfo,
     headers_cache: dict[str, str],
@@ -885,16 +999,7 @@ def test_validate_mime_type_invalid(
         headers_cache=headers_cache,
     )
 
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
-    )
-    mock_credentials.with_scopes.return_value = mock_credentials
-
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
+    mock_client = google_api.client
 
     # Mock the API response to NOT include the configured MIME type
     mock_client.files().get().execute.return_value = {
@@ -926,11 +1031,8 @@ def test_validate_mime_type_none(
     connector._validate_mime_type()
 
 
-@patch("lubrikit.extract.connectors.google_drive_api.build")
-@patch("lubrikit.extract.connectors.google_drive_api.service_account")
 def test_validate_mime_type_error_message(
-    mock_service_account: Mock,
-    mock_build: Mock,
+    google_api: SimpleNamespace,
     google_drive_config: dict[str, Any],
     service_account_info: GoogleDriveAPIServiceAccountInfo,
     headers_cache: dict[str, str],
@@ -948,16 +1050,7 @@ def test_validate_mime_type_error_message(
         headers_cache=headers_cache,
     )
 
-    # Mock the service account credentials
-    mock_credentials = Mock()
-    mock_service_account.Credentials.from_service_account_info.return_value = (
-        mock_credentials
-    )
-    mock_credentials.with_scopes.return_value = mock_credentials
-
-    # Mock the Google API client
-    mock_client = Mock()
-    mock_build.return_value = mock_client
+    mock_client = google_api.client
 
     # Mock the API response with specific supported types
     mock_client.files().get().execute.return_value = {
@@ -974,3 +1067,25 @@ def test_validate_mime_type_error_message(
     error_message = str(exc_info.value)
     assert "Unsupported MIME type 'invalid/format'" in error_message
     assert "Supported types: application/pdf, text/csv, text/html" in error_message
+
+
+def test_session_requests_compression(
+    google_api: SimpleNamespace,
+    connector: GoogleDriveAPIConnector,
+) -> None:
+    """Test that the streaming session advertises compressed responses."""
+    assert "gzip" in connector.session.headers["Accept-Encoding"]
+    assert connector.session.headers["User-Agent"] == "lubrikit (gzip)"
+
+
+def test_metadata_refetched_after_reset(
+    connector: GoogleDriveAPIConnector, mock_google_api_client: Mock
+) -> None:
+    """Test that deleting the cached metadata fetches it again."""
+    connector.client = mock_google_api_client
+
+    _ = connector.file_name
+    del connector._metadata
+    _ = connector.file_name
+
+    assert mock_google_api_client.files().get.call_count == 2
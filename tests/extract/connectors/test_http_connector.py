@@ -1,13 +1,60 @@
+from collections.abc import Callable
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, create_autospec, patch
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 
 from lubrikit.extract import HTTPConnector
+from lubrikit.extract.connectors import http_connector
 from lubrikit.extract.connectors.configs import HTTPConfig
+from lubrikit.extract.connectors.http_connector import RETRY_STATUSES
 from lubrikit.utils.retry import RetryConfig
 
+pytestmark = pytest.mark.fast
+
+# Exceptions the HTTP connector is expected to retry on
+RETRIABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.HTTPError,
+    requests.exceptions.RequestException,
+)
+
+
+def _valid(**kwargs: Any) -> HTTPConfig:
+    """Build an HTTPConfig from values known to be valid, skipping validation."""
+    return HTTPConfig.model_construct(**kwargs)
+
+
+@pytest.fixture(scope="module")
+def response_factory() -> Callable[..., Mock]:
+    """Factory of mock responses autospecced from `requests.Response`."""
+
+    def make(**attrs: Any) -> Mock:
+        response: Mock = create_autospec(requests.Response, instance=True)
+        response.configure_mock(**attrs)
+        return response
+
+    return make
+
+
+@pytest.fixture(autouse=True)
+def mock_request(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the requests sent by the pooled session in every test."""
+    mock = Mock()
+    monkeypatch.setattr(requests.Session, "request", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_logger(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the HTTP connector logger."""
+    mock = Mock()
+    monkeypatch.setattr(http_connector, "logger", mock)
+    return mock
+
 
 @pytest.fixture
 def headers_cache() -> dict[str, str]:
@@ -80,56 +127,61 @@ def test_initialization_with_retry_config(
     )
 
     assert connector.headers_cache == headers_cache
-    assert connector.config == HTTPConfig(**http_config)
+    assert connector.config == _valid(**http_config)
     assert connector.retry_config == RetryConfig(**retry_config)
 
 
-def test_prepare_cache_all_headers(connector: HTTPConnector) -> None:
-    """Test _prepare_cache with all supported headers present."""
-    response = Mock(spec=requests.Response)
-    response.headers = {
-        "ETag": "test-etag-value",
-        "Last-Modified": "Thu, 22 Oct 2015 08:30:00 GMT",
-        "Content-Length": "2048",
-        "Content-Type": "application/json",
-    }
-
-    cache = connector._prepare_cache(response)
-
-    assert cache == {
-        "etag": "test-etag-value",
-        "last_modified": "Thu, 22 Oct 2015 08:30:00 GMT",
-        "content_length": "2048",
-    }
-
-
-def test_prepare_cache_partial_headers(connector: HTTPConnector) -> None:
-    """Test _prepare_cache with only some headers present."""
-    response = Mock(spec=requests.Response)
-    response.headers = {
-        "ETag": "partial-etag",
-        "Content-Type": "text/html",
-    }
-
-    cache = connector._prepare_cache(response)
+def test_initialization_with_validated_config(
+    headers_cache: dict[str, str], http_config: dict[str, Any]
+) -> None:
+    """Test that an already validated config is used without revalidation."""
+    config = _valid(**http_config)
 
-    assert cache == {"etag": "partial-etag"}
+    connector = HTTPConnector(headers_cache=headers_cache, config=config)
 
+    assert connector.config is config
 
-def test_prepare_cache_no_headers(connector: HTTPConnector) -> None:
-    """Test _prepare_cache with no cache-related headers."""
-    response = Mock(spec=requests.Response)
-    response.headers = {"Content-Type": "text/plain"}
 
-    cache = connector._prepare_cache(response)
+@pytest.mark.parametrize(
+    "response_headers, expected",
+    [
+        (
+            {
+                "ETag": "test-etag-value",
+                "Last-Modified": "Thu, 22 Oct 2015 08:30:00 GMT",
+                "Content-Length": "2048",
+                "Content-Type": "application/json",
+            },
+            {
+                "etag": "test-etag-value",
+                "last_modified": "Thu, 22 Oct 2015 08:30:00 GMT",
+                "content_length": "2048",
+            },
+        ),
+        (
+            {"ETag": "partial-etag", "Content-Type": "text/html"},
+            {"etag": "partial-etag"},
+        ),
+        ({"Content-Type": "text/plain"}, {}),
+    ],
+)
+def test_prepare_cache(
+    connector: HTTPConnector,
+    response_factory: Callable[..., Mock],
+    response_headers: dict[str, str],
+    expected: dict[str, str],
+) -> None:
+    """Test _prepare_cache keeps only the supported headers present."""
+    response = response_factory(headers=response_headers)
 
-    assert cache == {}
+    assert connector._prepare_cache(response) == expected
 
 
-@patch("lubrikit.extract.connectors.http_connector.requests.request")
-def test_check_success(mock_request: Mock, connector: HTTPConnector) -> None:
+def test_check_success(
+    mock_request: Mock, connector: HTTPConnector, response_factory: Callable[..., Mock]
+) -> None:
     """Test _check method with successful response."""
-    mock_response = Mock(spec=requests.Response)
+    mock_response = response_factory()
     mock_response.ok = True
     mock_response.headers = {"ETag": "check-etag", "Content-Length": "512"}
     mock_request.return_value = mock_response
@@ -143,18 +195,24 @@ def test_check_success(mock_request: Mock, connector: HTTPConnector) -> None:
         params={"limit": 10},
         data=None,
         json=None,
-        headers=connector.headers_cache.update({"User-Agent": "TestBot/1.0"}),
+        headers={
+            "User-Agent": "TestBot/1.0",
+            "If-None-Match": "test-etag",
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        },
         timeout=10.0,
+        stream=False,
     )
 
 
-@patch("lubrikit.extract.connectors.http_connector.requests.request")
-@patch("lubrikit.extract.connectors.http_connector.logger")
 def test_check_failure(
-    mock_logger: Mock, mock_request: Mock, connector: HTTPConnector
+    mock_logger: Mock,
+    mock_request: Mock,
+    connector: HTTPConnector,
+    response_factory: Callable[..., Mock],
 ) -> None:
     """Test _check method with failed response."""
-    mock_response = Mock(spec=requests.Response)
+    mock_response = response_factory()
     mock_response.ok = False
     mock_response.status_code = 404
     mock_response.reason = "Not Found"
@@ -166,12 +224,11 @@ def test_check_failure(
     mock_logger.error.assert_called_once_with("Check failed: 404 Not Found")
 
 
-@patch("lubrikit.extract.connectors.http_connector.requests.request")
 def test_download_success_new_content(
-    mock_request: Mock, connector: HTTPConnector
+    mock_request: Mock, connector: HTTPConnector, response_factory: Callable[..., Mock]
 ) -> None:
     """Test _download method with successful response and new content."""
-    mock_response = Mock(spec=requests.Response)
+    mock_response = response_factory()
     mock_response.ok = True
     mock_response.status_code = 200
     mock_response.reason = "OK"
@@ -191,15 +248,18 @@ def test_download_success_new_content(
     }
     assert headers == expected_headers
     assert response == mock_response
+    assert mock_request.call_args.kwargs["stream"] is True
+    mock_response.close.assert_not_called()
 
 
-@patch("lubrikit.extract.connectors.http_connector.requests.request")
-@patch("lubrikit.extract.connectors.http_connector.logger")
 def test_download_not_modified_304(
-    mock_logger: Mock, mock_request: Mock, connector: HTTPConnector
+    mock_logger: Mock,
+    mock_request: Mock,
+    connector: HTTPConnector,
+    response_factory: Callable[..., Mock],
 ) -> None:
     """Test _download method with 304 Not Modified response."""
-    mock_response = Mock(spec=requests.Response)
+    mock_response = response_factory()
     mock_response.ok = True
     mock_response.status_code = 304
     mock_response.reason = "Not Modified"
@@ -210,14 +270,15 @@ def test_download_not_modified_304(
 
     assert headers == {}
     assert response is None
+    mock_response.close.assert_called_once_with()
     mock_logger.info.assert_called_with(
         "Response: 304 Not Modified. No new version. Skipping download."
     )
 
 
-@patch("lubrikit.extract.connectors.http_connector.requests.request")
-@patch("lubrikit.extract.connectors.http_connector.logger")
-def test_download_unchanged_content(mock_logger: Mock, mock_request: Mock) -> None:
+def test_download_unchanged_content(
+    mock_logger: Mock, mock_request: Mock, response_factory: Callable[..., Mock]
+) -> None:
     """Test _download method when content hasn't changed based on headers."""
     headers_cache = {
         "etag": "same-etag",
@@ -230,7 +291,7 @@ def test_download_unchanged_content(mock_logger: Mock, mock_request: Mock) -> No
     }
     connector = HTTPConnector(headers_cache=headers_cache, config=config)
 
-    mock_response = Mock(spec=requests.Response)
+    mock_response = response_factory()
     mock_response.ok = True
     mock_response.status_code = 200
     mock_response.reason = "OK"
@@ -255,13 +316,14 @@ def test_download_unchanged_content(mock_logger: Mock, mock_request: Mock) -> No
     )
 
 
-@patch("lubrikit.extract.connectors.http_connector.requests.request")
-@patch("lubrikit.extract.connectors.http_connector.logger")
 def test_download_failure(
-    mock_logger: Mock, mock_request: Mock, connector: HTTPConnector
+    mock_logger: Mock,
+    mock_request: Mock,
+    connector: HTTPConnector,
+    response_factory: Callable[..., Mock],
 ) -> None:
     """Test _download method with failed response."""
-    mock_response = Mock(spec=requests.Response)
+    mock_response = response_factory()
     mock_response.ok = False
     mock_response.status_code = 500
     mock_response.reason = "Internal Server Error"
@@ -273,13 +335,15 @@ def test_download_failure(
     # Failed responses should return None for both headers and response
     assert headers is None
     assert response is None
+    mock_response.close.assert_called_once_with()
     mock_logger.error.assert_called_once_with(
         "Request failed: 500 Internal Server Error"
     )
 
 
-@patch("lubrikit.extract.connectors.http_connector.requests.request")
-def test_post_request_with_form_data(mock_request: Mock) -> None:
+def test_post_request_with_form_data(
+    mock_request: Mock, response_factory: Callable[..., Mock]
+) -> None:
     """Test POST request with form data."""
     headers_cache = {"last_modified": "old_date"}  # Different from response
     config = {
@@ -290,7 +354,7 @@ def test_post_request_with_form_data(mock_request: Mock) -> None:
     }
     connector = HTTPConnector(headers_cache=headers_cache, config=config)
 
-    mock_response = Mock(spec=requests.Response)
+    mock_response = response_factory()
     mock_response.ok = True
     mock_response.status_code = 201
     mock_response.reason = "Created"
@@ -305,16 +369,22 @@ def test_post_request_with_form_data(mock_request: Mock) -> None:
         params=None,
         data={"username": "test", "password": "secret"},
         json=None,
-        headers=None,  # dict.update() returns None
+        headers={
+            "Content-Type": "application/x-www-form-urlencoded",
+            "If-Modified-Since": "old_date",
+        },
         timeout=10.0,
+        stream=True,
     )
     assert headers == {"content_length": "100"}
     assert response == mock_response
 
 
-@patch("lubrikit.extract.connectors.http_connector.requests.request")
-def test_post_request_with_json_data(mock_request: Mock) -> None:
-    """Test POST request with JSON data."""
+@patch("lubrikit.extract.connectors.http_connector.orjson", None)
+def test_post_request_with_json_data(
+    mock_request: Mock, response_factory: Callable[..., Mock]
+) -> None:
+    """Test POST request with JSON data when orjson is not installed."""
     headers_cache = {"content_length": "50"}  # Different from response
     config = {
         "method": "POST",
@@ -324,7 +394,7 @@ def test_post_request_with_json_data(mock_request: Mock) -> None:
     }
     connector = HTTPConnector(headers_cache=headers_cache, config=config)
 
-    mock_response = Mock(spec=requests.Response)
+    mock_response = response_factory()
     mock_response.ok = True
     mock_response.status_code = 201
     mock_response.reason = "Created"
@@ -339,31 +409,90 @@ def test_post_request_with_json_data(mock_request: Mock) -> None:
         params=None,
         data=None,
         json={"name": "John Doe", "email": "john@example.com"},
-        headers=None,  # dict.update() returns None
+        headers={"Content-Type": "application/json"},
         timeout=10.0,
+        stream=True,
     )
     assert headers == {"content_length": "120"}
     assert response == mock_response
 
 
-def test_retry_exceptions_configuration(connector: HTTPConnector) -> None:
-    """Test that retriable exceptions are properly configured."""
-    expected_exceptions = (
-        requests.exceptions.ConnectionError,
-        requests.exceptions.Timeout,
-        requests.exceptions.HTTPError,
-        requests.exceptions.RequestException,
+def test_post_request_with_json_data_orjson(mock_request: Mock) -> None:
+    """Test POST request with JSON data serialized by orjson."""
+    orjson = pytest.importorskip("orjson")
+    json_data = {"name": "John Doe", "email": "john@example.com"}
+    config = {"method": "POST", "url": "https://api.example.com/users"}
+    connector = HTTPConnector(
+        headers_cache={}, config={**config, "json_data": json_data}
+    )
+
+    connector._request()
+
+    mock_request.assert_called_once_with(
+        method="POST",
+        url="https://api.example.com/users",
+        params=None,
+        data=orjson.dumps(json_data),
+        json=None,
+        headers={"Content-Type": "application/json"},
+        timeout=10.0,
+        stream=False,
+    )
+
+
+def test_post_request_with_json_data_keeps_content_type(mock_request: Mock) -> None:
+    """Test that a Content-Type set by the caller is kept for JSON data."""
+    pytest.importorskip("orjson")
+    connector = HTTPConnector(
+        headers_cache={},
+        config={
+            "method": "POST",
+            "url": "https://api.example.com/users",
+            "json_data": {"name": "John Doe"},
+            "extra_headers": {"content-type": "application/vnd.api+json"},
+        },
+    )
+
+    connector._request()
+
+    headers = mock_request.call_args.kwargs["headers"]
+    assert headers == {"Content-Type": "application/vnd.api+json"}
+    assert list(headers) == ["content-type"]
+
+
+def test_post_request_with_data_and_json_data(mock_request: Mock) -> None:
+    """Test that form data wins over JSON data, as in requests."""
+    connector = HTTPConnector(
+        headers_cache={},
+        config={
+            "method": "POST",
+            "url": "https://api.example.com/users",
+            "data": {"name": "John Doe"},
+            "json_data": {"name": "Jane Doe"},
+        },
     )
 
-    assert connector.retriable_exceptions == expected_exceptions
+    connector._request()
+
+    kwargs = mock_request.call_args.kwargs
+    assert kwargs["data"] == {"name": "John Doe"}
+    assert kwargs["headers"] == {}
+
+
+def test_retry_exceptions_configuration(connector: HTTPConnector) -> None:
+    """Test that retriable exceptions are properly configured."""
+    assert connector.retriable_exceptions == RETRIABLE_EXCEPTIONS
+    assert "retriable_exceptions" not in vars(connector)
+    assert connector.retriable_exceptions is HTTPConnector.retriable_exceptions
 
 
-@patch("lubrikit.extract.connectors.http_connector.requests.request")
 def test_custom_retry_config_used(
-    mock_request: Mock, connector_with_retry: HTTPConnector
+    mock_request: Mock,
+    connector_with_retry: HTTPConnector,
+    response_factory: Callable[..., Mock],
 ) -> None:
     """Test that custom retry configuration is used in requests."""
-    mock_response = Mock(spec=requests.Response)
+    mock_response = response_factory()
     mock_response.ok = True
     mock_response.headers = {}
     mock_request.return_value = mock_response
@@ -375,9 +504,10 @@ def test_custom_retry_config_used(
     assert call_kwargs["timeout"] == 5.0
 
 
-@patch("lubrikit.extract.connectors.http_connector.requests.request")
-def test_headers_update_with_extra_headers(mock_request: Mock) -> None:
-    """Test that extra headers are properly merged with headers cache."""
+def test_headers_update_with_extra_headers(
+    mock_request: Mock, response_factory: Callable[..., Mock]
+) -> None:
+    """Test that extra headers are sent without modifying the headers cache."""
     headers_cache = {"Authorization": "Bearer token123"}
     config = {
         "method": "GET",
@@ -386,7 +516,7 @@ def test_headers_update_with_extra_headers(mock_request: Mock) -> None:
     }
     connector = HTTPConnector(headers_cache=headers_cache, config=config)
 
-    mock_response = Mock(spec=requests.Response)
+    mock_response = response_factory()
     mock_response.ok = True
     mock_response.headers = {}
     mock_request.return_value = mock_response
@@ -394,18 +524,11 @@ def test_headers_update_with_extra_headers(mock_request: Mock) -> None:
     connector._check()
 
     mock_request.assert_called_once()
-    call_kwargs = mock_request.call_args.kwargs
-    headers_param = call_kwargs["headers"]
-    # The update method returns None, so headers_param will be None
-    assert headers_param is None
-    # but the side effect should have updated the headers_cache
-    expected_headers = {
-        "Authorization": "Bearer token123",
+    assert mock_request.call_args.kwargs["headers"] == {
         "User-Agent": "TestBot/2.0",
         "Accept": "application/json",
     }
-    # Check that the headers_cache was updated
-    assert connector.headers_cache == expected_headers
+    assert connector.headers_cache == {"Authorization": "Bearer token123"}
 
 
 def test_empty_headers_cache_initialization() -> None:
@@ -415,7 +538,7 @@ def test_empty_headers_cache_initialization() -> None:
     connector = HTTPConnector(headers_cache=headers_cache, config=config)
 
     assert connector.headers_cache == {}
-    assert connector.config == HTTPConfig(**config)
+    assert connector.config == _valid(**config)
 
 
 def test_no_extra_headers_config() -> None:
@@ -427,34 +550,157 @@ def test_no_extra_headers_config() -> None:
     assert connector.config.extra_headers is None
 
 
-@pytest.mark.parametrize(
-    "method,expected_method",
-    [
-        ("GET", "GET"),
-        ("POST", "POST"),
-    ],
-)
-def test_http_methods(
-    method: str, expected_method: str, headers_cache: dict[str, str]
-) -> None:
+def test_http_methods(headers_cache: dict[str, str]) -> None:
     """Test that different HTTP methods are properly handled."""
-    config = {"method": method, "url": "https://example.com"}
-    connector = HTTPConnector(headers_cache=headers_cache, config=config)
+    for method in ("GET", "POST"):
+        config = {"method": method, "url": "https://example.com"}
+        connector = HTTPConnector(headers_cache=headers_cache, config=config)
 
-    assert connector.config.method == expected_method
+        assert connector.config.method == method
 
 
-@pytest.mark.parametrize(
-    "url",
-    [
+def test_various_urls(headers_cache: dict[str, str]) -> None:
+    """Test that various URL formats are properly handled."""
+    for url in (
         "https://api.example.com/v1/data",
         "http://localhost:8000/test",
         "https://secure.api.com/endpoint?param=value",
-    ],
+    ):
+        config = {"method": "GET", "url": url}
+        connector = HTTPConnector(headers_cache=headers_cache, config=config)
+
+        assert connector.config.url == url
+
+
+def test_session_is_shared(connector: HTTPConnector) -> None:
+    """Test that HTTP connectors share one pooled session."""
+    other = HTTPConnector(headers_cache={}, config=connector.config.model_dump())
+
+    assert connector.session is other.session
+    assert connector.session.headers["Connection"] == "keep-alive"
+
+
+@pytest.mark.parametrize("prefix", ["http://", "https://"])
+def test_session_adapter_configuration(connector: HTTPConnector, prefix: str) -> None:
+    """Test that the session mounts a pooled adapter retrying statuses."""
+    adapter = connector.session.get_adapter(f"{prefix}api.example.com")
+
+    assert isinstance(adapter, HTTPAdapter)
+    retry = adapter.max_retries
+    assert retry.total == connector.retry_config.max_retries
+    assert retry.connect == retry.read == 0
+    assert retry.status_forcelist == RETRY_STATUSES
+    assert retry.backoff_factor == connector.retry_config.base_delay
+    assert retry.respect_retry_after_header is True
+    assert retry.raise_on_status is False
+    assert adapter._pool_maxsize == 128  # type: ignore[attr-defined]
+    assert adapter._pool_block is True  # type: ignore[attr-defined]
+
+
+def test_session_per_retry_config(
+    connector: HTTPConnector, connector_with_retry: HTTPConnector
+) -> None:
+    """Test that connectors with other retry settings use another session."""
+    other = HTTPConnector(headers_cache={}, config=connector_with_retry.config)
+
+    assert connector.session is not connector_with_retry.session
+    assert other.session is not connector_with_retry.session
+    assert other.session is connector.session
+
+
+def test_close_sessions(connector: HTTPConnector) -> None:
+    """Test that close_sessions closes the shared sessions and forgets them."""
+    session = connector.session
+
+    with patch.object(session, "close") as mock_close:
+        HTTPConnector.close_sessions()
+
+    mock_close.assert_called_once_with()
+    assert connector.session is not session
+
+
+def test_evicted_session_is_left_open(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an evicted session is dropped but not closed under its users."""
+    monkeypatch.setattr(http_connector, "MAX_SESSIONS", 1)
+    HTTPConnector.close_sessions()
+    first = http_connector._default_session(1, 0.0, 0.0)
+
+    with patch.object(first, "close") as mock_close:
+        second = http_connector._default_session(2, 0.0, 0.0)
+
+    mock_close.assert_not_called()
+    assert http_connector._default_session(2, 0.0, 0.0) is second
+    assert http_connector._default_session(1, 0.0, 0.0) is not first
+    HTTPConnector.close_sessions()
+
+
+@pytest.mark.parametrize(
+    "retry_after, expected", [("120", 30.0), ("5", 5.0), (None, None)]
 )
-def test_various_urls(url: str, headers_cache: dict[str, str]) -> None:
-    """Test that various URL formats are properly handled."""
-    config = {"method": "GET", "url": url}
-    connector = HTTPConnector(headers_cache=headers_cache, config=config)
+def test_retry_after_is_capped(
+    connector_with_retry: HTTPConnector, retry_after: str | None, expected: Any
+) -> None:
+    """Test that a Retry-After wait is capped at the maximum delay."""
+    adapter = connector_with_retry.session.get_adapter("https://api.example.com")
+    assert isinstance(adapter, HTTPAdapter)
+    headers = {} if retry_after is None else {"Retry-After": retry_after}
+
+    retry_wait = adapter.max_retries.get_retry_after(Mock(headers=headers))
+
+    assert retry_wait == expected
+
+
+def test_download_not_modified(
+    mock_request: Mock, connector: HTTPConnector, response_factory: Callable[..., Mock]
+) -> None:
+    """Test that a 304 answer to the conditional request skips the download."""
+    mock_response = response_factory()
+    mock_response.ok = True
+    mock_response.status_code = 304
+    mock_response.reason = "Not Modified"
+    mock_response.headers = {"ETag": "test-etag"}
+    mock_request.return_value = mock_response
+
+    headers, response = connector._download()
+
+    assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == "test-etag"
+    assert headers == {"etag": "test-etag"}
+    assert response is None
+
+
+def test_request_headers_without_cache(http_config: dict[str, Any]) -> None:
+    """Test that no conditional headers are sent without cached values."""
+    connector = HTTPConnector(headers_cache={}, config=http_config)
+
+    assert connector._request_headers() == {"User-Agent": "TestBot/1.0"}
+
+
+def test_session_requests_compression(connector: HTTPConnector) -> None:
+    """Test that the session advertises compressed responses."""
+    assert "gzip" in connector.session.headers["Accept-Encoding"]
+    assert connector.session.headers["User-Agent"] == "lubrikit (gzip)"
+
+
+def test_request_does_not_mutate_headers_cache(
+    mock_request: Mock,
+    connector: HTTPConnector,
+    headers_cache: dict[str, str],
+    response_factory: Callable[..., Mock],
+) -> None:
+    """Test that extra headers are merged into a new dict on every request."""
+    mock_response = response_factory()
+    mock_response.ok = True
+    mock_response.status_code = 304
+    mock_response.reason = "Not Modified"
+    mock_response.headers = {}
+    mock_request.return_value = mock_response
+    cached = dict(headers_cache)
+
+    connector._check()
+    connector._download()
 
-    assert connector.config.url == url
+    assert connector.headers_cache == cached
+    first, second = (c.kwargs["headers"] for c in mock_request.call_args_list)
+    assert first == second
+    assert first is not second
+    assert first["User-Agent"] == "TestBot/1.0"
@@ -1,13 +1,24 @@
+import asyncio
+import gzip
+import io
 import os
+import tempfile
+import threading
+from collections.abc import Iterator
 from datetime import datetime
+from typing import IO, Any
 from unittest.mock import MagicMock, Mock, patch
 
+import fsspec  # type: ignore[import-untyped]
 import pytest
+from fsspec.spec import AbstractBufferedFile  # type: ignore[import-untyped]
 from googleapiclient.http import MediaIoBaseDownload
 from requests import Response
+from requests.exceptions import ChunkedEncodingError
+from urllib3 import HTTPResponse
 
 from lubrikit.base.storage import FileMode, Layer
-from lubrikit.extract.storage.client import ExtractStorageClient
+from lubrikit.extract.storage.client import ExtractStorageClient, _BackgroundWriter
 from lubrikit.extract.storage.file_metadata import FileMetadata
 
 
@@ -54,7 +65,7 @@ def metadata_with_source_and_prefix() -> FileMetadata:
 @pytest.fixture
 def mock_s3_filesystem():  # type: ignore[no-untyped-def]
     """Mock S3FileSystem for testing."""
-    with patch("lubrikit.base.storage.client.s3fs.S3FileSystem") as mock_s3fs:
+    with patch("s3fs.S3FileSystem") as mock_s3fs:
         mock_s3 = MagicMock()
         mock_s3.exists.return_value = False
         mock_s3fs.return_value = mock_s3
@@ -86,6 +97,21 @@ def test_get_folder_with_env_var(sample_metadata: FileMetadata) -> None:
     assert client.get_folder() == expected_folder
 
 
+def test_get_folder_resolved_once(
+    sample_metadata: FileMetadata, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test get_folder reads the environment once per client."""
+    monkeypatch.setenv("AWS_LANDING_BUCKET", "first-bucket")
+    client = ExtractStorageClient(sample_metadata)
+    assert client.get_folder() == f"{client.base_path}first-bucket"
+
+    monkeypatch.setenv("AWS_LANDING_BUCKET", "second-bucket")
+    assert client.get_folder() == f"{client.base_path}first-bucket"
+    assert ExtractStorageClient(sample_metadata).get_folder() == (
+        f"{client.base_path}second-bucket"
+    )
+
+
 def test_get_folder_default(sample_metadata: FileMetadata) -> None:
     """Test get_folder with default Layer.LANDING.bucket value."""
     with patch.dict(os.environ, {}, clear=True):
@@ -168,7 +194,7 @@ def test_write_unsupported_object(sample_metadata: FileMetadata) -> None:
         client.write({"dict": "data"})
 
 
-@patch("builtins.open")
+@patch.object(ExtractStorageClient, "_open")
 @patch("lubrikit.extract.storage.client.logger")
 def test_write_response_success(
     mock_logger: Mock,
@@ -203,6 +229,7 @@ def test_write_response_success(
         response.iter_content.assert_called_once_with(
             chunk_size=ExtractStorageClient.chunk_size
         )
+        response.close.assert_called_once_with()
 
         # Verify file operations
         mock_make_dirs.assert_called_once_with(path="s3://landing")
@@ -222,6 +249,30 @@ def test_write_response_success(
         )
 
 
+@patch.object(ExtractStorageClient, "_open")
+def test_write_response_already_read(
+    mock_open: Mock, sample_metadata: FileMetadata
+) -> None:
+    """Test that a response read into memory is written from its content."""
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Length"] = "4"
+    response.raw = io.BytesIO(b"data")
+    assert response.content == b"data"
+
+    client = ExtractStorageClient(sample_metadata)
+    mock_file = mock_open.return_value.__enter__.return_value
+
+    with (
+        patch.object(client, "get_path", return_value="test_path"),
+        patch.object(client, "get_folder", return_value="test_folder"),
+        patch.object(client, "_make_dirs"),
+    ):
+        client.write(response)
+
+    mock_file.write.assert_called_once_with(b"data")
+
+
 def test_write_response_http_error(sample_metadata: FileMetadata) -> None:
     """Test write method with Response object that has HTTP error."""
     # Create a mock Response object that raises an HTTP error
@@ -237,7 +288,7 @@ def test_write_response_http_error(sample_metadata: FileMetadata) -> None:
     response.raise_for_status.assert_called_once()
 
 
-@patch("builtins.open")
+@patch.object(ExtractStorageClient, "_open")
 @patch("lubrikit.extract.storage.client.logger")
 def test_write_response_with_metadata_paths(
     mock_logger: Mock,
@@ -287,7 +338,7 @@ def test_write_response_chunk_size(sample_metadata: FileMetadata) -> None:
         patch.object(client, "get_path", return_value="test_path"),
         patch.object(client, "get_folder", return_value="test_folder"),
         patch.object(client, "_make_dirs"),
-        patch("builtins.open"),
+        patch.object(client, "_open"),
     ):
         client.write(response)
 
@@ -296,6 +347,49 @@ def test_write_response_chunk_size(sample_metadata: FileMetadata) -> None:
         )
 
 
+def test_write_resolves_output_path_once(sample_metadata: FileMetadata) -> None:
+    """Test repeated writes reuse the resolved path and created folder."""
+    client = ExtractStorageClient(sample_metadata)
+
+    with (
+        patch.object(client, "get_path", return_value="test_path") as mock_get_path,
+        patch.object(client, "get_folder", return_value="test_folder"),
+        patch.object(client, "_make_dirs") as mock_make_dirs,
+        patch.object(client, "_open") as mock_open,
+    ):
+        for _ in range(2):
+            response = Mock(spec=Response)
+            response.headers = {"Content-Length": "0"}
+            response.raise_for_status.return_value = None
+            response.iter_content.return_value = []
+            client.write(response)
+
+    mock_get_path.assert_called_once_with(sample_metadata)
+    mock_make_dirs.assert_called_once_with(path="test_folder")
+    assert mock_open.call_count == 2
+
+
+def test_write_response_chunk_size_override(sample_metadata: FileMetadata) -> None:
+    """Test write method honours a chunk size set on the client."""
+    response = Mock(spec=Response)
+    response.headers = {"Content-Length": "1024"}
+    response.raise_for_status.return_value = None
+    response.iter_content.return_value = []
+
+    client = ExtractStorageClient(sample_metadata)
+    client.chunk_size = 1024
+
+    with (
+        patch.object(client, "get_path", return_value="test_path"),
+        patch.object(client, "get_folder", return_value="test_folder"),
+        patch.object(client, "_make_dirs"),
+        patch.object(client, "_open"),
+    ):
+        client.write(response)
+
+        response.iter_content.assert_called_once_with(chunk_size=1024)
+
+
 @pytest.mark.parametrize(
     "attr_name", ["base_path", "s3", "_make_dirs", "chunk_size", "encoding"]
 )
@@ -313,7 +407,7 @@ def test_inheritance_from_storage_client(
 @pytest.mark.parametrize(
     "attr_name, expected",
     [
-        ("chunk_size", 1024),
+        ("chunk_size", 32 * 1024 * 1024),
         ("encoding", "utf-8"),
         ("base_path", "s3://"),
     ],
@@ -326,7 +420,7 @@ def test_class_attributes(
     assert getattr(client, attr_name) == expected
 
 
-@patch("builtins.open")
+@patch.object(ExtractStorageClient, "_open")
 def test_write_response_empty_content(
     mock_open: Mock,
     sample_metadata: FileMetadata,
@@ -336,7 +430,7 @@ def test_write_response_empty_content(
     response = Mock(spec=Response)
     response.headers = {"Content-Length": "0"}
     response.raise_for_status.return_value = None
-    response.iter_content.return_value = []  # No chunks
+    response.iter_content.return_value = []
 
     client = ExtractStorageClient(sample_metadata)
 
@@ -355,8 +449,8 @@ def test_write_response_empty_content(
         mock_file.write.assert_not_called()
 
 
-def test_singledispatchmethod_registration(sample_metadata: FileMetadata) -> None:
-    """Test that the write method handles different types via singledispatchmethod."""
+def test_write_dispatch_registration(sample_metadata: FileMetadata) -> None:
+    """Test that the write method dispatches on the type of the data."""
     client = ExtractStorageClient(sample_metadata)
 
     # Test that unsupported types raise NotImplementedError
@@ -378,13 +472,13 @@ def test_singledispatchmethod_registration(sample_metadata: FileMetadata) -> Non
         patch.object(client, "get_path", return_value="test_path"),
         patch.object(client, "get_folder", return_value="test_folder"),
         patch.object(client, "_make_dirs"),
-        patch("builtins.open"),
+        patch.object(client, "_open"),
     ):
         # This should not raise NotImplementedError
         client.write(response)
 
 
-@patch("builtins.open")
+@patch.object(ExtractStorageClient, "_open")
 def test_write_media_io_base_download_success(
     mock_open: Mock,
     sample_metadata: FileMetadata,
@@ -394,7 +488,7 @@ def test_write_media_io_base_download_success(
     # Create mock file data
     file_content = b"Google Drive file content data"
     mock_file_handle = Mock()
-    mock_file_handle.read.return_value = file_content
+    mock_file_handle.read.side_effect = [file_content, b""]
     mock_file_handle.seek.return_value = None
 
     # Create a mock MediaIoBaseDownload object
@@ -427,7 +521,10 @@ def test_write_media_io_base_download_success(
 
         # Verify file handle operations
         mock_file_handle.seek.assert_called_once_with(0)  # Reset to beginning
-        mock_file_handle.read.assert_called_once()
+        mock_file_handle.read.assert_called_with(ExtractStorageClient.chunk_size)
+        mock_file.write.assert_called_once_with(file_content)
+        # The caller's descriptor keeps receiving the downloaded chunks
+        assert downloader._fd is mock_file_handle
 
         # Verify file operations
         mock_make_dirs.assert_called_once_with(path="s3://landing")
@@ -439,7 +536,7 @@ def test_write_media_io_base_download_success(
         mock_file.write.assert_called_once_with(file_content)
 
 
-@patch("builtins.open")
+@patch.object(ExtractStorageClient, "_open")
 def test_write_media_io_base_download_single_chunk(
     mock_open: Mock,
     sample_metadata: FileMetadata,
@@ -448,7 +545,7 @@ def test_write_media_io_base_download_single_chunk(
     """Test write method with MediaIoBaseDownload that completes in one chunk."""
     file_content = b"Small file"
     mock_file_handle = Mock()
-    mock_file_handle.read.return_value = file_content
+    mock_file_handle.read.side_effect = [file_content, b""]
     mock_file_handle.seek.return_value = None
 
     downloader = Mock(spec=MediaIoBaseDownload)
@@ -474,7 +571,7 @@ def test_write_media_io_base_download_single_chunk(
         mock_file.write.assert_called_once_with(file_content)
 
 
-@patch("builtins.open")
+@patch.object(ExtractStorageClient, "_open")
 def test_write_media_io_base_download_empty_file(
     mock_open: Mock,
     sample_metadata: FileMetadata,
@@ -482,7 +579,7 @@ def test_write_media_io_base_download_empty_file(
 ) -> None:
     """Test write method with MediaIoBaseDownload containing empty file."""
     mock_file_handle = Mock()
-    mock_file_handle.read.return_value = b""  # Empty file
+    mock_file_handle.read.side_effect = [b""]  # Empty file
     mock_file_handle.seek.return_value = None
 
     downloader = Mock(spec=MediaIoBaseDownload)
@@ -501,11 +598,12 @@ def test_write_media_io_base_download_empty_file(
 
         client.write(downloader)
 
-        # Should still write (empty content)
-        mock_file.write.assert_called_once_with(b"")
+        # Should still create the (empty) file
+        mock_open.assert_called_once()
+        mock_file.write.assert_not_called()
 
 
-@patch("builtins.open")
+@patch.object(ExtractStorageClient, "_open")
 def test_write_media_io_base_download_with_metadata_paths(
     mock_open: Mock,
     metadata_with_source_and_prefix: FileMetadata,
@@ -514,7 +612,7 @@ def test_write_media_io_base_download_with_metadata_paths(
     """Test write method uses correct paths from metadata with MediaIoBaseDownload."""
     file_content = b"Google Sheets data"
     mock_file_handle = Mock()
-    mock_file_handle.read.return_value = file_content
+    mock_file_handle.read.side_effect = [file_content, b""]
     mock_file_handle.seek.return_value = None
 
     downloader = Mock(spec=MediaIoBaseDownload)
@@ -547,7 +645,7 @@ def test_write_media_io_base_download_file_handle_operations(
     """Test that MediaIoBaseDownload file handle is properly manipulated."""
     file_content = b"Test file content for handle operations"
     mock_file_handle = Mock()
-    mock_file_handle.read.return_value = file_content
+    mock_file_handle.read.side_effect = [file_content, b""]
     mock_file_handle.seek.return_value = None
 
     downloader = Mock(spec=MediaIoBaseDownload)
@@ -560,7 +658,7 @@ def test_write_media_io_base_download_file_handle_operations(
         patch.object(client, "get_path", return_value="test_path"),
         patch.object(client, "get_folder", return_value="test_folder"),
         patch.object(client, "_make_dirs"),
-        patch("builtins.open") as mock_open,
+        patch.object(client, "_open") as mock_open,
     ):
         mock_file = Mock()
         mock_open.return_value.__enter__.return_value = mock_file
@@ -570,12 +668,45 @@ def test_write_media_io_base_download_file_handle_operations(
         # Verify file handle was reset to beginning
         mock_file_handle.seek.assert_called_once_with(0)
 
-        # Verify full content was read and written
-        mock_file_handle.read.assert_called_once()
+        # Verify buffered content was copied in chunks and written
+        mock_file_handle.read.assert_called_with(ExtractStorageClient.chunk_size)
         mock_file.write.assert_called_once_with(file_content)
 
 
-def test_singledispatchmethod_supports_both_types(
+def test_write_media_download_keeps_caller_file_descriptor(
+    sample_metadata: FileMetadata,
+) -> None:
+    """Test that a file descriptor other than BytesIO receives every chunk."""
+    chunks = [b"first ", b"second ", b"third"]
+
+    with tempfile.TemporaryFile() as fd:
+        downloader = Mock(spec=MediaIoBaseDownload)
+        downloader._fd = fd
+
+        def next_chunk() -> tuple[None, bool]:
+            downloader._fd.write(chunks.pop(0))
+            return None, not chunks
+
+        downloader.next_chunk.side_effect = next_chunk
+        destination = io.BytesIO()
+        client = ExtractStorageClient(sample_metadata)
+
+        with (
+            patch.object(client, "get_path", return_value="test_path"),
+            patch.object(client, "get_folder", return_value="test_folder"),
+            patch.object(client, "_make_dirs"),
+            patch.object(client, "_open") as mock_open,
+        ):
+            mock_open.return_value.__enter__.return_value = destination
+            client.write(downloader)
+
+        assert downloader._fd is fd
+        fd.seek(0)
+        assert fd.read() == b"first second third"
+        assert destination.getvalue() == b"first second third"
+
+
+def test_write_dispatch_supports_both_types(
     sample_metadata: FileMetadata,
 ) -> None:
     """Test that write method supports both Response and MediaIoBaseDownload."""
@@ -591,14 +722,14 @@ def test_singledispatchmethod_supports_both_types(
         patch.object(client, "get_path", return_value="test_path"),
         patch.object(client, "get_folder", return_value="test_folder"),
         patch.object(client, "_make_dirs"),
-        patch("builtins.open"),
+        patch.object(client, "_open"),
     ):
         # Should not raise NotImplementedError
         client.write(response)
 
     # Test with MediaIoBaseDownload
     mock_file_handle = Mock()
-    mock_file_handle.read.return_value = b"test"
+    mock_file_handle.read.side_effect = [b"test", b""]
     mock_file_handle.seek.return_value = None
     downloader = Mock(spec=MediaIoBaseDownload)
     downloader._fd = mock_file_handle
@@ -608,7 +739,360 @@ def test_singledispatchmethod_supports_both_types(
         patch.object(client, "get_path", return_value="test_path"),
         patch.object(client, "get_folder", return_value="test_folder"),
         patch.object(client, "_make_dirs"),
-        patch("builtins.open"),
+        patch.object(client, "_open"),
     ):
         # Should not raise NotImplementedError
         client.write(downloader)
+
+
+@patch.object(ExtractStorageClient, "_open")
+def test_write_media_download_streams_to_destination(
+    mock_open: Mock, sample_metadata: FileMetadata
+) -> None:
+    """Test that chunks of an in-memory download go straight to storage."""
+    file_handle = io.BytesIO(b"buffered ")
+    file_handle.seek(0, io.SEEK_END)
+    downloader = Mock(spec=MediaIoBaseDownload)
+    downloader._fd = file_handle
+
+    def next_chunk() -> tuple[None, bool]:
+        downloader._fd.write(b"chunk")
+        return None, downloader.next_chunk.call_count == 2
+
+    downloader.next_chunk.side_effect = next_chunk
+
+    client = ExtractStorageClient(sample_metadata)
+    written: list[bytes] = []
+    mock_file = Mock()
+    mock_file.write.side_effect = lambda data: written.append(bytes(data))
+    mock_open.return_value.__enter__.return_value = mock_file
+
+    with (
+        patch.object(client, "get_path", return_value="test_path"),
+        patch.object(client, "get_folder", return_value="test_folder"),
+        patch.object(client, "_make_dirs"),
+    ):
+        client.write(downloader)
+
+    assert written == [b"buffered ", b"chunk", b"chunk"]
+    # The caller's buffer is drained rather than replaced
+    assert downloader._fd is file_handle
+    assert file_handle.getvalue() == b""
+
+
+class _UploadFile(AbstractBufferedFile):  # type: ignore[no-any-unimported]
+    """Buffered file storing its parts in `store` once closed, like S3."""
+
+    buffer: io.BytesIO | None
+
+    def __init__(self, store: dict[str, bytes], path: str) -> None:
+        super().__init__(
+            fsspec.filesystem("memory"),
+            path,
+            mode="wb",
+            block_size=4,
+            cache_type="none",
+        )
+        self.store = store
+        self.parts: list[bytes] = []
+
+    def _initiate_upload(self) -> None:
+        pass
+
+    def _upload_chunk(self, final: bool = False) -> bool:
+        assert self.buffer is not None
+        self.parts.append(self.buffer.getvalue())
+        if final:
+            self.store[self.path] = b"".join(self.parts)
+        return True
+
+    def discard(self) -> None:
+        self.parts = []
+        self.buffer = None
+
+
+@pytest.mark.parametrize("buffered", [True, False])
+def test_write_media_download_failure_leaves_no_file(
+    sample_metadata: FileMetadata, buffered: bool
+) -> None:
+    """Test that a download failing after one chunk writes nothing."""
+    store: dict[str, bytes] = {}
+    fd: IO[bytes] = io.BytesIO() if buffered else tempfile.TemporaryFile()
+    downloader = Mock(spec=MediaIoBaseDownload)
+    downloader._fd = fd
+
+    def next_chunk() -> tuple[None, bool]:
+        if downloader.next_chunk.call_count > 1:
+            raise ConnectionError("connection dropped")
+        fd.write(b"first chunk")
+        return None, False
+
+    downloader.next_chunk.side_effect = next_chunk
+    client = ExtractStorageClient(sample_metadata)
+
+    with (
+        fd,
+        patch.object(client, "get_path", return_value="landing/file"),
+        patch.object(client, "get_folder", return_value="landing"),
+        patch.object(client, "_make_dirs"),
+        patch.object(
+            client, "_open", side_effect=lambda path, mode: _UploadFile(store, path)
+        ),
+        pytest.raises(ConnectionError),
+    ):
+        client.write(downloader)
+
+    assert "landing/file" not in store
+
+
+@patch.object(ExtractStorageClient, "_open")
+def test_write_httpx_response(
+    mock_open: Mock, sample_metadata: FileMetadata, mock_s3_filesystem: Mock
+) -> None:
+    """Test write method with an httpx Response object."""
+    httpx = pytest.importorskip("httpx")
+    request = httpx.Request("GET", "https://example.com/data.json")
+    response = httpx.Response(200, content=b"chunk1chunk2", request=request)
+
+    client = ExtractStorageClient(sample_metadata)
+
+    with (
+        patch.object(client, "get_path", return_value="s3://landing/test.json"),
+        patch.object(client, "get_folder", return_value="s3://landing"),
+        patch.object(client, "_make_dirs") as mock_make_dirs,
+    ):
+        mock_file = Mock()
+        mock_open.return_value.__enter__.return_value = mock_file
+
+        client.write(response)
+
+    mock_make_dirs.assert_called_once_with(path="s3://landing")
+    mock_open.assert_called_once_with("s3://landing/test.json", FileMode.WRITING_BINARY)
+    mock_file.write.assert_called_once_with(b"chunk1chunk2")
+
+
+def test_background_writer_writes_in_worker_thread() -> None:
+    """Test that chunks are written in order by a single worker thread."""
+    file = Mock()
+    threads: set[int] = set()
+    written: list[bytes] = []
+
+    def write(data: bytes) -> int:
+        threads.add(threading.get_ident())
+        written.append(data)
+        return len(data)
+
+    file.write.side_effect = write
+
+    with _BackgroundWriter(file) as sink:
+        assert sink.write(b"first") == 5
+        sink.write(b"second")
+
+    assert written == [b"first", b"second"]
+    assert threads and threading.get_ident() not in threads
+
+
+def test_background_writer_raises_write_errors() -> None:
+    """Test that a failed write is raised to the downloading thread."""
+    file = Mock()
+    file.write.side_effect = OSError("disk full")
+
+    sink = _BackgroundWriter(file)
+    sink.write(b"chunk")
+
+    with pytest.raises(OSError, match="disk full"):
+        sink.close()
+
+
+@patch.object(ExtractStorageClient, "_open")
+def test_write_response_decodes_compressed_stream(
+    mock_open: Mock, sample_metadata: FileMetadata
+) -> None:
+    """Test that a gzip-encoded streamed body is decoded while copied."""
+    body = gzip.compress(b"decoded data")
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Length"] = str(len(body))
+    response.raw = HTTPResponse(
+        body=io.BytesIO(body),
+        headers={"Content-Encoding": "gzip"},
+        preload_content=False,
+    )
+
+    client = ExtractStorageClient(sample_metadata)
+    written: list[bytes] = []
+    mock_file = mock_open.return_value.__enter__.return_value
+    mock_file.write.side_effect = lambda data: written.append(bytes(data))
+
+    with (
+        patch.object(client, "get_path", return_value="test_path"),
+        patch.object(client, "get_folder", return_value="test_folder"),
+        patch.object(client, "_make_dirs"),
+    ):
+        client.write(response)
+
+    assert b"".join(written) == b"decoded data"
+
+
+def test_write_many(sample_metadata: FileMetadata) -> None:
+    """Test write_many writes each download with its client at the same time."""
+    writes = [(ExtractStorageClient(sample_metadata), object()) for _ in range(3)]
+    barrier = threading.Barrier(3, timeout=5)
+
+    with patch.object(
+        ExtractStorageClient,
+        "write",
+        autospec=True,
+        side_effect=lambda *_: barrier.wait(),
+    ) as mock_write:
+        ExtractStorageClient.write_many(writes, max_concurrency=3)
+
+    assert mock_write.call_count == 3
+    for client, downloader in writes:
+        mock_write.assert_any_call(client, downloader)
+
+
+def test_write_many_propagates_errors(sample_metadata: FileMetadata) -> None:
+    """Test write_many raises write errors after all writes finished."""
+    client = ExtractStorageClient(sample_metadata)
+
+    with patch.object(
+        ExtractStorageClient, "write", side_effect=[ValueError("boom"), None]
+    ) as mock_write:
+        with pytest.raises(ValueError, match="boom"):
+            ExtractStorageClient.write_many(
+                [(client, object()), (client, object())], max_concurrency=1
+            )
+
+    assert mock_write.call_count == 2
+
+
+def test_awrite(sample_metadata: FileMetadata) -> None:
+    """Test awrite writes the data in a worker thread."""
+    client = ExtractStorageClient(sample_metadata)
+    data = object()
+
+    with patch.object(ExtractStorageClient, "write") as mock_write:
+        asyncio.run(client.awrite(data))
+
+    mock_write.assert_called_once_with(data)
+
+
+def test_awrite_many(sample_metadata: FileMetadata) -> None:
+    """Test awrite_many overlaps writes up to the concurrency bound."""
+    writes = [(ExtractStorageClient(sample_metadata), object()) for _ in range(4)]
+    lock = threading.Lock()
+    running: list[int] = [0]
+    peak: list[int] = [0]
+    barrier = threading.Barrier(2, timeout=5)
+
+    def write(*_: Any) -> None:
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        barrier.wait()
+        with lock:
+            running[0] -= 1
+
+    with patch.object(
+        ExtractStorageClient, "write", autospec=True, side_effect=write
+    ) as mock_write:
+        asyncio.run(ExtractStorageClient.awrite_many(writes, max_concurrency=2))
+
+    assert mock_write.call_count == 4
+    assert peak[0] == 2
+
+
+def test_awrite_many_propagates_errors(sample_metadata: FileMetadata) -> None:
+    """Test awrite_many raises write errors after all writes finished."""
+    client = ExtractStorageClient(sample_metadata)
+
+    with patch.object(
+        ExtractStorageClient, "write", side_effect=[ValueError("boom"), None]
+    ) as mock_write:
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(
+                ExtractStorageClient.awrite_many(
+                    [(client, object()), (client, object())], max_concurrency=1
+                )
+            )
+
+    assert mock_write.call_count == 2
+
+
+@patch("lubrikit.extract.storage.client.logger")
+def test_write_response_without_content_length(
+    mock_logger: Mock, sample_metadata: FileMetadata
+) -> None:
+    """Test write method with a chunked response lacking Content-Length."""
+    response = Mock(spec=Response)
+    response.headers = {}
+    response.raise_for_status.return_value = None
+    response.iter_content.return_value = [b"chunked"]
+
+    client = ExtractStorageClient(sample_metadata)
+
+    with (
+        patch.object(client, "get_path", return_value="test_path"),
+        patch.object(client, "get_folder", return_value="test_folder"),
+        patch.object(client, "_make_dirs"),
+        patch.object(client, "_open"),
+    ):
+        client.write(response)
+
+    mock_logger.info.assert_called_once_with(
+        "Writing an unknown number of bytes to test_path"
+    )
+
+
+@patch("lubrikit.extract.storage.client.logger")
+def test_write_response_skips_disabled_log(
+    mock_logger: Mock, sample_metadata: FileMetadata
+) -> None:
+    """Test write method does not format the log line when INFO is off."""
+    mock_logger.isEnabledFor.return_value = False
+    response = Mock(spec=Response)
+    response.headers = Mock()
+    response.raise_for_status.return_value = None
+    response.iter_content.return_value = []
+
+    client = ExtractStorageClient(sample_metadata)
+
+    with (
+        patch.object(client, "get_path", return_value="test_path"),
+        patch.object(client, "get_folder", return_value="test_folder"),
+        patch.object(client, "_make_dirs"),
+        patch.object(client, "_open"),
+    ):
+        client.write(response)
+
+    response.headers.get.assert_not_called()
+    mock_logger.info.assert_not_called()
+
+
+def test_write_response_failure_leaves_no_file(sample_metadata: FileMetadata) -> None:
+    """Test that a body failing after one chunk writes nothing."""
+
+    def iter_content(chunk_size: int) -> Iterator[bytes]:
+        yield b"first chunk"
+        raise ChunkedEncodingError("connection dropped")
+
+    store: dict[str, bytes] = {}
+    response = Mock(spec=Response)
+    response.headers = {"Content-Length": "1024"}
+    response.iter_content.side_effect = iter_content
+    client = ExtractStorageClient(sample_metadata)
+
+    with (
+        patch.object(client, "get_path", return_value="landing/file"),
+        patch.object(client, "get_folder", return_value="landing"),
+        patch.object(client, "_make_dirs"),
+        patch.object(
+            client, "_open", side_effect=lambda path, mode: _UploadFile(store, path)
+        ),
+        pytest.raises(ChunkedEncodingError),
+    ):
+        client.write(response)
+
+    assert "landing/file" not in store
+    response.close.assert_called_once_with()
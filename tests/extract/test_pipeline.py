@@ -1,11 +1,14 @@
+import asyncio
+import threading
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from googleapiclient.http import MediaIoBaseDownload
 from requests import Response
 
 from lubrikit.extract.connectors import GoogleDriveAPIConnector, HTTPConnector
+from lubrikit.extract.connectors.configs import HTTPConfig
 from lubrikit.extract.pipeline import ExtractPipeline
 from lubrikit.extract.storage import ExtractStorageClient
 
@@ -81,6 +84,24 @@ def test_client_cached_property(http_metadata: dict[str, Any]) -> None:
     assert client1 is client2
 
 
+def test_connector_config_validated_once(http_metadata: dict[str, Any]) -> None:
+    """Test that the connector configuration is validated once per pipeline."""
+    pipeline = ExtractPipeline(http_metadata)
+
+    with patch.object(
+        HTTPConfig, "model_validate", wraps=HTTPConfig.model_validate
+    ) as mock_validate:
+        first = pipeline._init_connector()
+        second = pipeline._init_connector()
+
+    assert isinstance(pipeline.connector_config, HTTPConfig)
+    assert first.config is second.config is pipeline.connector_config  # type: ignore[attr-defined]
+    mock_validate.assert_any_call(http_metadata["connector_config"])
+    assert [c.args[0] for c in mock_validate.call_args_list].count(
+        http_metadata["connector_config"]
+    ) == 1
+
+
 def test_connector_property_http(http_metadata: dict[str, Any]) -> None:
     """Test connector property returns HTTPConnector class."""
     pipeline = ExtractPipeline(http_metadata)
@@ -143,12 +164,14 @@ def test_run_with_http_connector_success(
     mock_connector_instance.download.return_value = (mock_headers, mock_response)
     mock_http_connector.return_value = mock_connector_instance
 
+    headers_cache = pipeline.metadata.get("headers_cache")
+
     pipeline.run()
 
     # Verify connector was instantiated with correct parameters
     mock_http_connector.assert_called_once_with(
-        config=pipeline.metadata.get("connector_config"),
-        headers_cache=pipeline.metadata.get("headers_cache"),
+        config=pipeline.connector_config,
+        headers_cache=headers_cache,
         retry_config=pipeline.metadata.get("retry_config"),
     )
 
@@ -158,6 +181,9 @@ def test_run_with_http_connector_success(
     # Verify write was called with the response
     mock_write.assert_called_once_with(mock_response)
 
+    # Verify the headers of the written version were cached
+    assert pipeline.metadata["headers_cache"] == mock_headers
+
 
 @patch.object(ExtractStorageClient, "write")
 @patch("lubrikit.extract.connectors.GoogleDriveAPIConnector")
@@ -175,12 +201,14 @@ def test_run_with_gdrive_connector_success(
     mock_connector_instance.download.return_value = (mock_headers, mock_downloader)
     mock_gdrive_connector.return_value = mock_connector_instance
 
+    headers_cache = pipeline.metadata.get("headers_cache")
+
     pipeline.run()
 
     # Verify connector was instantiated with correct parameters
     mock_gdrive_connector.assert_called_once_with(
-        config=pipeline.metadata.get("connector_config"),
-        headers_cache=pipeline.metadata.get("headers_cache"),
+        config=pipeline.connector_config,
+        headers_cache=headers_cache,
         retry_config=pipeline.metadata.get("retry_config"),
     )
 
@@ -190,6 +218,9 @@ def test_run_with_gdrive_connector_success(
     # Verify write was called with the downloader
     mock_write.assert_called_once_with(mock_downloader)
 
+    # Verify the headers of the written version were cached
+    assert pipeline.metadata["headers_cache"] == mock_headers
+
 
 @patch.object(ExtractStorageClient, "write")
 @patch("lubrikit.extract.connectors.HTTPConnector")
@@ -252,7 +283,7 @@ def test_run_connector_instantiation_parameters(
 
     # Verify the exact parameters passed to connector
     mock_http_connector.assert_called_once_with(
-        config=pipeline.metadata.get("connector_config"),
+        config=pipeline.connector_config,
         headers_cache=pipeline.metadata.get("headers_cache"),
         retry_config=pipeline.metadata.get("retry_config"),
     )
@@ -318,3 +349,104 @@ def test_metadata_conversion_types() -> None:
     assert pipeline.metadata["connector"] == "HTTPConnector"
     assert isinstance(pipeline.metadata["connector_config"], dict)
     assert isinstance(pipeline.metadata["headers_cache"], dict)
+
+
+@patch.object(ExtractStorageClient, "write")
+@patch("lubrikit.extract.connectors.HTTPConnector")
+def test_arun_with_http_connector_success(
+    mock_http_connector: Mock, mock_write: Mock, http_metadata: dict[str, Any]
+) -> None:
+    """Test arun method downloads and writes without blocking the loop."""
+    pipeline = ExtractPipeline(http_metadata)
+
+    mock_response = Mock(spec=Response)
+    mock_headers = {"etag": "abc123"}
+    mock_connector_instance = Mock()
+    mock_connector_instance.adownload = AsyncMock(
+        return_value=(mock_headers, mock_response)
+    )
+    mock_http_connector.return_value = mock_connector_instance
+
+    headers_cache = pipeline.metadata.get("headers_cache")
+
+    asyncio.run(pipeline.arun())
+
+    mock_http_connector.assert_called_once_with(
+        config=pipeline.connector_config,
+        headers_cache=headers_cache,
+        retry_config=pipeline.metadata.get("retry_config"),
+    )
+    mock_connector_instance.adownload.assert_awaited_once()
+    mock_write.assert_called_once_with(mock_response)
+
+    # Verify the headers of the written version were cached
+    assert pipeline.metadata["headers_cache"] == mock_headers
+
+
+@patch.object(ExtractStorageClient, "write")
+@patch("lubrikit.extract.connectors.HTTPConnector")
+def test_arun_with_no_data_to_download(
+    mock_http_connector: Mock, mock_write: Mock, http_metadata: dict[str, Any]
+) -> None:
+    """Test arun method skips the write when there is no new data."""
+    pipeline = ExtractPipeline(http_metadata)
+
+    mock_connector_instance = Mock()
+    mock_connector_instance.adownload = AsyncMock(return_value=({}, None))
+    mock_http_connector.return_value = mock_connector_instance
+
+    asyncio.run(pipeline.arun())
+
+    mock_write.assert_not_called()
+
+
+@patch.object(ExtractPipeline, "run", autospec=True)
+def test_run_many(
+    mock_run: Mock, http_metadata: dict[str, Any], gdrive_metadata: dict[str, Any]
+) -> None:
+    """Test run_many runs one pipeline per metadata entry."""
+    ExtractPipeline.run_many([http_metadata, gdrive_metadata], max_concurrency=2)
+
+    assert mock_run.call_count == 2
+    run_metadata = [call.args[0].metadata for call in mock_run.call_args_list]
+    assert http_metadata in run_metadata
+    assert gdrive_metadata in run_metadata
+
+
+@patch.object(ExtractPipeline, "run", autospec=True)
+def test_run_many_overlaps_pipelines(
+    mock_run: Mock, http_metadata: dict[str, Any]
+) -> None:
+    """Test run_many runs pipelines at the same time."""
+    barrier = threading.Barrier(3, timeout=5)
+    mock_run.side_effect = lambda pipeline: barrier.wait()
+
+    ExtractPipeline.run_many([http_metadata] * 3, max_concurrency=3)
+
+    assert mock_run.call_count == 3
+
+
+@patch.object(ExtractPipeline, "run", autospec=True)
+def test_run_many_propagates_errors(
+    mock_run: Mock, http_metadata: dict[str, Any]
+) -> None:
+    """Test run_many raises pipeline errors after all pipelines finished."""
+    mock_run.side_effect = [ValueError("boom"), None]
+
+    with pytest.raises(ValueError, match="boom"):
+        ExtractPipeline.run_many([http_metadata, http_metadata], max_concurrency=1)
+
+    assert mock_run.call_count == 2
+
+
+@patch("lubrikit.extract.pipeline.connectors")
+def test_connector_property_cached(
+    mock_connectors: Mock, http_metadata: dict[str, Any]
+) -> None:
+    """Test that the connector class is resolved once per pipeline."""
+    pipeline = ExtractPipeline(http_metadata)
+
+    first = pipeline.connector
+    mock_connectors.HTTPConnector = None
+
+    assert pipeline.connector is first
@@ -1,7 +1,7 @@
 import pytest
 from pydantic import ValidationError
 
-from lubrikit.utils.retry import RetryConfig
+from lubrikit.utils.retry import RetryConfig, get_retry_config
 
 
 @pytest.mark.parametrize(
@@ -171,3 +171,34 @@ def test_unknown_field_error() -> None:
     errors = exc_info.value.errors()
     assert len(errors) == 1
     assert "unknown_field" in str(errors[0])
+
+
+def test_frozen() -> None:
+    """Test that RetryConfig instances cannot be modified."""
+    config = RetryConfig()
+
+    with pytest.raises(ValidationError):
+        config.max_retries = 5  # type: ignore[misc]
+
+
+def test_get_retry_config_shares_instances() -> None:
+    """Test that equal configuration values share one instance."""
+    config = get_retry_config({"max_retries": 5, "base_delay": 2.0})
+
+    assert config == RetryConfig(max_retries=5, base_delay=2.0)
+    assert get_retry_config({"base_delay": 2.0, "max_retries": 5}) is config
+    assert get_retry_config(None) is get_retry_config({})
+    assert get_retry_config() == RetryConfig()
+
+
+def test_get_retry_config_validated_instance() -> None:
+    """Test that a validated configuration is returned unchanged."""
+    config = RetryConfig(max_retries=5)
+
+    assert get_retry_config(config) is config
+
+
+def test_get_retry_config_invalid() -> None:
+    """Test that invalid configuration values are rejected."""
+    with pytest.raises(ValidationError):
+        get_retry_config({"max_retries": 0})
@@ -1,6 +1,7 @@
+import asyncio
 import logging
 import time
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -95,27 +96,27 @@ def test_jitter_adds_randomness() -> None:
     """Test that jitter adds random variation to delays."""
     mock_func = Mock(side_effect=[ValueError("fail"), ValueError("fail")])
 
-    with patch("time.sleep") as mock_sleep, patch("random.uniform") as mock_uniform:
-        mock_uniform.return_value = 0.05  # 5% jitter
+    with patch("time.sleep") as mock_sleep, patch("random.random") as mock_random:
+        mock_random.return_value = 0.25
 
         decorated_func = retry_with_backoff(
-            max_retries=1, base_delay=1.0, backoff_factor=1.0, jitter=True
+            max_retries=1, base_delay=2.0, backoff_factor=1.0, jitter=True
         )(mock_func)
 
         with pytest.raises(ValueError):
             decorated_func()
 
-    # Should call random.uniform with (0, delay * 0.1)
-    mock_uniform.assert_called_once_with(0, 0.1)  # 1.0 * 0.1 = 0.1
-    # Sleep should be called with base_delay + jitter = 1.0 + 0.05 = 1.05
-    mock_sleep.assert_called_once_with(1.05)
+    # Should draw one random fraction of the backoff delay
+    mock_random.assert_called_once_with()
+    # Sleep should be called with base_delay * fraction = 2.0 * 0.25 = 0.5
+    mock_sleep.assert_called_once_with(0.5)
 
 
 def test_no_jitter() -> None:
     """Test that jitter can be disabled."""
     mock_func = Mock(side_effect=[ValueError("fail"), ValueError("fail")])
 
-    with patch("time.sleep") as mock_sleep, patch("random.uniform") as mock_uniform:
+    with patch("time.sleep") as mock_sleep, patch("random.random") as mock_random:
         decorated_func = retry_with_backoff(
             max_retries=1, base_delay=2.0, jitter=False
         )(mock_func)
@@ -123,8 +124,8 @@ def test_no_jitter() -> None:
         with pytest.raises(ValueError):
             decorated_func()
 
-    # random.uniform should not be called when jitter is False
-    mock_uniform.assert_not_called()
+    # random.random should not be called when jitter is False
+    mock_random.assert_not_called()
     # Sleep should be called with exact base_delay
     mock_sleep.assert_called_once_with(2.0)
 
@@ -463,3 +464,45 @@ def test_very_small_delays() -> None:
 
     assert result == "success"
     mock_sleep.assert_called_once_with(0.001)
+
+
+def test_async_successful_execution_after_retries() -> None:
+    """Test that coroutine functions are retried without blocking."""
+    mock_func = AsyncMock(side_effect=[ValueError("fail"), "success"])
+
+    with patch("asyncio.sleep") as mock_sleep, patch("time.sleep") as mock_time_sleep:
+        decorated_func = retry_with_backoff(max_retries=2, jitter=False)(mock_func)
+        result = asyncio.run(decorated_func("arg1"))
+
+    assert result == "success"
+    assert mock_func.await_count == 2
+    mock_sleep.assert_awaited_once_with(1.0)
+    mock_time_sleep.assert_not_called()
+
+
+def test_async_max_retries_exceeded() -> None:
+    """Test that coroutine functions raise after max retries exceeded."""
+    mock_func = AsyncMock(side_effect=ValueError("persistent error"))
+
+    with patch("asyncio.sleep"):
+        decorated_func = retry_with_backoff(max_retries=2)(mock_func)
+
+        with pytest.raises(ValueError, match="persistent error"):
+            asyncio.run(decorated_func())
+
+    assert mock_func.await_count == 3
+
+
+def test_reraises_with_original_traceback() -> None:
+    """Test that the final error is re-raised without retry frames."""
+    mock_func = Mock(side_effect=ValueError("fail"))
+
+    with patch("time.sleep"):
+        decorated_func = retry_with_backoff(max_retries=1, jitter=False)(mock_func)
+
+        with pytest.raises(ValueError) as exc_info:
+            decorated_func()
+
+    frames = [entry.name for entry in exc_info.traceback]
+    assert "next_delay" not in frames
+    assert exc_info.value.__context__ is None